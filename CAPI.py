@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, List, Dict, Callable
+from typing import Any, List, Dict, Callable, Iterable
 
 
 class Parser(ABC):
@@ -18,6 +18,33 @@ class Parser(ABC):
         """
         pass
 
+    def add_vacs(self, vacancies: Iterable[Dict[str, Any]]) -> None:
+        """
+        Добавляет пачку вакансий.
+        Реализация по умолчанию добавляет их по одной через add_vac,
+        источники с пакетной записью в хранилище должны её переопределять.
+
+        Args:
+            vacancies (Iterable[Dict[str, Any]]): Данные вакансий для добавления
+        """
+        for vacancy in vacancies:
+            self.add_vac(vacancy)
+
+    @abstractmethod
+    def search(self, keyword: str, pages: int = 1) -> List[Dict[str, Any]]:
+        """
+        Абстрактный метод для поиска вакансий в источнике без записи в хранилище
+        (используется FederatedSearcher).
+
+        Args:
+            keyword (str): Ключевое слово для поиска
+            pages (int): Количество страниц выдачи
+
+        Returns:
+            List[Dict[str, Any]]: Найденные вакансии
+        """
+        pass
+
     @abstractmethod
     def get_vac(self, criteria: Callable[[Dict[str, Any]], bool]) -> List[Dict[str, Any]]:
         """
@@ -43,3 +70,57 @@ class Parser(ABC):
             bool: Результат операции удаления
         """
         pass
+
+
+class AsyncParser(ABC):
+    """
+    Асинхронный аналог Parser для работы внутри asyncio-приложений.
+    Все операции с вакансиями, включая запись в хранилище, являются корутинами.
+    """
+
+    @abstractmethod
+    async def add_vac(self, vacancy: Dict[str, Any]) -> None:
+        """
+        Абстрактный метод для добавления вакансии.
+
+        Args:
+            vacancy (Dict[str, Any]): Данные вакансии для добавления
+        """
+        pass
+
+    async def add_vacs(self, vacancies: Iterable[Dict[str, Any]]) -> None:
+        """
+        Добавляет пачку вакансий.
+        Реализация по умолчанию добавляет их по одной через add_vac.
+
+        Args:
+            vacancies (Iterable[Dict[str, Any]]): Данные вакансий для добавления
+        """
+        for vacancy in vacancies:
+            await self.add_vac(vacancy)
+
+    @abstractmethod
+    async def get_vac(self, criteria: Callable[[Dict[str, Any]], bool]) -> List[Dict[str, Any]]:
+        """
+        Абстрактный метод для получения вакансий по критериям.
+
+        Args:
+            criteria (Callable[[Dict[str, Any]], bool]): Функция-критерий для фильтрации
+
+        Returns:
+            List[Dict[str, Any]]: Список отфильтрованных вакансий
+        """
+        pass
+
+    @abstractmethod
+    async def del_vac(self, vacancy_id: str) -> bool:
+        """
+        Абстрактный метод для удаления вакансии.
+
+        Args:
+            vacancy_id (str): ID вакансии для удаления
+
+        Returns:
+            bool: Результат операции удаления
+        """
+        pass
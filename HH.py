@@ -1,6 +1,22 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Optional, Union, Tuple, Set
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import html
+import re
+import time
 import requests
+from requests.adapters import HTTPAdapter
 from CAPI import Parser
+from hh_cache import ResponseCache
+from detail_cache import DetailCache
+from cassette import Cassette
+from bloom_filter import BloomFilter
+from checkpoint import HarvestCheckpoint
+from pipeline import HarvestPipeline
+from partition import PartitionedHarvester
+from sync_state import SyncCursor
+from vacancy_filter import IdIn
+from rate_limiter import TokenBucket, RetryPolicy, RETRY_STATUSES, parse_retry_after, shared_limiter
 
 
 class HH(Parser):
@@ -9,17 +25,49 @@ class HH(Parser):
     Наследуется от абстрактного класса Parser.
     """
 
-    def __init__(self, file_worker: Any):
+    def __init__(self, file_worker: Any, concurrency: int = 4, cache: Optional[ResponseCache] = None,
+                 rate_limiter: Optional[TokenBucket] = None, retry: Optional[RetryPolicy] = None,
+                 timeout: Union[float, Tuple[float, float]] = (3.05, 15),
+                 checkpoint_dir: Optional[str] = None, sync_dir: str = ".hh_sync",
+                 detail_cache: Optional[DetailCache] = None, cassette: Optional[Cassette] = None,
+                 seen_filter: Optional[BloomFilter] = None):
         """
         Инициализация класса HH.
 
         Args:
             file_worker: Объект для работы с файлами
+            concurrency (int): Сколько страниц загружать параллельно
+            cache (Optional[ResponseCache]): Дисковый кэш ответов API (по умолчанию не используется)
+            rate_limiter (Optional[TokenBucket]): Ограничитель частоты запросов
+                (по умолчанию общий для всех экземпляров HH в процессе)
+            retry (Optional[RetryPolicy]): Политика повторов при 429/5xx и сетевых ошибках
+            timeout: Таймаут запроса в секундах (или пара: подключение, чтение)
+            checkpoint_dir (Optional[str]): Каталог контрольных точек загрузок
+                (None - контрольные точки не ведутся)
+            sync_dir (str): Каталог курсоров инкрементальной синхронизации (см. sync)
+            detail_cache (Optional[DetailCache]): Кэш полных описаний вакансий (см. enrich)
+            cassette (Optional[Cassette]): Кассета для записи ответов API или их воспроизведения
+                без сети (в режиме воспроизведения ограничитель частоты не используется)
+            seen_filter (Optional[BloomFilter]): Фильтр Блума ID сохранённых вакансий для load_vacancies
+                (пустой фильтр заполняется из хранилища при первой загрузке)
         """
         self.url = 'https://api.hh.ru/vacancies'
         self.headers = {'User-Agent': 'HH-User-Agent'}
         self.params = {'text': '', 'page': 0, 'per_page': 100}
         self.file_worker = file_worker
+        self.concurrency = max(1, concurrency)
+        self.session = self._make_session(self.concurrency)
+        self.cassette = cassette
+        if cassette is not None:
+            self.session = cassette.wrap(self.session)
+        self.cache = cache
+        self.rate_limiter = rate_limiter if rate_limiter is not None else shared_limiter()
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.timeout = timeout
+        self.checkpoint_dir = checkpoint_dir
+        self.sync_dir = sync_dir
+        self.detail_cache = detail_cache
+        self.seen_filter = seen_filter
 
     def add_vac(self, vacancy: Dict[str, Any]) -> None:
         """
@@ -28,14 +76,25 @@ class HH(Parser):
         Args:
             vacancy (Dict[str, Any]): Данные вакансии
         """
-        processed_vacancy = {
-            "id": vacancy.get("id", ""),
-            "name": vacancy.get("name", ""),
-            "url": vacancy.get("alternate_url", ""),
-            "salary": self._parse_salary(vacancy.get("salary", {})),
-            "description": vacancy.get("snippet", {}).get("requirement", "")
-        }
-        self.file_worker.add_vacancy(processed_vacancy)
+        self.file_worker.add_vacancy(self._normalize(vacancy))
+
+    def add_vacs(self, vacancies: Iterable[Dict[str, Any]]) -> None:
+        """
+        Добавляет пачку вакансий в хранилище одной записью.
+
+        Args:
+            vacancies (Iterable[Dict[str, Any]]): Данные вакансий
+        """
+        processed = [self._normalize(vacancy) for vacancy in vacancies]
+        if not processed:
+            return
+        add_vacancies = getattr(self.file_worker, "add_vacancies", None)
+        if add_vacancies is not None:
+            add_vacancies(processed)
+        else:
+            # Хранилище без пакетной записи
+            for vacancy in processed:
+                self.file_worker.add_vacancy(vacancy)
 
     def get_vac(self, criteria: Any) -> List[Dict[str, Any]]:
         """
@@ -61,45 +120,332 @@ class HH(Parser):
         """
         return self.file_worker.delete_vacancy(vacancy_id)
 
-    def load_vacancies(self, keyword: str, pages: int = 1) -> List[Dict[str, Any]]:
+    def load_vacancies(self, keyword: str, pages: int = 1, commit: str = "page",
+                       resume: bool = False) -> List[Dict[str, Any]]:
         """
-        Загружает вакансии с HH.ru по ключевому слову.
+        Загружает вакансии с HH.ru по ключевому слову и возвращает их списком.
+        Для обработки вакансий по мере загрузки используйте iter_vacancies.
 
         Args:
             keyword (str): Ключевое слово для поиска
             pages (int): Количество страниц для загрузки
+            commit (str): Режим записи в хранилище: "page" или "harvest"
+            resume (bool): Продолжить загрузку с контрольной точки
 
         Returns:
             List[Dict[str, Any]]: Список загруженных вакансий
         """
+        return list(self.iter_vacancies(keyword, pages, commit, resume))
+
+    def iter_vacancies(self, keyword: str, pages: int = 1, commit: str = "page",
+                       resume: bool = False) -> HarvestPipeline:
+        """
+        Загружает вакансии с HH.ru по ключевому слову через потоковый конвейер.
+        Вакансии записываются в хранилище пачками: одна запись на страницу
+        (commit="page") или одна на всю загрузку (commit="harvest").
+        Если задан checkpoint_dir, записанные страницы отмечаются в контрольной
+        точке; с resume=True уже записанные страницы пропускаются.
+        Загрузка начинается при итерации; пропускная способность стадий
+        доступна через stats() возвращённого конвейера. Если задан seen_filter,
+        уже сохранённые вакансии не передаются в хранилище и не возвращаются,
+        а загрузка останавливается на первой странице без новых вакансий.
+
+        Args:
+            keyword (str): Ключевое слово для поиска
+            pages (int): Количество страниц для загрузки
+            commit (str): Режим записи в хранилище: "page" или "harvest"
+            resume (bool): Продолжить загрузку с контрольной точки
+
+        Returns:
+            HarvestPipeline: Итерируемый конвейер, возвращающий записанные вакансии
+        """
+        if commit not in ("page", "harvest"):
+            raise ValueError(f"Неизвестный режим записи: {commit}")
+        if resume and self.checkpoint_dir is None:
+            raise ValueError("Для продолжения загрузки нужен checkpoint_dir")
+
         self.params['text'] = keyword
-        loaded_vacancies = []
+        page_count = min(pages, 20)  # Ограничиваем максимум 20 страницами
+        checkpoint = None
+        if self.checkpoint_dir is not None:
+            checkpoint = HarvestCheckpoint(self.checkpoint_dir, keyword, self.params)
+            if not resume:
+                checkpoint.clear()
+        page_numbers = checkpoint.pending(page_count) if checkpoint else list(range(page_count))
+        if self.seen_filter is not None and self.seen_filter.is_new:
+            self.seen_filter.update(vacancy["id"] for vacancy in self.file_worker.get_vacancies(lambda v: True))
+        return HarvestPipeline(self, keyword, page_numbers, commit, checkpoint, seen_filter=self.seen_filter)
 
-        try:
-            for page in range(min(pages, 20)):  # Ограничиваем максимум 20 страницами
-                self.params['page'] = page
-                response = requests.get(self.url, headers=self.headers, params=self.params)
-                response.raise_for_status()
-
-                data = response.json()
-                vacancies = data.get('items', [])
-
-                for vac in vacancies:
-                    vacancy = {
-                        "id": vac["id"],
-                        "name": vac["name"],
-                        "url": vac["alternate_url"],  # Используем alternate_url для прямой ссылки
-                        "salary": self._parse_salary(vac.get("salary")),
-                        "description": vac.get("snippet", {}).get("requirement", "Описание не указано"),
-                    }
-                    self.add_vac(vacancy)
-                    loaded_vacancies.append(vacancy)
+    def load_many(self, keywords: Iterable[str],
+                  pages: int = 1) -> Tuple[Dict[str, List[Dict[str, Any]]], List[Dict[str, Any]]]:
+        """
+        Загружает вакансии по нескольким ключевым словам на общем пуле потоков.
+        Все пары (ключевое слово, страница) загружаются параллельно, повторы
+        по ID отсекаются в памяти между всеми словами, после чего объединение
+        записывается в хранилище одной пачкой. Страницы, которые не удалось
+        загрузить, пропускаются.
 
-        except requests.RequestException as e:
-            print(f"Ошибка при загрузке вакансий: {e}")
-            return loaded_vacancies
+        Args:
+            keywords (Iterable[str]): Ключевые слова для поиска
+            pages (int): Количество страниц для каждого слова
+
+        Returns:
+            Tuple[Dict[str, List[Dict[str, Any]]], List[Dict[str, Any]]]:
+                Вакансии по каждому ключевому слову и их объединение без повторов
+        """
+        keywords = list(dict.fromkeys(keywords))
+        page_count = min(pages, 20)  # Ограничиваем максимум 20 страницами
+        by_id: Dict[str, Dict[str, Any]] = {}
+        hits: Dict[str, List[Dict[str, Any]]] = {}
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            futures = {
+                keyword: [pool.submit(self._fetch_page, keyword, page) for page in range(page_count)]
+                for keyword in keywords
+            }
+            # Результаты разбираются в порядке слов и страниц, чтобы объединение было стабильным
+            for keyword in keywords:
+                seen_ids = set()
+                hits[keyword] = []
+                for future in futures[keyword]:
+                    try:
+                        data = future.result()
+                    except requests.RequestException as e:
+                        print(f"Ошибка при загрузке вакансий по запросу '{keyword}': {e}")
+                        continue
+                    for vac in data.get('items', []):
+                        vacancy = self._normalize(vac)
+                        if vacancy["id"] in seen_ids:
+                            continue
+                        seen_ids.add(vacancy["id"])
+                        # Одна и та же вакансия из выдачи разных слов хранится одним объектом
+                        vacancy = by_id.setdefault(vacancy["id"], vacancy)
+                        hits[keyword].append(vacancy)
 
-        return loaded_vacancies
+        union = list(by_id.values())
+        self.add_vacs(union)
+        return hits, union
+
+    def sync(self, keyword: str, pages: int = 20) -> List[Dict[str, Any]]:
+        """
+        Загружает только вакансии, опубликованные после прошлой синхронизации.
+        Выдача запрашивается от новых к старым с фильтром date_from по сохранённому
+        курсору; загрузка страниц прекращается, как только на странице нет
+        неизвестных вакансий или выдача закончилась. Курсор сохраняется только
+        после успешной синхронизации, поэтому при ошибке следующий запуск
+        повторит пропущенное.
+        Если новых вакансий больше, чем помещается в pages страниц (не больше 20),
+        курсор сдвигается на самую свежую вакансию, а непрочитанный промежуток
+        (от прошлого курсора до самой старой загруженной вакансии) сохраняется
+        в курсоре как gap и дочитывается следующими запусками, пока не закончится.
+
+        Args:
+            keyword (str): Ключевое слово для поиска
+            pages (int): Максимальное количество страниц для одного окна выдачи
+
+        Returns:
+            List[Dict[str, Any]]: Новые вакансии, записанные в хранилище
+        """
+        cursor = SyncCursor(self.sync_dir, keyword)
+        previous, old_gap = cursor.published_at, cursor.gap
+        new_vacancies: List[Dict[str, Any]] = []
+        seen_ids: Set[str] = set()
+
+        status, oldest = self._sync_window(keyword, cursor, previous, None, pages, True, seen_ids, new_vacancies)
+        if status == "failed":
+            self.add_vacs(new_vacancies)
+            return new_vacancies
+        new_gap = [previous, oldest] if status == "truncated" else None
+
+        remaining_gap = None
+        if old_gap is not None:
+            status, oldest = self._sync_window(keyword, cursor, old_gap[0], old_gap[1], pages, False,
+                                               seen_ids, new_vacancies)
+            if status == "failed":
+                remaining_gap = old_gap
+            elif status == "truncated":
+                remaining_gap = [old_gap[0], oldest]
+        # Оба промежутка лежат до самой старой вакансии нового окна, их можно объединить
+        if new_gap is not None and remaining_gap is not None:
+            new_gap = [remaining_gap[0], new_gap[1]]
+
+        self.add_vacs(new_vacancies)
+        cursor.gap = new_gap or remaining_gap
+        cursor.save()
+        return new_vacancies
+
+    def _sync_window(self, keyword: str, cursor: SyncCursor, date_from: Optional[str], date_to: Optional[str],
+                     pages: int, stop_on_known: bool, seen_ids: Set[str],
+                     new_vacancies: List[Dict[str, Any]]) -> Tuple[str, Optional[str]]:
+        """
+        Загружает страницы одного окна выдачи синхронизации (от новых к старым).
+
+        Args:
+            keyword (str): Ключевое слово для поиска
+            cursor (SyncCursor): Курсор синхронизации
+            date_from (Optional[str]): Нижняя граница даты публикации
+            date_to (Optional[str]): Верхняя граница даты публикации
+            pages (int): Максимальное количество страниц
+            stop_on_known (bool): Остановиться на странице без неизвестных вакансий
+            seen_ids (Set[str]): ID, уже загруженные в этом запуске
+            new_vacancies (List[Dict[str, Any]]): Сюда добавляются новые вакансии
+
+        Returns:
+            Tuple[str, Optional[str]]: Итог (done, truncated - выдача не дочитана,
+                failed - ошибка) и дата публикации самой старой загруженной вакансии
+        """
+        params = dict(self.params, text=keyword, order_by="publication_time")
+        if date_from:
+            params["date_from"] = date_from
+        if date_to:
+            params["date_to"] = date_to
+
+        oldest = None
+        page_count = min(pages, 20)
+        for page in range(page_count):
+            try:
+                data = self._get_json(dict(params, page=page))
+            except requests.RequestException as e:
+                print(f"Ошибка при синхронизации вакансий: {e}")
+                return "failed", oldest
+
+            items = data.get('items', [])
+            fresh = [vac for vac in items if not cursor.is_known(vac.get("id"))]
+            for vac in fresh:
+                vacancy = self._normalize(vac)
+                if vacancy["id"] not in seen_ids:
+                    seen_ids.add(vacancy["id"])
+                    new_vacancies.append(vacancy)
+            cursor.observe(items)
+            if items and items[-1].get("published_at"):
+                oldest = items[-1]["published_at"]
+
+            if (stop_on_known and not fresh) or len(items) < self.params['per_page'] \
+                    or page + 1 >= data.get('pages', page + 1):
+                return "done", oldest
+        return "truncated", oldest
+
+    def load_all(self, keyword: str, days: int = 30,
+                 areas: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Загружает полную выдачу по ключевому слову за последние days дней,
+        обходя ограничение API в 2000 вакансий делением запроса на срезы
+        по периоду публикации (см. PartitionedHarvester).
+
+        Args:
+            keyword (str): Ключевое слово для поиска
+            days (int): За сколько последних дней загружать вакансии
+            areas (Optional[Iterable[str]]): ID регионов для дополнительного деления запроса
+
+        Returns:
+            List[Dict[str, Any]]: Загруженные вакансии без повторов
+        """
+        date_to = datetime.now(timezone.utc).replace(microsecond=0)
+        return PartitionedHarvester(self).harvest(keyword, date_to - timedelta(days=days), date_to, areas)
+
+    def enrich(self, ids: Iterable[str], force: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Загружает полные описания вакансий (/vacancies/{id}) и дополняет ими записи в хранилище.
+        Описания загружаются параллельно (не более concurrency запросов одновременно);
+        вакансии, описание которых уже есть в detail_cache, повторно не загружаются.
+        В хранилище одной пачкой через update_vacancies записываются только
+        вакансии, у которых сохранённые поля описания отсутствуют или отличаются
+        (с force - все загруженные), поэтому повторный запуск по тем же ID
+        не перезаписывает хранилище.
+
+        Args:
+            ids (Iterable[str]): ID вакансий
+            force (bool): Загрузить описания заново, даже если они есть в кэше
+
+        Returns:
+            Dict[str, Dict[str, Any]]: ID вакансии -> поля описания (в том числе не изменившиеся)
+
+        Raises:
+            TypeError: Если хранилище не поддерживает update_vacancies
+        """
+        if not callable(getattr(self.file_worker, "update_vacancies", None)):
+            raise TypeError(f"Хранилище {type(self.file_worker).__name__} не поддерживает update_vacancies")
+        ids = list(dict.fromkeys(str(vacancy_id) for vacancy_id in ids))
+        details: Dict[str, Dict[str, Any]] = {}
+        to_fetch = []
+        for vacancy_id in ids:
+            body = None if force or self.detail_cache is None else self.detail_cache.get(vacancy_id)
+            if body is None:
+                to_fetch.append(vacancy_id)
+            else:
+                details[vacancy_id] = body
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            futures = {vacancy_id: pool.submit(self._fetch_detail, vacancy_id) for vacancy_id in to_fetch}
+            for vacancy_id, future in futures.items():
+                try:
+                    body = future.result()
+                except requests.RequestException as e:
+                    print(f"Ошибка при загрузке вакансии {vacancy_id}: {e}")
+                    continue
+                if self.detail_cache is not None:
+                    self.detail_cache.put(vacancy_id, body)
+                details[vacancy_id] = body
+
+        updates = {vacancy_id: self._detail_fields(details[vacancy_id])
+                   for vacancy_id in ids if vacancy_id in details}
+        written = updates if force else self._unsaved_details(updates)
+        if written:
+            self.file_worker.update_vacancies(written)
+        return updates
+
+    def _unsaved_details(self, updates: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Отбирает описания, которых ещё нет в записях хранилища.
+
+        Args:
+            updates (Dict[str, Dict[str, Any]]): ID вакансии -> поля описания
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Описания вакансий, у которых в хранилище
+                этих полей нет или они отличаются
+        """
+        if not updates:
+            return {}
+        stored = {vacancy["id"]: vacancy for vacancy in self.file_worker.get_vacancies(IdIn(updates))}
+        return {vacancy_id: fields for vacancy_id, fields in updates.items()
+                if vacancy_id in stored
+                and any(stored[vacancy_id].get(name) != value for name, value in fields.items())}
+
+    def search(self, keyword: str, pages: int = 1) -> List[Dict[str, Any]]:
+        """
+        Ищет вакансии на HH.ru без записи в хранилище.
+        Страницы загружаются параллельно, вакансии приводятся к формату хранилища.
+        Страницы, которые не удалось загрузить, пропускаются, как в load_many;
+        ошибка возвращается, только если не загрузилась ни одна страница.
+
+        Args:
+            keyword (str): Ключевое слово для поиска
+            pages (int): Количество страниц выдачи
+
+        Returns:
+            List[Dict[str, Any]]: Найденные вакансии без повторов
+
+        Raises:
+            requests.RequestException: Если не удалось загрузить ни одной страницы
+        """
+        results, error = [], None
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            futures = [pool.submit(self._fetch_page, keyword, page) for page in range(min(pages, 20))]
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except requests.RequestException as e:
+                    print(f"Ошибка при загрузке вакансий по запросу '{keyword}': {e}")
+                    error = e
+        if error is not None and not results:
+            raise error
+        vacancies: Dict[str, Dict[str, Any]] = {}
+        for data in results:
+            for vac in data.get('items', []):
+                vacancy = self._normalize(vac)
+                vacancies.setdefault(vacancy["id"], vacancy)
+        return list(vacancies.values())
 
     def get_vacancies_by_keyword(self, keyword: str) -> List[Dict[str, Any]]:
         """
@@ -113,13 +459,192 @@ class HH(Parser):
         """
         self.params['text'] = keyword
         try:
-            response = requests.get(self.url, headers=self.headers, params=self.params)
-            response.raise_for_status()
-            return response.json()['items']
+            return self._get_json(dict(self.params))['items']
         except requests.RequestException as e:
             print(f"Error fetching vacancies: {e}")
             return []
 
+    def _fetch_page(self, keyword: str, page: int) -> Dict[str, Any]:
+        """
+        Загружает одну страницу выдачи.
+        Параметры запроса копируются, поэтому метод можно вызывать из нескольких потоков.
+
+        Args:
+            keyword (str): Ключевое слово для поиска
+            page (int): Номер страницы
+
+        Returns:
+            Dict[str, Any]: Ответ API
+        """
+        return self._get_json(dict(self.params, text=keyword, page=page))
+
+    def _fetch_detail(self, vacancy_id: str) -> Dict[str, Any]:
+        """
+        Загружает полное описание одной вакансии.
+
+        Args:
+            vacancy_id (str): ID вакансии
+
+        Returns:
+            Dict[str, Any]: Ответ API
+        """
+        response = self._send(self.headers, {}, f"{self.url}/{vacancy_id}")
+        response.raise_for_status()
+        return response.json()
+
+    def _stored_ids(self, ids: List[str]) -> Set[str]:
+        """
+        Точно проверяет, какие из ID уже есть в хранилище.
+
+        Args:
+            ids (List[str]): ID вакансий
+
+        Returns:
+            Set[str]: ID, которые есть в хранилище
+        """
+        existing_ids = getattr(self.file_worker, "existing_ids", None)
+        if existing_ids is not None:
+            return existing_ids(ids)
+        # Хранилище без точечной проверки
+        wanted = set(ids)
+        return {vacancy["id"] for vacancy in self.file_worker.get_vacancies(lambda v: v["id"] in wanted)}
+
+    def _get_json(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Выполняет GET-запрос к API и возвращает разобранный ответ.
+        При включённом кэше свежий ответ берётся с диска, а устаревший
+        проверяется условным запросом (ответ 304 продлевает запись).
+
+        Args:
+            params (Dict[str, Any]): Параметры запроса
+
+        Returns:
+            Dict[str, Any]: Ответ API
+        """
+        if self.cache is None:
+            response = self._send(self.headers, params)
+            response.raise_for_status()
+            return response.json()
+
+        entry = self.cache.get(self.url, params)
+        if entry is not None and entry.is_fresh(self.cache.ttl):
+            return entry.body
+
+        headers = dict(self.headers)
+        if entry is not None:
+            headers.update(entry.validators())
+        response = self._send(headers, params)
+        if entry is not None and response.status_code == 304:
+            self.cache.refresh(entry)
+            return entry.body
+
+        response.raise_for_status()
+        data = response.json()
+        self.cache.put(self.url, params, data,
+                       response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return data
+
+    def _send(self, headers: Dict[str, str], params: Dict[str, Any],
+              url: Optional[str] = None) -> requests.Response:
+        """
+        Отправляет запрос с учётом ограничителя частоты, таймаута и повторов.
+        Ответы 429/5xx и сетевые ошибки повторяются с экспоненциальной задержкой
+        (или паузой из Retry-After), ограничитель при этом снижает скорость.
+        Последний неудачный ответ возвращается как есть.
+
+        Args:
+            headers (Dict[str, str]): Заголовки запроса
+            params (Dict[str, Any]): Параметры запроса
+            url (Optional[str]): Адрес запроса (по умолчанию поиск вакансий)
+
+        Returns:
+            requests.Response: Ответ сервера
+        """
+        url = url or self.url
+        attempt = 0
+        while True:
+            if self.cassette is None or self.cassette.mode != "replay":
+                self.rate_limiter.acquire()
+            try:
+                response = self.session.get(url, headers=headers, params=params, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= self.retry.max_retries:
+                    raise
+                time.sleep(self.retry.backoff(attempt))
+                attempt += 1
+                continue
+
+            if response.status_code not in RETRY_STATUSES:
+                self.rate_limiter.reward()
+                return response
+            if attempt >= self.retry.max_retries:
+                return response
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            self.rate_limiter.penalize(retry_after)
+            if retry_after is None:
+                time.sleep(self.retry.backoff(attempt))
+            attempt += 1
+
+    @staticmethod
+    def _make_session(pool_size: int) -> requests.Session:
+        """
+        Создаёт сессию с пулом соединений, чтобы не открывать TCP/TLS-соединение на каждую страницу.
+
+        Args:
+            pool_size (int): Размер пула соединений
+
+        Returns:
+            requests.Session: Сессия HTTP
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _normalize(self, vacancy: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Приводит вакансию из ответа API к формату хранилища.
+        Без требований в сниппете описание - "Описание не указано", как в Sort_Vacan.
+        Уже приведённые вакансии (с полем url) возвращаются без изменений.
+
+        Args:
+            vacancy (Dict[str, Any]): Вакансия из ответа API
+
+        Returns:
+            Dict[str, Any]: Вакансия в формате хранилища
+        """
+        if "url" in vacancy and "alternate_url" not in vacancy:
+            return vacancy
+        return {
+            "id": vacancy.get("id", ""),
+            "name": vacancy.get("name", ""),
+            "url": vacancy.get("alternate_url", ""),
+            "salary": self._parse_salary(vacancy.get("salary")),
+            "description": (vacancy.get("snippet") or {}).get("requirement") or "Описание не указано",
+        }
+
+    @staticmethod
+    def _detail_fields(detail: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Выбирает из полного описания вакансии поля для хранилища.
+
+        Args:
+            detail (Dict[str, Any]): Ответ API /vacancies/{id}
+
+        Returns:
+            Dict[str, Any]: Полное описание текстом, ключевые навыки, опыт, занятость и работодатель
+        """
+        text = html.unescape(re.sub(r"<[^>]+>", " ", detail.get("description") or ""))
+        return {
+            "full_description": " ".join(text.split()),
+            "key_skills": [skill.get("name", "") for skill in detail.get("key_skills") or []],
+            "experience": (detail.get("experience") or {}).get("name", ""),
+            "employment": (detail.get("employment") or {}).get("name", ""),
+            "employer": (detail.get("employer") or {}).get("name", ""),
+        }
+
     def _parse_salary(self, salary_data: Dict[str, Any]) -> int:
         """
         Парсит данные о зарплате из ответа API.
@@ -0,0 +1,205 @@
+from typing import List, Dict, Any, Iterable, Callable
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import functools
+import inspect
+
+import requests
+
+from CAPI import AsyncParser
+from HH import HH
+
+
+class AsyncHH(AsyncParser):
+    """
+    Асинхронный клиент API HeadHunter.
+    Сетевые запросы выполняются через HH (общая сессия, тот же разбор ответов)
+    в собственном пуле потоков, поэтому цикл событий не блокируется.
+    Число одновременных запросов ограничено семафором.
+    Методы хранилища могут быть корутинами - тогда они ожидаются напрямую,
+    обычные методы выполняются по очереди в отдельном потоке.
+    """
+
+    def __init__(self, file_worker: Any, concurrency: int = 4, **options: Any):
+        """
+        Инициализация класса AsyncHH.
+
+        Args:
+            file_worker: Объект для работы с хранилищем (синхронный или асинхронный)
+            concurrency (int): Максимальное число одновременных запросов к API
+            **options: Остальные параметры HH (cache, rate_limiter, retry, timeout)
+        """
+        self.hh = HH(file_worker, concurrency=concurrency, **options)
+        self.file_worker = file_worker
+        self.concurrency = self.hh.concurrency
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="async-hh")
+        # Синхронные хранилища не рассчитаны на параллельную запись
+        self._storage_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="async-hh-storage")
+
+    async def add_vac(self, vacancy: Dict[str, Any]) -> None:
+        """
+        Добавляет вакансию в хранилище.
+
+        Args:
+            vacancy (Dict[str, Any]): Данные вакансии
+        """
+        await self._storage("add_vacancy", self.hh._normalize(vacancy))
+
+    async def add_vacs(self, vacancies: Iterable[Dict[str, Any]]) -> None:
+        """
+        Добавляет пачку вакансий в хранилище одной записью.
+
+        Args:
+            vacancies (Iterable[Dict[str, Any]]): Данные вакансий
+        """
+        processed = [self.hh._normalize(vacancy) for vacancy in vacancies]
+        if not processed:
+            return
+        if hasattr(self.file_worker, "add_vacancies"):
+            await self._storage("add_vacancies", processed)
+        else:
+            for vacancy in processed:
+                await self._storage("add_vacancy", vacancy)
+
+    async def get_vac(self, criteria: Callable[[Dict[str, Any]], bool]) -> List[Dict[str, Any]]:
+        """
+        Получает вакансии по заданным критериям.
+
+        Args:
+            criteria (Callable[[Dict[str, Any]], bool]): Критерии поиска вакансий
+
+        Returns:
+            List[Dict[str, Any]]: Список найденных вакансий
+        """
+        return await self._storage("get_vacancies", criteria)
+
+    async def del_vac(self, vacancy_id: str) -> bool:
+        """
+        Удаляет вакансию по ID.
+
+        Args:
+            vacancy_id (str): ID вакансии
+
+        Returns:
+            bool: Результат удаления
+        """
+        return await self._storage("delete_vacancy", vacancy_id)
+
+    async def load_vacancies(self, keyword: str, pages: int = 1, commit: str = "page") -> List[Dict[str, Any]]:
+        """
+        Загружает вакансии с HH.ru по ключевому слову.
+        Страницы загружаются параллельно (не более concurrency одновременно),
+        а записываются в хранилище по порядку номеров страниц.
+
+        Args:
+            keyword (str): Ключевое слово для поиска
+            pages (int): Количество страниц для загрузки
+            commit (str): Режим записи в хранилище: "page" или "harvest"
+
+        Returns:
+            List[Dict[str, Any]]: Список загруженных вакансий
+        """
+        if commit not in ("page", "harvest"):
+            raise ValueError(f"Неизвестный режим записи: {commit}")
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        loaded_vacancies = []
+        seen_ids = set()
+        pending = []
+
+        tasks = [
+            asyncio.ensure_future(self._fetch_page(semaphore, keyword, page))
+            for page in range(min(pages, 20))  # Ограничиваем максимум 20 страницами
+        ]
+        try:
+            for task in tasks:
+                data = await task
+                batch = []
+                for vac in data.get('items', []):
+                    vacancy = self.hh._normalize(vac)
+                    if vacancy["id"] in seen_ids:
+                        continue
+                    seen_ids.add(vacancy["id"])
+                    batch.append(vacancy)
+
+                loaded_vacancies.extend(batch)
+                if commit == "page":
+                    await self.add_vacs(batch)
+                else:
+                    pending.extend(batch)
+
+        except requests.RequestException as e:
+            print(f"Ошибка при загрузке вакансий: {e}")
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Уже полученные страницы сохраняем и при ошибке на середине загрузки
+        await self.add_vacs(pending)
+        return loaded_vacancies
+
+    async def get_vacancies_by_keyword(self, keyword: str) -> List[Dict[str, Any]]:
+        """
+        Получает вакансии первой страницы выдачи по ключевому слову.
+
+        Args:
+            keyword (str): Ключевое слово для поиска
+
+        Returns:
+            List[Dict[str, Any]]: Список найденных вакансий
+        """
+        semaphore = asyncio.Semaphore(1)
+        try:
+            data = await self._fetch_page(semaphore, keyword, 0)
+            return data['items']
+        except requests.RequestException as e:
+            print(f"Error fetching vacancies: {e}")
+            return []
+
+    def close(self) -> None:
+        """
+        Останавливает пул потоков и закрывает HTTP-сессию.
+        """
+        self._executor.shutdown(wait=False)
+        self._storage_executor.shutdown(wait=True)
+        self.hh.session.close()
+
+    async def __aenter__(self) -> 'AsyncHH':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    async def _fetch_page(self, semaphore: asyncio.Semaphore, keyword: str, page: int) -> Dict[str, Any]:
+        """
+        Загружает одну страницу выдачи, не блокируя цикл событий.
+
+        Args:
+            semaphore (asyncio.Semaphore): Ограничитель одновременных запросов
+            keyword (str): Ключевое слово для поиска
+            page (int): Номер страницы
+
+        Returns:
+            Dict[str, Any]: Ответ API
+        """
+        async with semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self.hh._fetch_page, keyword, page)
+
+    async def _storage(self, method: str, *args: Any) -> Any:
+        """
+        Вызывает метод хранилища: корутину ожидает, обычный метод выполняет в потоке хранилища.
+
+        Args:
+            method (str): Имя метода хранилища
+            *args: Аргументы метода
+
+        Returns:
+            Any: Результат метода
+        """
+        func = getattr(self.file_worker, method)
+        if inspect.iscoroutinefunction(func):
+            return await func(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._storage_executor, functools.partial(func, *args))
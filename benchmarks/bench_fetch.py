@@ -0,0 +1,58 @@
+"""
+Бенчмарк загрузки вакансий: последовательная загрузка против параллельной.
+
+Поднимает локальный имитатор API HeadHunter (hh_simulator.py) с задержкой ответа
+и замеряет HH.load_vacancies при разной степени параллельности.
+
+Запуск:
+    python benchmarks/bench_fetch.py --pages 20 --latency 0.1
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from HH import HH  # noqa: E402
+from user_request import UserAsk  # noqa: E402
+from rate_limiter import TokenBucket  # noqa: E402
+from hh_simulator import HHSimulator  # noqa: E402
+
+
+def run(concurrency: int, pages: int, per_page: int, url: str) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        # Ограничитель с высоким лимитом, чтобы замерять саму загрузку
+        hh = HH(UserAsk(os.path.join(tmp, "vacancies.json")), concurrency=concurrency,
+                rate_limiter=TokenBucket(rate=1000))
+        hh.url = url
+        hh.params['per_page'] = per_page
+        started = time.perf_counter()
+        hh.load_vacancies("Python", pages)
+        return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.1, help="задержка ответа сервера, с")
+    parser.add_argument("--jitter", type=float, default=0.0, help="разброс задержки, с")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="доля ответов 5xx")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    args = parser.parse_args()
+
+    simulator = HHSimulator(count=args.pages * args.per_page, latency=args.latency, jitter=args.jitter,
+                            error_rate=args.error_rate)
+    with simulator:
+        baseline = None
+        for concurrency in args.concurrency:
+            elapsed = run(concurrency, args.pages, args.per_page, simulator.url)
+            baseline = baseline or elapsed
+            print(f"concurrency={concurrency:<3} {elapsed:7.3f} s  x{baseline / elapsed:.1f}")
+        print(f"запросов: {simulator.requests}, ответы: {dict(simulator.statuses)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Бенчмарк пути загрузки без сети: ответы API воспроизводятся из кассеты.
+
+Если кассеты нет, она записывается с локального имитатора API (hh_simulator.py).
+Затем загрузка HH.iter_vacancies -> хранилище повторяется с нулевой задержкой,
+так что замер показывает только стоимость разбора ответов и записи в хранилище.
+
+Запуск:
+    python benchmarks/bench_ingest.py --pages 20 --storage json sqlite
+    python benchmarks/bench_ingest.py --cassette hh.jsonl.gz --repeat 5
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from HH import HH  # noqa: E402
+from cassette import Cassette  # noqa: E402
+from hh_simulator import HHSimulator  # noqa: E402
+from rate_limiter import TokenBucket  # noqa: E402
+from user_request import UserAsk  # noqa: E402
+from journal_store import JournalUserAsk  # noqa: E402
+from resident_store import ResidentUserAsk  # noqa: E402
+from sqlite_store import SQLiteUserAsk  # noqa: E402
+
+STORAGES = {
+    "json": lambda tmp: UserAsk(os.path.join(tmp, "vacancies.json")),
+    "journal": lambda tmp: JournalUserAsk(os.path.join(tmp, "vacancies.jsonl")),
+    "resident": lambda tmp: ResidentUserAsk(os.path.join(tmp, "vacancies.json"), flush_interval=None),
+    "sqlite": lambda tmp: SQLiteUserAsk(os.path.join(tmp, "vacancies.db")),
+}
+
+
+def record(path: str, pages: int, per_page: int) -> None:
+    with HHSimulator(count=pages * per_page) as simulator, Cassette(path, mode="record") as cassette, \
+            tempfile.TemporaryDirectory() as tmp:
+        hh = HH(UserAsk(os.path.join(tmp, "recorded.json")), rate_limiter=TokenBucket(rate=1000), cassette=cassette)
+        hh.url = simulator.url
+        hh.params['per_page'] = per_page
+        hh.load_vacancies("Python", pages)
+
+
+def run(storage: str, path: str, pages: int, per_page: int) -> tuple:
+    with tempfile.TemporaryDirectory() as tmp:
+        store = STORAGES[storage](tmp)
+        cassette = Cassette(path)
+        hh = HH(store, cassette=cassette)
+        # Адрес, с которого записана кассета (hh.ru или имитатор)
+        hh.url = cassette.interactions[0]["url"]
+        hh.params['per_page'] = per_page
+        started = time.perf_counter()
+        pipeline = hh.iter_vacancies("Python", pages)
+        count = sum(1 for _ in pipeline)
+        elapsed = time.perf_counter() - started
+        if hasattr(store, "close"):
+            store.close()
+        return elapsed, count, pipeline.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--cassette", default=None, help="файл кассеты (по умолчанию временный)")
+    parser.add_argument("--storage", nargs="+", default=["json", "sqlite"], choices=sorted(STORAGES))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.cassette or os.path.join(tmp, "hh.jsonl.gz")
+        if not os.path.exists(path):
+            record(path, args.pages, args.per_page)
+
+        for storage in args.storage:
+            runs = [run(storage, path, args.pages, args.per_page) for _ in range(args.repeat)]
+            elapsed = statistics.median(result[0] for result in runs)
+            count, stats = runs[-1][1], runs[-1][2]
+            stages = "  ".join(f"{name}={stage['per_second']:.0f}/s" for name, stage in stats.items())
+            print(f"{storage:<9} {count} вакансий  {elapsed:7.3f} s  {count / elapsed:8.0f} вак/с  {stages}")
+
+
+if __name__ == "__main__":
+    main()
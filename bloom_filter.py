@@ -0,0 +1,111 @@
+from typing import Iterable, Optional, List
+import hashlib
+import json
+import math
+import os
+
+
+class BloomFilter:
+    """
+    Фильтр Блума по ID вакансий.
+    Отвечает "точно не встречался" или "возможно встречался": ложных
+    отрицательных ответов нет, доля ложных положительных около error_rate,
+    пока в фильтре не больше capacity ID. Положительный ответ нужно
+    подтверждать точной проверкой в хранилище. Фильтр можно сохранить в файл
+    и загрузить при следующем запуске.
+    """
+
+    VERSION = 1
+
+    def __init__(self, capacity: int = 100000, error_rate: float = 0.01, path: Optional[str] = None):
+        """
+        Инициализация фильтра (если файл path есть, фильтр загружается из него).
+
+        Args:
+            capacity (int): Ожидаемое число ID
+            error_rate (float): Допустимая доля ложных положительных ответов
+            path (Optional[str]): Файл фильтра (None - фильтр только в памяти)
+        """
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.path = path
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+        # True пока фильтр не загружен из файла и не заполнен
+        self.is_new = True
+        if path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, vacancy_id: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(vacancy_id))
+
+    def add(self, vacancy_id: str) -> None:
+        """
+        Добавляет ID в фильтр.
+
+        Args:
+            vacancy_id (str): ID вакансии
+        """
+        for position in self._positions(vacancy_id):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+        self.is_new = False
+
+    def update(self, ids: Iterable[str]) -> None:
+        """
+        Добавляет несколько ID в фильтр.
+
+        Args:
+            ids (Iterable[str]): ID вакансий
+        """
+        for vacancy_id in ids:
+            self.add(vacancy_id)
+
+    def save(self) -> None:
+        """
+        Атомарно записывает фильтр в файл path.
+        """
+        if self.path is None:
+            return
+        header = json.dumps({"version": self.VERSION, "size": self.size,
+                             "hashes": self.hashes, "count": self.count})
+        tmp_name = self.path + ".tmp"
+        with open(tmp_name, "wb") as file:
+            file.write(header.encode("utf-8") + b"\n")
+            file.write(bytes(self.bits))
+        os.replace(tmp_name, self.path)
+
+    def _load(self) -> None:
+        """
+        Загружает фильтр из файла, если он есть и построен с теми же параметрами.
+        """
+        try:
+            with open(self.path, "rb") as file:
+                header = json.loads(file.readline().decode("utf-8"))
+                bits = file.read()
+        except (FileNotFoundError, ValueError, UnicodeDecodeError):
+            return
+        if (header.get("version"), header.get("size"), header.get("hashes")) != \
+                (self.VERSION, self.size, self.hashes) or len(bits) != len(self.bits):
+            return
+        self.bits = bytearray(bits)
+        self.count = header.get("count", 0)
+        self.is_new = False
+
+    def _positions(self, vacancy_id: str) -> List[int]:
+        """
+        Вычисляет номера битов для ID (двойное хэширование).
+
+        Args:
+            vacancy_id (str): ID вакансии
+
+        Returns:
+            List[int]: Номера битов
+        """
+        digest = hashlib.blake2b(str(vacancy_id).encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hashes)]
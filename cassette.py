@@ -0,0 +1,224 @@
+from typing import List, Dict, Any, Optional, Tuple
+from collections import defaultdict, deque
+from datetime import timedelta
+from http.client import responses as http_reasons
+import gzip
+import json
+import os
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Заголовки ответа, которые сохраняются в кассете (их читает HH)
+RECORDED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Retry-After")
+
+
+class CassetteMiss(LookupError):
+    """
+    В кассете нет записанного ответа на запрос (в режиме воспроизведения сеть не используется).
+    """
+
+
+class Cassette:
+    """
+    Запись и воспроизведение HTTP-обмена HH с API.
+    В режиме "record" запросы уходят в сеть, а ответы вместе со временем
+    ответа сохраняются в сжатый файл (gzip, одна запись JSON на строку).
+    В режиме "replay" ответы берутся только из файла: повторные запросы
+    с одинаковыми параметрами получают ответы в порядке записи, задержка
+    воспроизводится исходной (latency="original") или нулевой (latency="zero").
+    """
+
+    def __init__(self, path: str, mode: str = "replay", latency: str = "zero"):
+        """
+        Инициализация кассеты (в режиме воспроизведения файл загружается сразу).
+
+        Args:
+            path (str): Файл кассеты (обычно *.jsonl.gz)
+            mode (str): "record" - записывать, "replay" - воспроизводить
+            latency (str): Задержка воспроизведения: "original" или "zero"
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Неизвестный режим кассеты: {mode}")
+        if latency not in ("original", "zero"):
+            raise ValueError(f"Неизвестный режим задержки: {latency}")
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self.interactions: List[Dict[str, Any]] = []
+        self._queues: Dict[Tuple, deque] = defaultdict(deque)
+        self._lock = threading.Lock()
+        if mode == "replay":
+            self._load()
+
+    def wrap(self, session: requests.Session) -> 'CassetteSession':
+        """
+        Оборачивает сессию HTTP: запросы идут через кассету.
+
+        Args:
+            session (requests.Session): Сессия для запросов в сеть при записи
+
+        Returns:
+            CassetteSession: Сессия с интерфейсом get, как у requests.Session
+        """
+        return CassetteSession(self, session)
+
+    def record(self, url: str, params: Optional[Dict[str, Any]], response: requests.Response,
+               elapsed: float) -> None:
+        """
+        Запоминает ответ на запрос.
+
+        Args:
+            url (str): URL запроса
+            params (Optional[Dict[str, Any]]): Параметры запроса
+            response (requests.Response): Ответ сервера
+            elapsed (float): Время ответа в секундах
+        """
+        interaction = {
+            "url": url,
+            "params": self._canonical(params),
+            "status": response.status_code,
+            "headers": {name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers},
+            "body": response.content.decode("utf-8", errors="replace"),
+            "elapsed": elapsed,
+        }
+        with self._lock:
+            self.interactions.append(interaction)
+
+    def play(self, url: str, params: Optional[Dict[str, Any]]) -> requests.Response:
+        """
+        Возвращает записанный ответ на запрос.
+
+        Args:
+            url (str): URL запроса
+            params (Optional[Dict[str, Any]]): Параметры запроса
+
+        Returns:
+            requests.Response: Ответ из кассеты
+
+        Raises:
+            CassetteMiss: Если ответ на такой запрос не записан или уже воспроизведён
+        """
+        key = (url, tuple(map(tuple, self._canonical(params))))
+        with self._lock:
+            queue = self._queues.get(key)
+            if not queue:
+                raise CassetteMiss(f"Нет записанного ответа: {url} {dict(key[1])}")
+            # Последний ответ остаётся в очереди, чтобы повторные прогоны получали его же
+            interaction = queue.popleft() if len(queue) > 1 else queue[0]
+        if self.latency == "original":
+            time.sleep(interaction["elapsed"])
+        return self._make_response(url, interaction)
+
+    def save(self) -> None:
+        """
+        Атомарно записывает кассету на диск (в режиме записи).
+        """
+        if self.mode != "record":
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_name = self.path + ".tmp"
+        with self._lock, gzip.open(tmp_name, "wt", encoding="utf-8") as file:
+            for interaction in self.interactions:
+                file.write(json.dumps(interaction, ensure_ascii=False) + "\n")
+        os.replace(tmp_name, self.path)
+
+    def __enter__(self) -> 'Cassette':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.save()
+
+    def _load(self) -> None:
+        """
+        Загружает записи кассеты и раскладывает их по очередям запросов.
+        """
+        with gzip.open(self.path, "rt", encoding="utf-8") as file:
+            self.interactions = [json.loads(line) for line in file if line.strip()]
+        for interaction in self.interactions:
+            key = (interaction["url"], tuple(map(tuple, interaction["params"])))
+            self._queues[key].append(interaction)
+
+    @staticmethod
+    def _canonical(params: Optional[Dict[str, Any]]) -> List[List[str]]:
+        """
+        Приводит параметры запроса к виду, не зависящему от порядка и типов значений.
+
+        Args:
+            params (Optional[Dict[str, Any]]): Параметры запроса
+
+        Returns:
+            List[List[str]]: Отсортированные пары (имя, значение)
+        """
+        return sorted([str(name), str(value)] for name, value in (params or {}).items())
+
+    @staticmethod
+    def _make_response(url: str, interaction: Dict[str, Any]) -> requests.Response:
+        """
+        Собирает объект ответа requests из записи кассеты.
+
+        Args:
+            url (str): URL запроса
+            interaction (Dict[str, Any]): Запись кассеты
+
+        Returns:
+            requests.Response: Ответ
+        """
+        response = requests.Response()
+        response.status_code = interaction["status"]
+        response.reason = http_reasons.get(interaction["status"], "")
+        response.headers = CaseInsensitiveDict(interaction["headers"])
+        response._content = interaction["body"].encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = url
+        response.elapsed = timedelta(seconds=interaction["elapsed"])
+        return response
+
+
+class CassetteSession:
+    """
+    Замена requests.Session для HH: при записи запрос уходит в сеть и сохраняется
+    в кассету, при воспроизведении ответ берётся из кассеты.
+    """
+
+    def __init__(self, cassette: Cassette, session: requests.Session):
+        """
+        Инициализация сессии.
+
+        Args:
+            cassette (Cassette): Кассета
+            session (requests.Session): Настоящая сессия для режима записи
+        """
+        self.cassette = cassette
+        self.session = session
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None,
+            params: Optional[Dict[str, Any]] = None, **kwargs: Any) -> requests.Response:
+        """
+        Выполняет GET-запрос через кассету.
+
+        Args:
+            url (str): URL запроса
+            headers (Optional[Dict[str, str]]): Заголовки запроса
+            params (Optional[Dict[str, Any]]): Параметры запроса
+            **kwargs: Остальные аргументы requests.Session.get
+
+        Returns:
+            requests.Response: Ответ
+        """
+        if self.cassette.mode == "replay":
+            return self.cassette.play(url, params)
+        started = time.perf_counter()
+        response = self.session.get(url, headers=headers, params=params, **kwargs)
+        self.cassette.record(url, params, response, time.perf_counter() - started)
+        return response
+
+    def close(self) -> None:
+        """
+        Закрывает настоящую сессию.
+        """
+        self.session.close()
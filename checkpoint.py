@@ -0,0 +1,106 @@
+from typing import Dict, Any, List, Set
+import hashlib
+import json
+import os
+import time
+
+
+class HarvestCheckpoint:
+    """
+    Контрольная точка многостраничной загрузки.
+    Хранит в файле номера страниц, уже загруженных и записанных в хранилище,
+    чтобы прерванную загрузку можно было продолжить без повторной работы.
+    Файл определяется ключевым словом и параметрами запроса.
+    """
+
+    def __init__(self, directory: str, keyword: str, params: Dict[str, Any]):
+        """
+        Инициализация контрольной точки (существующий файл загружается).
+
+        Args:
+            directory (str): Каталог с файлами контрольных точек
+            keyword (str): Ключевое слово загрузки
+            params (Dict[str, Any]): Параметры запроса без номера страницы
+        """
+        self.keyword = keyword
+        self.params = {name: value for name, value in params.items() if name not in ("text", "page")}
+        raw = json.dumps([keyword, sorted((k, str(v)) for k, v in self.params.items())], ensure_ascii=False)
+        digest = hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+        self.file_name = os.path.join(directory, f"harvest-{digest}.json")
+        self.completed: Set[int] = set()
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    @property
+    def cursor(self) -> int:
+        """
+        Первая страница, с которой загрузка ещё не выполнена без пропусков.
+
+        Returns:
+            int: Номер страницы
+        """
+        page = 0
+        while page in self.completed:
+            page += 1
+        return page
+
+    def pending(self, pages: int) -> List[int]:
+        """
+        Возвращает номера страниц, которые ещё предстоит загрузить.
+
+        Args:
+            pages (int): Общее число страниц загрузки
+
+        Returns:
+            List[int]: Номера страниц по возрастанию
+        """
+        return [page for page in range(pages) if page not in self.completed]
+
+    def mark(self, pages: List[int]) -> None:
+        """
+        Отмечает страницы как записанные в хранилище и сохраняет файл.
+
+        Args:
+            pages (List[int]): Номера страниц
+        """
+        if not pages:
+            return
+        self.completed.update(pages)
+        self._save()
+
+    def clear(self) -> None:
+        """
+        Удаляет контрольную точку (после успешного завершения загрузки).
+        """
+        self.completed = set()
+        try:
+            os.remove(self.file_name)
+        except FileNotFoundError:
+            pass
+
+    def _load(self) -> None:
+        """
+        Загружает сохранённые страницы, если файл есть.
+        """
+        try:
+            with open(self.file_name, "r", encoding="utf-8") as file:
+                stored = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        self.completed = set(stored.get("completed_pages", []))
+
+    def _save(self) -> None:
+        """
+        Атомарно записывает контрольную точку.
+        """
+        state = {
+            "keyword": self.keyword,
+            "params": self.params,
+            "completed_pages": sorted(self.completed),
+            "cursor": self.cursor,
+            "updated_at": time.time(),
+        }
+        tmp_name = self.file_name + ".tmp"
+        with open(tmp_name, "w", encoding="utf-8") as file:
+            json.dump(state, file, ensure_ascii=False, indent=4)
+        os.replace(tmp_name, self.file_name)
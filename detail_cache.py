@@ -0,0 +1,109 @@
+from typing import Dict, Any, Optional
+import hashlib
+import json
+import os
+import threading
+
+
+class DetailCache:
+    """
+    Дисковый кэш полных описаний вакансий (ответов /vacancies/{id}).
+    Тела ответов хранятся по хэшу содержимого (objects/<sha256>.json), поэтому
+    одинаковые описания занимают место один раз. Соответствие ID вакансии и хэша
+    дописывается в журнал refs.jsonl, без перезаписи файла на каждую вакансию.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Инициализация кэша (журнал ссылок загружается с диска).
+
+        Args:
+            directory (str): Каталог кэша
+        """
+        self.directory = directory
+        self.objects_dir = os.path.join(directory, "objects")
+        self.refs_file = os.path.join(directory, "refs.jsonl")
+        self._refs: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self._load_refs()
+
+    def __contains__(self, vacancy_id: str) -> bool:
+        return str(vacancy_id) in self._refs
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def get(self, vacancy_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Возвращает сохранённое описание вакансии.
+
+        Args:
+            vacancy_id (str): ID вакансии
+
+        Returns:
+            Optional[Dict[str, Any]]: Ответ API или None, если описания нет в кэше
+        """
+        digest = self._refs.get(str(vacancy_id))
+        if digest is None:
+            return None
+        try:
+            with open(self._path(digest), "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def put(self, vacancy_id: str, body: Dict[str, Any]) -> str:
+        """
+        Сохраняет описание вакансии.
+
+        Args:
+            vacancy_id (str): ID вакансии
+            body (Dict[str, Any]): Ответ API
+
+        Returns:
+            str: Хэш содержимого
+        """
+        payload = json.dumps(body, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        digest = hashlib.sha256(payload).hexdigest()
+        path = self._path(digest)
+        with self._lock:
+            if not os.path.exists(path):
+                tmp_name = f"{path}.{threading.get_ident()}.tmp"
+                with open(tmp_name, "wb") as file:
+                    file.write(payload)
+                os.replace(tmp_name, path)
+            if self._refs.get(str(vacancy_id)) != digest:
+                with open(self.refs_file, "a", encoding="utf-8") as file:
+                    file.write(json.dumps({"id": str(vacancy_id), "sha256": digest}) + "\n")
+                self._refs[str(vacancy_id)] = digest
+        return digest
+
+    def _load_refs(self) -> None:
+        """
+        Проигрывает журнал ссылок; при повторе ID действует последняя запись.
+        """
+        try:
+            with open(self.refs_file, "r", encoding="utf-8") as file:
+                lines = file.readlines()
+        except FileNotFoundError:
+            return
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # Оборванная последняя строка
+                continue
+            self._refs[entry["id"]] = entry["sha256"]
+
+    def _path(self, digest: str) -> str:
+        """
+        Возвращает путь к файлу с содержимым.
+
+        Args:
+            digest (str): Хэш содержимого
+
+        Returns:
+            str: Путь к файлу
+        """
+        return os.path.join(self.objects_dir, digest + ".json")
@@ -0,0 +1,245 @@
+from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+import threading
+import time
+
+from CAPI import Parser
+
+
+def normalize_record(vacancy: Dict[str, Any], source: str) -> Dict[str, Any]:
+    """
+    Приводит вакансию любого источника к общему виду записи.
+    Понимает формат ответа API hh.ru (alternate_url, salary-словарь, snippet)
+    и формат хранилища (url, salary-число, description или requirement).
+
+    Args:
+        vacancy (Dict[str, Any]): Вакансия источника
+        source (str): Имя источника
+
+    Returns:
+        Dict[str, Any]: Запись с полями id, name, url, salary, description, source
+    """
+    salary = vacancy.get("salary")
+    if isinstance(salary, dict):
+        salary = salary.get("to") or salary.get("from") or 0
+    elif not isinstance(salary, (int, float)):
+        salary = 0
+    description = vacancy.get("description")
+    if description is None:
+        description = vacancy.get("requirement")
+    if description is None:
+        description = (vacancy.get("snippet") or {}).get("requirement")
+    return {
+        "id": str(vacancy.get("id", "")),
+        "name": vacancy.get("name") or "",
+        "url": vacancy.get("url") or vacancy.get("alternate_url") or "",
+        "salary": salary,
+        "description": description or "",
+        "source": source,
+    }
+
+
+class SourceRegistry:
+    """
+    Реестр источников вакансий (реализаций Parser) с таймаутом для каждого.
+    """
+
+    def __init__(self):
+        """
+        Инициализация пустого реестра.
+        """
+        self._sources: Dict[str, Tuple[Parser, Optional[float]]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._sources
+
+    def register(self, name: str, source: Parser, timeout: Optional[float] = None) -> None:
+        """
+        Регистрирует источник.
+
+        Args:
+            name (str): Уникальное имя источника
+            source (Parser): Источник
+            timeout (Optional[float]): Таймаут поиска в секундах (None - таймаут поисковика)
+        """
+        if not isinstance(source, Parser):
+            raise TypeError(f"Источник {name} должен реализовывать Parser")
+        with self._lock:
+            if name in self._sources:
+                raise ValueError(f"Источник {name} уже зарегистрирован")
+            self._sources[name] = (source, timeout)
+
+    def unregister(self, name: str) -> bool:
+        """
+        Удаляет источник из реестра.
+
+        Args:
+            name (str): Имя источника
+
+        Returns:
+            bool: True если источник был зарегистрирован
+        """
+        with self._lock:
+            return self._sources.pop(name, None) is not None
+
+    def items(self) -> List[Tuple[str, Parser, Optional[float]]]:
+        """
+        Возвращает источники в порядке регистрации.
+
+        Returns:
+            List[Tuple[str, Parser, Optional[float]]]: Имя, источник и таймаут
+        """
+        with self._lock:
+            return [(name, source, timeout) for name, (source, timeout) in self._sources.items()]
+
+
+class FederatedSearcher:
+    """
+    Поиск по всем зарегистрированным источникам одновременно.
+    Для каждого поиска создаётся свой пул, в котором у каждого источника
+    свой поток, поэтому источники не ждут в очереди и таймаут источника
+    отсчитывается с момента, когда его поиск действительно начался.
+    Результат источника, не уложившегося в таймаут, отбрасывается, и поиск
+    возвращается без ожидания; такой источник считается зависшим (hung),
+    пока его поток не завершится, и в следующих поисках не опрашивается
+    (статус "busy"), чтобы зависшие источники не копили потоки.
+    Вакансии приводятся к общему виду и объединяются без повторов
+    (по URL, а без него - по источнику и ID).
+    """
+
+    def __init__(self, registry: SourceRegistry, timeout: float = 10.0):
+        """
+        Инициализация поисковика.
+
+        Args:
+            registry (SourceRegistry): Реестр источников
+            timeout (float): Таймаут источника по умолчанию в секундах
+        """
+        self.registry = registry
+        self.timeout = timeout
+        self.report: Dict[str, Dict[str, Any]] = {}
+        # Имя источника -> поиск, не уложившийся в таймаут и ещё не завершившийся
+        self._hung: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def hung(self) -> List[str]:
+        """
+        Источники, поиск в которых не уложился в таймаут и всё ещё выполняется.
+
+        Returns:
+            List[str]: Имена источников
+        """
+        with self._lock:
+            for name in [name for name, future in self._hung.items() if future.done()]:
+                del self._hung[name]
+            return list(self._hung)
+
+    def search(self, keyword: str, pages: int = 1) -> List[Dict[str, Any]]:
+        """
+        Ищет вакансии во всех источниках.
+        Итог по каждому источнику (статус ok, error, timeout или busy, число вакансий, время)
+        сохраняется в report.
+
+        Args:
+            keyword (str): Ключевое слово для поиска
+            pages (int): Количество страниц выдачи для источников со страницами
+
+        Returns:
+            List[Dict[str, Any]]: Объединённые вакансии в порядке регистрации источников
+        """
+        started = time.monotonic()
+        sources = self.registry.items()
+        hung = set(self.hung)
+        report: Dict[str, Dict[str, Any]] = {}
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        # Имя источника -> момент, когда его поиск начал выполняться
+        begun: Dict[str, float] = {}
+        pending: Dict[Future, Tuple[str, float]] = {}
+
+        active = [(name, source, timeout) for name, source, timeout in sources if name not in hung]
+        for name in hung & {name for name, _, _ in sources}:
+            report[name] = {"status": "busy", "count": 0, "seconds": 0.0, "error": None}
+        executor = ThreadPoolExecutor(max_workers=max(len(active), 1), thread_name_prefix="federation")
+        try:
+            for name, source, timeout in active:
+                future = executor.submit(self._timed_search, name, source, keyword, pages, begun)
+                pending[future] = (name, timeout if timeout is not None else self.timeout)
+
+            while pending:
+                now = time.monotonic()
+                deadlines = []
+                for future, (name, timeout) in list(pending.items()):
+                    if future.done():
+                        del pending[future]
+                        try:
+                            vacancies, seconds = future.result()
+                        except Exception as e:
+                            report[name] = {"status": "error", "count": 0, "seconds": now - started,
+                                            "error": str(e)}
+                            continue
+                        results[name] = vacancies
+                        report[name] = {"status": "ok", "count": len(vacancies), "seconds": seconds,
+                                        "error": None}
+                        continue
+                    # Пока поиск не начался, таймаут не отсчитывается
+                    deadline = begun.get(name, now) + timeout
+                    if now >= deadline:
+                        del pending[future]
+                        with self._lock:
+                            self._hung[name] = future
+                        report[name] = {"status": "timeout", "count": 0, "seconds": now - begun.get(name, now),
+                                        "error": None}
+                    else:
+                        deadlines.append(deadline)
+                if pending:
+                    wait(list(pending), timeout=max(0.0, min(deadlines) - time.monotonic()),
+                         return_when=FIRST_COMPLETED)
+        finally:
+            # Не ждать зависшие источники: их потоки завершатся сами
+            executor.shutdown(wait=False)
+
+        merged: Dict[Any, Dict[str, Any]] = {}
+        for name, _, _ in sources:
+            for vacancy in results.get(name, []):
+                record = normalize_record(vacancy, name)
+                key = record["url"] or (name, record["id"])
+                merged.setdefault(key, record)
+        self.report = {name: report[name] for name, _, _ in sources if name in report}
+        return list(merged.values())
+
+    def close(self) -> None:
+        """
+        Завершает работу поисковика. Пулы живут в пределах одного поиска,
+        поэтому закрывать нечего; зависшие источники завершаются сами.
+        """
+
+    def __enter__(self) -> 'FederatedSearcher':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @staticmethod
+    def _timed_search(name: str, source: Parser, keyword: str, pages: int,
+                      begun: Dict[str, float]) -> Tuple[List[Dict[str, Any]], float]:
+        """
+        Выполняет поиск в источнике и замеряет время.
+
+        Args:
+            name (str): Имя источника
+            source (Parser): Источник
+            keyword (str): Ключевое слово для поиска
+            pages (int): Количество страниц выдачи
+            begun (Dict[str, float]): Сюда записывается момент начала поиска
+
+        Returns:
+            Tuple[List[Dict[str, Any]], float]: Найденные вакансии и время в секундах
+        """
+        started = begun[name] = time.monotonic()
+        vacancies = source.search(keyword, pages)
+        return vacancies, time.monotonic() - started
@@ -0,0 +1,74 @@
+from typing import List, Dict, Any, Callable, Optional
+import time
+
+from CAPI import Parser
+from user_request import UserAsk
+
+
+class FileSource(Parser):
+    """
+    Источник вакансий на основе JSON-файла (формат new_vacancies.json).
+    Нужен для проверки поиска по нескольким источникам без сети;
+    задержка delay имитирует медленный источник.
+    """
+
+    def __init__(self, file_name: str, delay: float = 0.0, storage: Optional[UserAsk] = None):
+        """
+        Инициализация источника.
+
+        Args:
+            file_name (str): Файл с вакансиями
+            delay (float): Задержка ответа на поиск в секундах
+            storage (Optional[UserAsk]): Хранилище вакансий (по умолчанию сам файл источника)
+        """
+        self.file_name = file_name
+        self.delay = delay
+        self.file_worker = storage if storage is not None else UserAsk(file_name)
+
+    def add_vac(self, vacancy: Dict[str, Any]) -> None:
+        """
+        Добавляет вакансию в хранилище.
+
+        Args:
+            vacancy (Dict[str, Any]): Данные вакансии
+        """
+        self.file_worker.add_vacancy(vacancy)
+
+    def get_vac(self, criteria: Callable[[Dict[str, Any]], bool]) -> List[Dict[str, Any]]:
+        """
+        Получает вакансии по заданным критериям.
+
+        Args:
+            criteria (Callable[[Dict[str, Any]], bool]): Функция-критерий для фильтрации
+
+        Returns:
+            List[Dict[str, Any]]: Список найденных вакансий
+        """
+        return self.file_worker.get_vacancies(criteria)
+
+    def del_vac(self, vacancy_id: str) -> bool:
+        """
+        Удаляет вакансию по ID.
+
+        Args:
+            vacancy_id (str): ID вакансии
+
+        Returns:
+            bool: Результат удаления
+        """
+        return self.file_worker.delete_vacancy(vacancy_id)
+
+    def search(self, keyword: str, pages: int = 1) -> List[Dict[str, Any]]:
+        """
+        Ищет вакансии в файле по ключевому слову.
+
+        Args:
+            keyword (str): Ключевое слово для поиска
+            pages (int): Не используется (файл отдаётся целиком)
+
+        Returns:
+            List[Dict[str, Any]]: Найденные вакансии
+        """
+        if self.delay:
+            time.sleep(self.delay)
+        return self.file_worker.search_vac(keyword)
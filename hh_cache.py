@@ -0,0 +1,289 @@
+from typing import Dict, Any, Optional
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+class CacheEntry:
+    """
+    Сохранённый ответ API вместе с метаданными для повторной проверки.
+    """
+
+    def __init__(self, key: str, body: Any, stored_at: float,
+                 etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """
+        Инициализация записи кэша.
+
+        Args:
+            key (str): Ключ записи (хэш URL и параметров)
+            body (Any): Разобранное тело ответа
+            stored_at (float): Время сохранения или последней проверки (unix time)
+            etag (Optional[str]): Заголовок ETag ответа
+            last_modified (Optional[str]): Заголовок Last-Modified ответа
+        """
+        self.key = key
+        self.body = body
+        self.stored_at = stored_at
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def is_fresh(self, ttl: float) -> bool:
+        """
+        Проверяет, не истёк ли срок жизни записи.
+
+        Args:
+            ttl (float): Срок жизни в секундах
+
+        Returns:
+            bool: True если запись можно отдать без обращения к серверу
+        """
+        return time.time() - self.stored_at < ttl
+
+    def validators(self) -> Dict[str, str]:
+        """
+        Возвращает заголовки условного запроса для повторной проверки записи.
+
+        Returns:
+            Dict[str, str]: Заголовки If-None-Match / If-Modified-Since
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Дисковый кэш ответов API HeadHunter.
+    Ключ - URL и нормализованные параметры запроса, каждая запись хранится
+    в отдельном файле. Свежие записи (моложе ttl) отдаются без сети, устаревшие
+    проверяются условным запросом по ETag/Last-Modified. Общий размер
+    ограничен max_bytes, при превышении удаляются давно не использованные записи.
+    """
+
+    def __init__(self, directory: str, ttl: float = 3600, max_bytes: int = 50 * 1024 * 1024):
+        """
+        Инициализация кэша.
+
+        Args:
+            directory (str): Каталог для файлов кэша
+            ttl (float): Срок жизни записи в секундах
+            max_bytes (int): Максимальный суммарный размер файлов кэша
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._lock = threading.Lock()
+        # Ключ -> размер файла, в порядке от давно использованных к недавним
+        self._sizes: "OrderedDict[str, int]" = OrderedDict()
+        self._total = 0
+        os.makedirs(directory, exist_ok=True)
+        self._scan()
+
+    @staticmethod
+    def make_key(url: str, params: Dict[str, Any]) -> str:
+        """
+        Строит ключ кэша по URL и параметрам запроса.
+        Текст запроса приводится к нижнему регистру с единичными пробелами.
+
+        Args:
+            url (str): URL запроса
+            params (Dict[str, Any]): Параметры запроса
+
+        Returns:
+            str: Ключ записи
+        """
+        normalized = {name: str(value) for name, value in params.items()}
+        if "text" in normalized:
+            normalized["text"] = " ".join(normalized["text"].lower().split())
+        raw = json.dumps([url, sorted(normalized.items())], ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, url: str, params: Dict[str, Any]) -> Optional[CacheEntry]:
+        """
+        Возвращает запись кэша (свежую или устаревшую) либо None.
+        Свежая запись считается попаданием, устаревшая или отсутствующая - промахом.
+
+        Args:
+            url (str): URL запроса
+            params (Dict[str, Any]): Параметры запроса
+
+        Returns:
+            Optional[CacheEntry]: Запись кэша
+        """
+        key = self.make_key(url, params)
+        with self._lock:
+            if key not in self._sizes:
+                self.misses += 1
+                return None
+            try:
+                with open(self._path(key), "r", encoding="utf-8") as file:
+                    stored = json.load(file)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self._forget(key)
+                self.misses += 1
+                return None
+            self._touch(key)
+            entry = CacheEntry(key, stored["body"], stored["stored_at"],
+                               stored.get("etag"), stored.get("last_modified"))
+            if entry.is_fresh(self.ttl):
+                self.hits += 1
+            else:
+                self.misses += 1
+        return entry
+
+    def put(self, url: str, params: Dict[str, Any], body: Any,
+            etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """
+        Сохраняет ответ в кэш и при необходимости вытесняет старые записи.
+
+        Args:
+            url (str): URL запроса
+            params (Dict[str, Any]): Параметры запроса
+            body (Any): Разобранное тело ответа
+            etag (Optional[str]): Заголовок ETag ответа
+            last_modified (Optional[str]): Заголовок Last-Modified ответа
+        """
+        key = self.make_key(url, params)
+        self._write(CacheEntry(key, body, time.time(), etag, last_modified))
+
+    def refresh(self, entry: CacheEntry) -> None:
+        """
+        Продлевает срок жизни записи после ответа 304 Not Modified.
+
+        Args:
+            entry (CacheEntry): Подтверждённая сервером запись
+        """
+        entry.stored_at = time.time()
+        self._write(entry)
+        with self._lock:
+            self.revalidations += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Возвращает счётчики обращений к кэшу.
+
+        Returns:
+            Dict[str, int]: Попадания, промахи, повторные проверки, число записей и размер
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "entries": len(self._sizes),
+                "bytes": self._total,
+            }
+
+    def clear(self) -> None:
+        """
+        Удаляет все записи кэша.
+        """
+        with self._lock:
+            for key in list(self._sizes):
+                self._remove(key)
+
+    def _write(self, entry: CacheEntry) -> None:
+        """
+        Записывает запись в файл атомарно и учитывает её размер.
+
+        Args:
+            entry (CacheEntry): Запись кэша
+        """
+        payload = json.dumps({
+            "stored_at": entry.stored_at,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "body": entry.body,
+        }, ensure_ascii=False).encode("utf-8")
+
+        with self._lock:
+            path = self._path(entry.key)
+            tmp_name = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_name, "wb") as file:
+                file.write(payload)
+            os.replace(tmp_name, path)
+            self._forget(entry.key)
+            self._sizes[entry.key] = len(payload)
+            self._total += len(payload)
+            self._evict()
+
+    def _evict(self) -> None:
+        """
+        Удаляет давно не использованные записи, пока кэш больше max_bytes.
+        Последняя записанная запись не удаляется, даже если она одна больше лимита.
+        """
+        while self._total > self.max_bytes and len(self._sizes) > 1:
+            key = next(iter(self._sizes))
+            self._remove(key)
+
+    def _touch(self, key: str) -> None:
+        """
+        Отмечает запись как недавно использованную (в том числе для следующих запусков).
+
+        Args:
+            key (str): Ключ записи
+        """
+        self._sizes.move_to_end(key)
+        try:
+            os.utime(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _remove(self, key: str) -> None:
+        """
+        Удаляет запись с диска и из учёта.
+
+        Args:
+            key (str): Ключ записи
+        """
+        self._forget(key)
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _forget(self, key: str) -> None:
+        """
+        Убирает запись из учёта размеров.
+
+        Args:
+            key (str): Ключ записи
+        """
+        size = self._sizes.pop(key, None)
+        if size is not None:
+            self._total -= size
+
+    def _scan(self) -> None:
+        """
+        Загружает список записей с диска, упорядочивая их по времени последнего использования.
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            stat = os.stat(os.path.join(self.directory, name))
+            entries.append((stat.st_mtime, name[:-len(".json")], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._sizes[key] = size
+            self._total += size
+
+    def _path(self, key: str) -> str:
+        """
+        Возвращает путь к файлу записи.
+
+        Args:
+            key (str): Ключ записи
+
+        Returns:
+            str: Путь к файлу
+        """
+        return os.path.join(self.directory, key + ".json")
@@ -0,0 +1,354 @@
+"""
+Локальный имитатор API HeadHunter (/vacancies и /vacancies/{id}).
+
+Отдаёт синтетические вакансии, построенные по распределению названий,
+требований и зарплат из new_vacancies.json, с настраиваемой задержкой,
+разбросом задержки, ответами 429/5xx и ограничением глубины выдачи.
+Используется в тестах (фикстура hh_simulator в tests/conftest.py)
+и как отдельный процесс для замеров производительности HH:
+
+    python hh_simulator.py --port 8000 --latency 0.1 --jitter 0.05 --error-rate 0.01
+"""
+from typing import List, Dict, Any, Optional
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+import argparse
+import json
+import os
+import random
+import threading
+import time
+
+DEFAULT_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "new_vacancies.json")
+
+
+def parse_date(value: str) -> datetime:
+    """
+    Разбирает дату из параметров date_from/date_to.
+
+    Args:
+        value (str): Дата в формате ISO 8601
+
+    Returns:
+        datetime: Дата с часовым поясом (UTC, если пояс не указан)
+    """
+    for fmt in ("%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"):
+        try:
+            moment = datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+        return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+    raise ValueError(f"Некорректная дата: {value}")
+
+
+def build_corpus(count: int, source: str = DEFAULT_SOURCE, seed: int = 0,
+                 now: Optional[datetime] = None, days: int = 30) -> List[Dict[str, Any]]:
+    """
+    Строит синтетические вакансии в формате ответа API.
+    Названия, требования и зарплаты выбираются случайно из source, даты публикации
+    равномерно распределены за последние days дней (от новых к старым).
+
+    Args:
+        count (int): Количество вакансий
+        source (str): Файл с образцами вакансий
+        seed (int): Начальное значение генератора случайных чисел
+        now (Optional[datetime]): Дата самой свежей публикации
+        days (int): За сколько дней распределены публикации
+
+    Returns:
+        List[Dict[str, Any]]: Вакансии от новых к старым
+    """
+    with open(source, "r", encoding="utf-8") as file:
+        samples = json.load(file)
+    rng = random.Random(seed)
+    now = now or datetime.now(timezone.utc).replace(microsecond=0)
+    step = timedelta(days=days) / max(count, 1)
+
+    corpus = []
+    for number in range(count):
+        sample = rng.choice(samples)
+        salary = rng.choice(samples)["salary"]
+        vacancy_id = str(100000000 + number)
+        corpus.append({
+            "id": vacancy_id,
+            "name": sample["name"],
+            "alternate_url": f"https://hh.ru/vacancy/{vacancy_id}",
+            "salary": {"from": salary, "to": None, "currency": "RUR"} if salary else None,
+            "snippet": {"requirement": sample.get("requirement") or "", "responsibility": None},
+            "area": {"id": str(rng.choice([1, 2, 3])), "name": ""},
+            "published_at": (now - step * number).strftime("%Y-%m-%dT%H:%M:%S%z"),
+        })
+    return corpus
+
+
+class HHSimulator:
+    """
+    HTTP-сервер, имитирующий API HeadHunter.
+    Параметры (задержка, доля ошибок и т. д.) можно менять на ходу,
+    они читаются при каждом запросе.
+    """
+
+    def __init__(self, count: int = 2000, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, throttle_rate: float = 0.0, retry_after: Optional[float] = None,
+                 max_depth: int = 2000, filter_text: bool = False, seed: int = 0,
+                 source: str = DEFAULT_SOURCE, host: str = "127.0.0.1", port: int = 0):
+        """
+        Инициализация имитатора.
+
+        Args:
+            count (int): Количество синтетических вакансий
+            latency (float): Задержка ответа в секундах
+            jitter (float): Случайная добавка к задержке (от 0 до jitter секунд)
+            error_rate (float): Доля ответов 5xx
+            throttle_rate (float): Доля ответов 429
+            retry_after (Optional[float]): Значение Retry-After в ответах 429
+            max_depth (int): Глубина выдачи: page * per_page не может быть больше
+            filter_text (bool): Фильтровать вакансии по параметру text
+                (по умолчанию выдача одна и та же для любого запроса)
+            seed (int): Начальное значение генератора случайных чисел
+            source (str): Файл с образцами вакансий
+            host (str): Адрес сервера
+            port (int): Порт сервера (0 - любой свободный)
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.max_depth = max_depth
+        self.filter_text = filter_text
+        self.corpus = build_corpus(count, source, seed)
+        self.by_id = {vacancy["id"]: vacancy for vacancy in self.corpus}
+        self.requests = 0
+        self.statuses: Counter = Counter()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """
+        Адрес сервера.
+
+        Returns:
+            str: URL вида http://127.0.0.1:PORT
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def url(self) -> str:
+        """
+        Адрес поиска вакансий (значение для HH.url).
+
+        Returns:
+            str: URL /vacancies
+        """
+        return self.base_url + "/vacancies"
+
+    def start(self) -> 'HHSimulator':
+        """
+        Запускает сервер в фоновом потоке.
+
+        Returns:
+            HHSimulator: Этот же имитатор
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.05},
+                                        name="hh-simulator", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Останавливает сервер.
+        """
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def serve_forever(self) -> None:
+        """
+        Обслуживает запросы в текущем потоке (для запуска отдельным процессом).
+        """
+        self._server.serve_forever()
+
+    def __enter__(self) -> 'HHSimulator':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def search(self, query: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Формирует ответ поиска вакансий по параметрам запроса.
+
+        Args:
+            query (Dict[str, str]): Параметры запроса
+
+        Returns:
+            Dict[str, Any]: Ответ в формате API
+        """
+        per_page = int(query.get("per_page", 20))
+        page = int(query.get("page", 0))
+        found = self.corpus
+        if self.filter_text and query.get("text"):
+            words = query["text"].lower().split()
+            found = [vacancy for vacancy in found
+                     if all(word in (vacancy["name"] + " " + vacancy["snippet"]["requirement"]).lower()
+                            for word in words)]
+        if "area" in query:
+            found = [vacancy for vacancy in found if vacancy["area"]["id"] == query["area"]]
+        if "date_from" in query:
+            date_from = parse_date(query["date_from"])
+            found = [vacancy for vacancy in found if parse_date(vacancy["published_at"]) >= date_from]
+        if "date_to" in query:
+            date_to = parse_date(query["date_to"])
+            found = [vacancy for vacancy in found if parse_date(vacancy["published_at"]) <= date_to]
+
+        start = page * per_page
+        depth = min(len(found), self.max_depth)
+        return {
+            "items": found[start:min(start + per_page, depth)],
+            "found": len(found),
+            "pages": (depth + per_page - 1) // per_page,
+            "page": page,
+            "per_page": per_page,
+        }
+
+    def _make_handler(self):
+        """
+        Создаёт класс обработчика запросов, связанный с этим имитатором.
+
+        Returns:
+            type: Класс обработчика
+        """
+        simulator = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                simulator._handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def _handle(self, handler: BaseHTTPRequestHandler) -> None:
+        """
+        Обрабатывает запрос: задержка, внесение ошибок, ответ.
+
+        Args:
+            handler (BaseHTTPRequestHandler): Обработчик текущего запроса
+        """
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+            roll = self._rng.random()
+        if delay:
+            time.sleep(delay)
+
+        parsed = urlparse(handler.path)
+        query = {name: values[0] for name, values in parse_qs(parsed.query).items()}
+        headers = {}
+        if roll < self.throttle_rate:
+            status, body = 429, {"errors": [{"type": "too_many_requests"}]}
+            if self.retry_after is not None:
+                headers["Retry-After"] = str(self.retry_after)
+        elif roll < self.throttle_rate + self.error_rate:
+            status, body = 503, {"errors": [{"type": "service_unavailable"}]}
+        elif parsed.path == "/vacancies":
+            status, body = self._search_response(query)
+        elif parsed.path.startswith("/vacancies/"):
+            status, body = self._detail_response(parsed.path.rsplit("/", 1)[1])
+        else:
+            status, body = 404, {"errors": [{"type": "not_found"}]}
+
+        with self._lock:
+            self.statuses[status] += 1
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json; charset=utf-8")
+        handler.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+    def _search_response(self, query: Dict[str, str]) -> tuple:
+        """
+        Ответ /vacancies с проверкой глубины выдачи.
+
+        Args:
+            query (Dict[str, str]): Параметры запроса
+
+        Returns:
+            tuple: Код ответа и тело
+        """
+        try:
+            per_page = int(query.get("per_page", 20))
+            page = int(query.get("page", 0))
+        except ValueError:
+            return 400, {"errors": [{"type": "bad_argument"}]}
+        if (page + 1) * per_page > self.max_depth:
+            return 400, {"errors": [{"type": "bad_argument", "value": "page"}]}
+        return 200, self.search(query)
+
+    def _detail_response(self, vacancy_id: str) -> tuple:
+        """
+        Ответ /vacancies/{id}.
+
+        Args:
+            vacancy_id (str): ID вакансии
+
+        Returns:
+            tuple: Код ответа и тело
+        """
+        vacancy = self.by_id.get(vacancy_id)
+        if vacancy is None:
+            return 404, {"errors": [{"type": "not_found"}]}
+        detail = dict(vacancy)
+        detail["description"] = f"<p>{vacancy['snippet']['requirement']}</p>"
+        detail["key_skills"] = [{"name": word} for word in vacancy["name"].split()[:3]]
+        detail["experience"] = {"id": "between1And3", "name": "От 1 года до 3 лет"}
+        detail["employment"] = {"id": "full", "name": "Полная занятость"}
+        detail["employer"] = {"id": "1", "name": "Компания"}
+        return 200, detail
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--count", type=int, default=2000, help="количество вакансий")
+    parser.add_argument("--latency", type=float, default=0.0, help="задержка ответа, с")
+    parser.add_argument("--jitter", type=float, default=0.0, help="разброс задержки, с")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="доля ответов 5xx")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="доля ответов 429")
+    parser.add_argument("--retry-after", type=float, default=None, help="Retry-After в ответах 429, с")
+    parser.add_argument("--max-depth", type=int, default=2000, help="глубина выдачи")
+    parser.add_argument("--filter-text", action="store_true", help="фильтровать выдачу по text")
+    args = parser.parse_args()
+
+    simulator = HHSimulator(count=args.count, latency=args.latency, jitter=args.jitter,
+                            error_rate=args.error_rate, throttle_rate=args.throttle_rate,
+                            retry_after=args.retry_after, max_depth=args.max_depth,
+                            filter_text=args.filter_text, host=args.host, port=args.port)
+    print(f"Имитатор API HeadHunter: {simulator.url}")
+    try:
+        simulator.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        simulator.stop()
+
+
+if __name__ == "__main__":
+    main()
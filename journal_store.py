@@ -0,0 +1,496 @@
+from typing import List, Dict, Any, Callable, Iterable, Optional, Set, Tuple
+import json
+import os
+import uuid
+
+from user_request import UserAsk
+from morphology import vacancy_stems
+from vacancy_filter import Filter
+from pagination import paginate, take_sequence
+
+
+class JournalUserAsk(UserAsk):
+    """
+    Хранилище вакансий в виде append-only журнала (JSONL).
+    Добавление, изменение и удаление дописывают одну строку в конец файла,
+    удаление записывается как tombstone. При создании журнал
+    проигрывается в память, compact() переписывает только живые записи
+    в новый файл, первой строкой которого идёт поколение журнала (op "gen").
+    С morphology=True основы слов вакансии вычисляются при записи и хранятся
+    в строке журнала (поле stems), поэтому проигрывание не разбирает тексты заново.
+    Номер добавления вакансии (ключ постраничной выдачи) хранится в записи add
+    (поле seq), а следующий номер - в строке поколения, чтобы номера удалённых
+    вакансий не выдавались повторно после уплотнения.
+    Файл в прежнем формате (JSON-массив вакансий, как у UserAsk) при открытии
+    переводится в журнал. Нераспознанные строки не считаются мёртвыми:
+    пока они есть, журнал не уплотняется, чтобы не потерять данные.
+    """
+
+    def __init__(self, file_name: str, compact_ratio: float = 0.5, compact_min: int = 1000,
+                 morphology: bool = False):
+        """
+        Инициализация журнального хранилища.
+
+        Args:
+            file_name (str): Имя файла журнала
+            compact_ratio (float): Доля "мёртвых" строк, после которой журнал уплотняется
+            compact_min (int): Минимальное число мёртвых строк для автоматического уплотнения
+            morphology (bool): Искать в search_vac слова в любой форме (индекс словоформ
+                в памяти строится по основам из журнала)
+
+        Raises:
+            ValueError: Если файл - JSON-массив, который не удаётся прочитать как список вакансий
+        """
+        super().__init__(file_name, morphology=morphology)
+        self.compact_ratio = compact_ratio
+        self.compact_min = compact_min
+        self._live: Dict[str, Dict[str, Any]] = {}
+        # Номер последней проигранной записи add; номера в журнале строго возрастают
+        self._last_seq = -1
+        self._offset = 0
+        self._dead = 0
+        # Строки, которые не удалось разобрать; уплотнение их бы потеряло
+        self._unreadable = 0
+        self._last_unreadable = False
+        # Файл (устройство, inode) и поколение журнала, из которых прочитано _offset байт
+        self._identity: Optional[Tuple[int, int]] = None
+        self._generation: Optional[str] = None
+        self._import_legacy()
+        self._replay()
+
+    def add_vacancy(self, vacancy: Dict[str, Any]) -> None:
+        """
+        Дописывает вакансию в журнал, если её ещё нет в хранилище.
+
+        Args:
+            vacancy (Dict[str, Any]): Словарь с данными вакансии
+        """
+        self._refresh()
+        vacancy_dict = self._make_record(vacancy)
+        if vacancy_dict["id"] in self._live:
+            return
+        self._number(vacancy_dict)
+        entry = self._add_entry(vacancy_dict)
+        self._append([entry])
+        self._set_live(vacancy_dict, entry.get("stems"))
+
+    def add_vacancies(self, vacancies: Iterable[Dict[str, Any]]) -> None:
+        """
+        Дописывает пачку вакансий в журнал одной операцией записи.
+
+        Args:
+            vacancies (Iterable[Dict[str, Any]]): Вакансии для добавления
+        """
+        self._refresh()
+        batch: Dict[str, Dict[str, Any]] = {}
+        for vacancy in vacancies:
+            vacancy_dict = self._make_record(vacancy)
+            if vacancy_dict["id"] not in self._live and vacancy_dict["id"] not in batch:
+                self._number(vacancy_dict)
+                batch[vacancy_dict["id"]] = vacancy_dict
+        if not batch:
+            return
+        entries = [self._add_entry(vacancy_dict) for vacancy_dict in batch.values()]
+        self._append(entries)
+        for entry in entries:
+            self._set_live(entry["vacancy"], entry.get("stems"))
+
+    def update_vacancies(self, updates: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Дописывает в журнал изменения полей вакансий одной операцией записи.
+
+        Args:
+            updates (Dict[str, Dict[str, Any]]): ID вакансии -> поля для добавления или замены
+
+        Returns:
+            int: Количество обновлённых вакансий
+        """
+        self._refresh()
+        entries, merged = [], []
+        for vacancy_id, fields in updates.items():
+            if vacancy_id not in self._live or not fields:
+                continue
+            entry = {"op": "upd", "id": vacancy_id, "fields": fields}
+            vacancy = self._merge_fields(self._live[vacancy_id], fields)
+            # Основы меняются только вместе с названием или требованиями
+            if self.stem_index is not None and ("name" in fields or "requirement" in fields):
+                entry["stems"] = sorted(vacancy_stems(vacancy))
+            entries.append(entry)
+            merged.append(vacancy)
+        if not entries:
+            return 0
+        self._append(entries)
+        for entry, vacancy in zip(entries, merged):
+            self._set_live(vacancy, entry.get("stems"))
+        # После уплотнения изменения сольются с записями add
+        self._dead += len(entries)
+        self._maybe_compact()
+        return len(entries)
+
+    def get_vacancies(self, criteria: Callable[[Dict[str, Any]], bool], limit: Optional[int] = None,
+                      cursor: Optional[str] = None, order: str = "insertion") -> List[Dict[str, Any]]:
+        """
+        Получает вакансии, соответствующие заданным критериям.
+
+        Args:
+            criteria (Callable[[Dict[str, Any]], bool]): Функция-критерий для фильтрации вакансий
+                или Filter (критерий по ID отвечается из словаря живых записей)
+            limit (Optional[int]): Размер страницы (None - все вакансии списком)
+            cursor (Optional[str]): Курсор предыдущей страницы
+            order (str): Порядок страниц: insertion или salary
+
+        Returns:
+            List[Dict[str, Any]]: Список отфильтрованных вакансий или Page
+        """
+        self._refresh()
+        vacancies = list(self._live.values())
+        if limit is not None:
+            return paginate(vacancies, self._sequence, self._page_predicate(criteria, len(vacancies)),
+                            limit, cursor, order)
+        if isinstance(criteria, Filter):
+            plan = self.planner.plan_filter(criteria, len(vacancies))
+            return self._execute_filter(plan, vacancies, criteria, plan.candidates())
+        return self._scan(vacancies, criteria)
+
+    def existing_ids(self, ids: Iterable[str]) -> Set[str]:
+        """
+        Проверяет, какие из ID уже есть в журнале.
+
+        Args:
+            ids (Iterable[str]): ID вакансий
+
+        Returns:
+            Set[str]: ID, которые есть в хранилище
+        """
+        self._refresh()
+        return {vacancy_id for vacancy_id in ids if vacancy_id in self._live}
+
+    def delete_vacancy(self, vacancy_id: str) -> bool:
+        """
+        Записывает tombstone для вакансии.
+
+        Args:
+            vacancy_id (str): ID вакансии для удаления
+
+        Returns:
+            bool: True если вакансия была удалена, False если не найдена
+        """
+        self._refresh()
+        if vacancy_id not in self._live:
+            return False
+        self._append([{"op": "del", "id": vacancy_id}])
+        self._drop_live(vacancy_id)
+        # Сама запись add и её tombstone больше не нужны
+        self._dead += 2
+        self._maybe_compact()
+        return True
+
+    def compact(self) -> None:
+        """
+        Переписывает журнал, оставляя только живые вакансии.
+        Запись идёт во временный файл с атомарной заменой.
+
+        Raises:
+            ValueError: Если в журнале есть нераспознанные строки (они были бы потеряны)
+        """
+        self._refresh()
+        if self._unreadable:
+            raise ValueError(f"В журнале {self.file_name} есть нераспознанные строки "
+                             f"({self._unreadable}), уплотнение их бы удалило")
+        generation = self._write_journal(self._live.values(), self._sequence, self._next_seq)
+        stat = os.stat(self.file_name)
+        self._identity = (stat.st_dev, stat.st_ino)
+        self._generation = generation
+        self._offset = stat.st_size
+        self._dead = 0
+
+    def _write_journal(self, vacancies: Iterable[Dict[str, Any]], sequence: Dict[str, int],
+                       next_seq: int) -> str:
+        """
+        Атомарно заменяет файл журналом из строки поколения и записей add.
+
+        Args:
+            vacancies (Iterable[Dict[str, Any]]): Записи вакансий
+            sequence (Dict[str, int]): ID вакансии -> номер добавления
+            next_seq (int): Номер для следующей новой вакансии
+
+        Returns:
+            str: Поколение нового журнала
+        """
+        generation = uuid.uuid4().hex
+        tmp_name = self.file_name + ".tmp"
+        with open(tmp_name, "w", encoding="utf-8") as file:
+            file.write(self._dump_line({"op": "gen", "gen": generation, "next": next_seq}))
+            for vacancy in vacancies:
+                file.write(self._dump_line(self._add_entry(vacancy, sequence[vacancy["id"]])))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_name, self.file_name)
+        return generation
+
+    def _import_legacy(self) -> None:
+        """
+        Переводит файл в прежнем формате (JSON-массив вакансий) в журнал.
+        Повторы ID отбрасываются, как при add_vacancies.
+
+        Raises:
+            ValueError: Если массив не удаётся прочитать как список вакансий
+        """
+        try:
+            with open(self.file_name, "rb") as file:
+                head = file.read(64).lstrip()
+        except FileNotFoundError:
+            return
+        if not head.startswith(b"["):
+            return
+        try:
+            with open(self.file_name, "r", encoding="utf-8") as file:
+                vacancies = json.load(file)
+        except (ValueError, UnicodeDecodeError) as e:
+            raise ValueError(f"Файл {self.file_name} не является журналом "
+                             f"и не читается как список вакансий: {e}")
+        if not isinstance(vacancies, list) or \
+                not all(isinstance(vacancy, dict) and "id" in vacancy for vacancy in vacancies):
+            raise ValueError(f"Файл {self.file_name} не является журналом и не содержит список вакансий")
+        records: Dict[str, Dict[str, Any]] = {}
+        for vacancy in vacancies:
+            records.setdefault(vacancy["id"], vacancy)
+        sequence, next_seq = take_sequence(records.values())
+        self._write_journal(records.values(), sequence, next_seq)
+
+    def _records_by_id(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Возвращает живые записи журнала без копирования.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: ID -> запись вакансии
+        """
+        self._refresh()
+        return self._live
+
+    def _append(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        Дописывает записи в конец журнала одной операцией записи.
+
+        Args:
+            entries (List[Dict[str, Any]]): Записи журнала
+        """
+        payload = "".join(self._dump_line(entry) for entry in entries)
+        if os.path.exists(self.file_name) and os.path.getsize(self.file_name) > self._offset:
+            # Отделяем оборванную строку, чтобы не склеить её с новой записью, и помечаем
+            # её как мёртвую: без пометки при проигрывании она считалась бы нераспознанной
+            payload = "\n" + self._dump_line({"op": "torn"}) + payload
+            self._dead += 2
+        with open(self.file_name, "a", encoding="utf-8") as file:
+            file.write(payload)
+        stat = os.stat(self.file_name)
+        self._identity = (stat.st_dev, stat.st_ino)
+        self._offset = stat.st_size
+
+    def _replay(self) -> None:
+        """
+        Полностью проигрывает журнал с начала файла.
+        """
+        self._reset()
+        self._refresh()
+
+    def _reset(self) -> None:
+        """
+        Очищает живой набор вакансий перед проигрыванием журнала с начала.
+        """
+        self._live = {}
+        self._sequence = {}
+        self._next_seq = 0
+        self._last_seq = -1
+        self._offset = 0
+        self._dead = 0
+        self._unreadable = 0
+        self._last_unreadable = False
+        self._generation = None
+        if self.stem_index is not None:
+            self.stem_index.rebuild([])
+
+    def _refresh(self) -> None:
+        """
+        Дочитывает строки, дописанные в журнал после последнего чтения.
+        Если журнал уплотнил другой процесс, он проигрывается заново, даже когда
+        новый файл уже дорос до прежнего смещения: уплотнение заменяет файл
+        (меняется inode) и записывает новое поколение в первую строку, которое
+        сверяется при каждом дочитывании (на случай повторно выданного inode).
+        """
+        try:
+            stat = os.stat(self.file_name)
+        except FileNotFoundError:
+            self._reset()
+            self._identity = None
+            return
+
+        identity = (stat.st_dev, stat.st_ino)
+        if identity != self._identity or stat.st_size < self._offset:
+            self._reset()
+            self._identity = identity
+        if stat.st_size == self._offset:
+            return
+
+        with open(self.file_name, "rb") as file:
+            if self._offset and self._read_generation(file) != self._generation:
+                self._reset()
+            file.seek(self._offset)
+            chunk = file.read()
+
+        # Незавершённая последняя строка (запись оборвалась) дочитается позже
+        end = chunk.rfind(b"\n") + 1
+        for line in chunk[:end].splitlines():
+            self._apply(line)
+        self._offset += end
+
+    def _apply(self, line: bytes) -> None:
+        """
+        Применяет одну строку журнала к живому набору вакансий.
+
+        Args:
+            line (bytes): Строка журнала
+        """
+        try:
+            entry = json.loads(line.decode("utf-8"))
+        except (ValueError, UnicodeDecodeError):
+            entry = None
+        if not isinstance(entry, dict) or entry.get("op") not in ("gen", "add", "upd", "del", "torn"):
+            self._unreadable += 1
+            self._last_unreadable = True
+            return
+
+        torn = self._last_unreadable
+        self._last_unreadable = False
+        if entry["op"] == "torn":
+            # Пометка об оборванной строке: она и сама пометка больше не нужны
+            if torn:
+                self._unreadable -= 1
+                self._dead += 1
+            self._dead += 1
+        elif entry["op"] == "gen":
+            self._generation = entry.get("gen")
+            if isinstance(entry.get("next"), int):
+                self._next_seq = max(self._next_seq, entry["next"])
+        elif entry["op"] == "add":
+            vacancy = entry["vacancy"]
+            if vacancy["id"] in self._live:
+                # Повторное добавление не меняет место вакансии в выдаче
+                self._dead += 1
+            else:
+                seq = entry.get("seq")
+                if not isinstance(seq, int) or isinstance(seq, bool) or seq <= self._last_seq:
+                    seq = self._next_seq
+                self._sequence[vacancy["id"]] = seq
+                self._last_seq = seq
+                self._next_seq = max(self._next_seq, seq + 1)
+            self._set_live(vacancy, entry.get("stems"))
+        elif entry["op"] == "upd":
+            if entry["id"] in self._live:
+                fields = entry["fields"]
+                stems = entry.get("stems")
+                if stems is None and self.stem_index is not None and \
+                        "name" not in fields and "requirement" not in fields:
+                    stems = self.stem_index.stems_of(entry["id"])
+                self._set_live(self._merge_fields(self._live[entry["id"]], fields), stems)
+            self._dead += 1
+        elif entry["op"] == "del":
+            if self._drop_live(entry["id"]):
+                self._dead += 1
+            self._dead += 1
+
+    def _add_entry(self, vacancy: Dict[str, Any], seq: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Формирует запись журнала о добавлении вакансии; с morphology=True
+        в неё сохраняются основы слов вакансии.
+
+        Args:
+            vacancy (Dict[str, Any]): Запись вакансии
+            seq (Optional[int]): Номер добавления (None - номер из _sequence)
+
+        Returns:
+            Dict[str, Any]: Запись журнала
+        """
+        entry: Dict[str, Any] = {"op": "add", "vacancy": vacancy,
+                                 "seq": self._sequence[vacancy["id"]] if seq is None else seq}
+        if self.stem_index is not None:
+            # Живая запись (при уплотнении) уже разобрана, новая разбирается здесь
+            stems = self.stem_index.stems_of(vacancy["id"]) if self._live.get(vacancy["id"]) is vacancy else None
+            entry["stems"] = sorted(stems if stems is not None else vacancy_stems(vacancy))
+        return entry
+
+    def _set_live(self, vacancy: Dict[str, Any], stems: Optional[Iterable[str]] = None) -> None:
+        """
+        Заменяет живую запись вакансии и её основы в индексе словоформ.
+
+        Args:
+            vacancy (Dict[str, Any]): Запись вакансии
+            stems (Optional[Iterable[str]]): Основы из журнала (None - вычислить по тексту)
+        """
+        if self.stem_index is not None:
+            previous = self._live.get(vacancy["id"])
+            if previous is not None:
+                self.stem_index.remove(previous)
+            self.stem_index.add(vacancy, stems)
+        self._live[vacancy["id"]] = vacancy
+
+    def _drop_live(self, vacancy_id: str) -> bool:
+        """
+        Удаляет живую запись вакансии и её основы из индекса словоформ.
+
+        Args:
+            vacancy_id (str): ID вакансии
+
+        Returns:
+            bool: True если вакансия была в живом наборе
+        """
+        vacancy = self._live.pop(vacancy_id, None)
+        if vacancy is None:
+            return False
+        if self.stem_index is not None:
+            self.stem_index.remove(vacancy)
+        return True
+
+    @staticmethod
+    def _read_generation(file: Any) -> Optional[str]:
+        """
+        Читает поколение журнала из его первой строки.
+
+        Args:
+            file: Файл журнала, открытый на чтение в двоичном режиме
+
+        Returns:
+            Optional[str]: Поколение или None, если журнал ещё не уплотнялся
+        """
+        file.seek(0)
+        line = file.readline(256)
+        if not line.startswith(b'{"op": "gen"'):
+            return None
+        try:
+            return json.loads(line.decode("utf-8")).get("gen")
+        except (ValueError, UnicodeDecodeError):
+            return None
+
+    def _maybe_compact(self) -> None:
+        """
+        Уплотняет журнал, если мёртвых строк стало слишком много.
+        Пока в журнале есть нераспознанные строки, уплотнение не выполняется.
+        """
+        if self._unreadable:
+            return
+        total = len(self._live) + self._dead
+        if self._dead >= self.compact_min and self._dead >= total * self.compact_ratio:
+            self.compact()
+
+    @staticmethod
+    def _dump_line(entry: Dict[str, Any]) -> str:
+        """
+        Сериализует запись журнала в одну строку JSONL.
+
+        Args:
+            entry (Dict[str, Any]): Запись журнала
+
+        Returns:
+            str: Строка с завершающим переводом строки
+        """
+        return json.dumps(entry, ensure_ascii=False) + "\n"
@@ -24,6 +24,53 @@ class JSONVacancy:
         with open(self.file_name, "w") as file:
             json.dump(data, file, indent=4)
 
+    def add_vacancies(self, vacancies):
+        try:
+            with open(self.file_name, "r") as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            data = []
+
+        seen = {vacancy.get("id") for vacancy in data}
+        added = 0
+        for vacancy in vacancies:
+            if vacancy["id"] in seen:
+                continue
+            seen.add(vacancy["id"])
+            added += 1
+            data.append({
+                "id": vacancy["id"],
+                "name": vacancy["name"],
+                "url": vacancy["url"],
+                "salary": vacancy["salary"],
+                "description": vacancy["description"],
+            })
+
+        if not added:
+            return
+        with open(self.file_name, "w") as file:
+            json.dump(data, file, indent=4)
+
+    def update_vacancies(self, updates):
+        try:
+            with open(self.file_name, "r") as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return 0
+
+        updated = 0
+        for vacancy in data:
+            fields = updates.get(vacancy.get("id"))
+            if not fields:
+                continue
+            vacancy.update({name: value for name, value in fields.items() if name != "id"})
+            updated += 1
+
+        if updated:
+            with open(self.file_name, "w") as file:
+                json.dump(data, file, indent=4)
+        return updated
+
     def get_vacancies(self, criteria):
         try:
             with open(self.file_name, "r") as file:
@@ -0,0 +1,214 @@
+from typing import List, Dict, Any, Iterable, Optional, Set
+import json
+import os
+import re
+
+TOKEN_RE = re.compile(r"\w+")
+INDEX_VERSION = 1
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    Разбивает текст на слова в нижнем регистре.
+
+    Args:
+        text (Optional[str]): Исходный текст
+
+    Returns:
+        List[str]: Список слов
+    """
+    return TOKEN_RE.findall((text or "").lower())
+
+
+def file_signature(file_name: str) -> Optional[List[int]]:
+    """
+    Возвращает подпись файла (время изменения и размер) для проверки актуальности индекса.
+
+    Args:
+        file_name (str): Имя файла
+
+    Returns:
+        Optional[List[int]]: Подпись файла или None, если файла нет
+    """
+    try:
+        stat = os.stat(file_name)
+    except FileNotFoundError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+class KeywordIndex:
+    """
+    Инвертированный индекс слов названия и требований вакансии: слово -> множество ID.
+    Хранится рядом с файлом данных вместе с подписью этого файла,
+    чтобы при повторном запуске не перестраивать его заново.
+    """
+
+    version = INDEX_VERSION
+
+    def __init__(self, file_name: str):
+        """
+        Инициализация индекса.
+
+        Args:
+            file_name (str): Имя файла, в котором сохраняется индекс
+        """
+        self.file_name = file_name
+        self.postings: Dict[str, Set[str]] = {}
+
+    def add(self, vacancy: Dict[str, Any]) -> None:
+        """
+        Добавляет слова вакансии в индекс.
+
+        Args:
+            vacancy (Dict[str, Any]): Запись вакансии
+        """
+        for token in self._vacancy_tokens(vacancy):
+            self.postings.setdefault(token, set()).add(vacancy["id"])
+
+    def remove(self, vacancy: Dict[str, Any]) -> None:
+        """
+        Удаляет слова вакансии из индекса.
+
+        Args:
+            vacancy (Dict[str, Any]): Запись вакансии
+        """
+        for token in self._vacancy_tokens(vacancy):
+            ids = self.postings.get(token)
+            if ids is None:
+                continue
+            ids.discard(vacancy["id"])
+            if not ids:
+                del self.postings[token]
+
+    def rebuild(self, vacancies: Iterable[Dict[str, Any]]) -> None:
+        """
+        Строит индекс заново по всем вакансиям.
+
+        Args:
+            vacancies (Iterable[Dict[str, Any]]): Записи вакансий
+        """
+        self.postings = {}
+        for vacancy in vacancies:
+            self.add(vacancy)
+
+    def candidates(self, keyword: str) -> Optional[Set[str]]:
+        """
+        Возвращает ID вакансий, которые могут содержать ключевое слово.
+        Слова запроса, окружённые другими символами запроса, ищутся точно;
+        крайние слова могут быть частью слова в тексте, поэтому для них
+        просматривается словарь индекса (но не сами вакансии).
+        Результат - пересечение списков, найденные вакансии нужно проверить точным сравнением.
+
+        Args:
+            keyword (str): Ключевое слово или фраза
+
+        Returns:
+            Optional[Set[str]]: Множество ID или None, если в запросе нет слов
+        """
+        needle = keyword.lower()
+        matches = list(TOKEN_RE.finditer(needle))
+        if not matches:
+            return None
+
+        postings_lists = []
+        for match in matches:
+            token = match.group()
+            open_left = match.start() == 0
+            open_right = match.end() == len(needle)
+            if not open_left and not open_right:
+                ids = self.postings.get(token, set())
+            else:
+                ids = set()
+                for word in self._expand(token, open_left, open_right):
+                    ids |= self.postings[word]
+            if not ids:
+                return set()
+            postings_lists.append(ids)
+
+        postings_lists.sort(key=len)
+        result = set(postings_lists[0])
+        for ids in postings_lists[1:]:
+            result &= ids
+            if not result:
+                break
+        return result
+
+    def load(self, signature: Optional[List[int]]) -> bool:
+        """
+        Загружает индекс с диска, если он построен для файла данных с такой подписью.
+
+        Args:
+            signature (Optional[List[int]]): Текущая подпись файла данных
+
+        Returns:
+            bool: True если индекс загружен
+        """
+        try:
+            with open(self.file_name, "r", encoding="utf-8") as file:
+                stored = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return False
+
+        if stored.get("version") != self.version or stored.get("signature") != signature:
+            return False
+        self.postings = {token: set(ids) for token, ids in stored["postings"].items()}
+        return True
+
+    def dump(self) -> Dict[str, List[str]]:
+        """
+        Возвращает копию индекса, пригодную для сериализации.
+
+        Returns:
+            Dict[str, List[str]]: Слово -> список ID
+        """
+        return {token: sorted(ids) for token, ids in self.postings.items()}
+
+    def save(self, signature: Optional[List[int]], postings: Optional[Dict[str, List[str]]] = None) -> None:
+        """
+        Сохраняет индекс на диск вместе с подписью файла данных.
+
+        Args:
+            signature (Optional[List[int]]): Подпись файла данных, для которого построен индекс
+            postings (Optional[Dict[str, List[str]]]): Заранее снятая копия индекса (по умолчанию - текущий)
+        """
+        state = {
+            "version": self.version,
+            "signature": signature,
+            "postings": postings if postings is not None else self.dump(),
+        }
+        tmp_name = self.file_name + ".tmp"
+        with open(tmp_name, "w", encoding="utf-8") as file:
+            json.dump(state, file, ensure_ascii=False)
+        os.replace(tmp_name, self.file_name)
+
+    def _expand(self, token: str, open_left: bool, open_right: bool) -> List[str]:
+        """
+        Находит слова словаря, в которые может входить крайнее слово запроса.
+
+        Args:
+            token (str): Слово запроса
+            open_left (bool): Слово стоит в начале запроса (может быть окончанием слова текста)
+            open_right (bool): Слово стоит в конце запроса (может быть началом слова текста)
+
+        Returns:
+            List[str]: Подходящие слова словаря
+        """
+        if open_left and open_right:
+            return [word for word in self.postings if token in word]
+        if open_left:
+            return [word for word in self.postings if word.endswith(token)]
+        return [word for word in self.postings if word.startswith(token)]
+
+    @staticmethod
+    def _vacancy_tokens(vacancy: Dict[str, Any]) -> Set[str]:
+        """
+        Возвращает множество слов названия и требований вакансии.
+
+        Args:
+            vacancy (Dict[str, Any]): Запись вакансии
+
+        Returns:
+            Set[str]: Множество слов
+        """
+        return set(tokenize(vacancy.get("name"))) | set(tokenize(vacancy.get("requirement")))
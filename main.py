@@ -1,6 +1,10 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
+import os
 from user_request import UserAsk
+from resident_store import ResidentUserAsk
+from sqlite_store import SQLiteUserAsk
 from CV import Sort_Vacan
+from pagination import Page
 
 
 def print_vacancy(vacancy: Dict[str, Any]) -> None:
@@ -22,13 +26,76 @@ def print_vacancy(vacancy: Dict[str, Any]) -> None:
     print("=" * 50)
 
 
+def show_pages(page: Page, fetch_page: Callable[[str], Page]) -> int:
+    """
+    Выводит результаты постранично: следующая страница запрашивается
+    у хранилища только по желанию пользователя.
+
+    Args:
+        page (Page): Первая страница
+        fetch_page (Callable[[str], Page]): Функция курсор -> следующая страница
+
+    Returns:
+        int: Число показанных вакансий
+    """
+    shown = 0
+    while True:
+        for vac in page:
+            print_vacancy(vac)
+        shown += len(page)
+        if page.next_cursor is None:
+            return shown
+        if not input(f"Показано {shown}. Показать ещё? (да/нет) ").lower().startswith('д'):
+            return shown
+        page = fetch_page(page.next_cursor)
+
+
+# Размер страницы результатов поиска в меню
+PAGE_SIZE = 10
+
+# Доступные хранилища: имя движка -> (класс, файл по умолчанию)
+STORAGE_ENGINES = {
+    "json": (ResidentUserAsk, "new_vacancies.json"),
+    "sqlite": (SQLiteUserAsk, "vacancies.db"),
+}
+
+
+def make_storage(engine: str = "json", file_name: Optional[str] = None) -> UserAsk:
+    """
+    Создаёт хранилище вакансий выбранного движка.
+
+    Args:
+        engine (str): Имя движка из STORAGE_ENGINES
+        file_name (Optional[str]): Имя файла (по умолчанию - файл движка)
+
+    Returns:
+        UserAsk: Хранилище вакансий
+    """
+    if engine not in STORAGE_ENGINES:
+        raise ValueError(f"Неизвестное хранилище: {engine}")
+    storage_class, default_file = STORAGE_ENGINES[engine]
+    return storage_class(file_name or default_file)
+
+
 def main():
     """
     Основная функция программы, обеспечивающая взаимодействие с пользователем.
+    Движок хранилища выбирается переменной окружения VACANCY_STORAGE (json или sqlite).
     """
-    file_name = "new_vacancies.json"
-    user_ask = UserAsk(file_name)
+    user_ask = make_storage(os.environ.get("VACANCY_STORAGE", "json"))
+    try:
+        run_menu(user_ask)
+    finally:
+        user_ask.close()
 
+
+def run_menu(user_ask: UserAsk) -> None:
+    """
+    Цикл меню: читает действия пользователя и выполняет их над хранилищем.
+
+    Args:
+        user_ask (UserAsk): Хранилище вакансий
+    """
     while True:
         print("\nМенеджер вакансий HH.ru")
         print("1. Добавить вакансию")
@@ -63,11 +130,10 @@ def main():
 
             elif choice == '2':
                 keyword = input("Введите ключевое слово для поиска: ")
-                results = user_ask.search_vac(keyword)
+                results = user_ask.search_vac(keyword, limit=PAGE_SIZE)
                 if results:
                     print("\nНайденные вакансии:")
-                    for vac in results:
-                        print_vacancy(vac)
+                    show_pages(results, lambda cursor: user_ask.search_vac(keyword, limit=PAGE_SIZE, cursor=cursor))
                 else:
                     print("Вакансии не найдены.")
 
@@ -0,0 +1,304 @@
+from typing import List, Dict, Any, FrozenSet, Iterable, Optional, Set, Tuple
+import functools
+import re
+
+from keyword_index import KeywordIndex, TOKEN_RE
+
+VOWELS = "аеиоуыэюя"
+CYRILLIC_RE = re.compile(r"[а-я]")
+
+# Окончания алгоритма Snowball для русского языка. Окончания из первых
+# кортежей пар отсекаются, только если перед ними стоит "а" или "я".
+PERFECTIVE_GERUND = (
+    ("в", "вши", "вшись"),
+    ("ив", "ивши", "ившись", "ыв", "ывши", "ывшись"),
+)
+ADJECTIVE = ("ее", "ие", "ые", "ое", "ими", "ыми", "ей", "ий", "ый", "ой", "ем", "им", "ым", "ом",
+             "его", "ого", "ему", "ому", "их", "ых", "ую", "юю", "ая", "яя", "ою", "ею")
+PARTICIPLE = (
+    ("ем", "нн", "вш", "ющ", "щ"),
+    ("ивш", "ывш", "ующ"),
+)
+REFLEXIVE = ("ся", "сь")
+VERB = (
+    ("ла", "на", "ете", "йте", "ли", "й", "л", "ем", "н", "ло", "но", "ет", "ют", "ны", "ть", "ешь", "нно"),
+    ("ила", "ыла", "ена", "ейте", "уйте", "ите", "или", "ыли", "ей", "уй", "ил", "ыл", "им", "ым", "ен",
+     "ило", "ыло", "ено", "ят", "ует", "уют", "ит", "ыт", "ены", "ить", "ыть", "ишь", "ую", "ю"),
+)
+NOUN = ("а", "ев", "ов", "ие", "ье", "е", "иями", "ями", "ами", "еи", "ии", "и", "ией", "ей", "ой", "ий",
+        "й", "иям", "ям", "ием", "ем", "ам", "ом", "о", "у", "ах", "иях", "ях", "ы", "ь", "ию", "ью", "ю",
+        "ия", "ья", "я")
+DERIVATIONAL = ("ост", "ость")
+SUPERLATIVE = ("ейш", "ейше")
+
+
+def fold(text: Optional[str]) -> str:
+    """
+    Приводит текст к виду для сравнения слов: без учёта регистра, "ё" как "е".
+
+    Args:
+        text (Optional[str]): Исходный текст
+
+    Returns:
+        str: Нормализованный текст
+    """
+    return (text or "").casefold().replace("ё", "е")
+
+
+@functools.lru_cache(maxsize=65536)
+def stem(word: str) -> str:
+    """
+    Возвращает основу слова по алгоритму Snowball для русского языка:
+    отсекаются окончания деепричастий, прилагательных и причастий, глаголов
+    и существительных, затем суффиксы "ость" и превосходной степени.
+    Слова без кириллицы возвращаются как есть.
+
+    Args:
+        word (str): Слово
+
+    Returns:
+        str: Основа слова ("менеджеров" -> "менеджер")
+    """
+    word = fold(word)
+    if not CYRILLIC_RE.search(word):
+        return word
+    rv, r2 = _regions(word)
+
+    result = _strip(word, rv, *PERFECTIVE_GERUND)
+    if result is None:
+        reflexive = _strip(word, rv, (), REFLEXIVE)
+        if reflexive is not None:
+            word = reflexive
+        adjective = _strip(word, rv, (), ADJECTIVE)
+        if adjective is not None:
+            participle = _strip(adjective, rv, *PARTICIPLE)
+            result = participle if participle is not None else adjective
+        else:
+            result = _strip(word, rv, *VERB)
+            if result is None:
+                result = _strip(word, rv, (), NOUN)
+    word = result if result is not None else word
+
+    if word.endswith("и") and len(word) - 1 >= rv:
+        word = word[:-1]
+    derivational = _strip(word, r2, (), DERIVATIONAL)
+    if derivational is not None:
+        word = derivational
+
+    superlative = _strip(word, rv, (), SUPERLATIVE)
+    if superlative is not None:
+        word = superlative
+    if word.endswith("нн") and len(word) - 2 >= rv:
+        word = word[:-1]
+    elif superlative is None and word.endswith("ь") and len(word) - 1 >= rv:
+        word = word[:-1]
+    return word
+
+
+def normalize(text: Optional[str]) -> List[str]:
+    """
+    Разбивает текст на слова и приводит их к основам.
+
+    Args:
+        text (Optional[str]): Исходный текст
+
+    Returns:
+        List[str]: Основы слов в порядке следования
+    """
+    return [stem(token) for token in TOKEN_RE.findall(fold(text))]
+
+
+def vacancy_stems(vacancy: Dict[str, Any]) -> Set[str]:
+    """
+    Возвращает основы слов названия и требований вакансии.
+
+    Args:
+        vacancy (Dict[str, Any]): Запись вакансии
+
+    Returns:
+        Set[str]: Множество основ
+    """
+    return set(normalize(vacancy.get("name"))) | set(normalize(vacancy.get("requirement")))
+
+
+def _regions(word: str) -> Tuple[int, int]:
+    """
+    Возвращает начала областей RV (после первой гласной) и R2 алгоритма Snowball.
+
+    Args:
+        word (str): Слово
+
+    Returns:
+        Tuple[int, int]: Позиции начала RV и R2
+    """
+    rv = next((i + 1 for i, char in enumerate(word) if char in VOWELS), len(word))
+    r1 = _after_vowel_consonant(word, 1)
+    r2 = _after_vowel_consonant(word, r1 + 1)
+    return rv, r2
+
+
+def _after_vowel_consonant(word: str, start: int) -> int:
+    """
+    Находит позицию после первой согласной, следующей за гласной.
+
+    Args:
+        word (str): Слово
+        start (int): Позиция, с которой ищется согласная
+
+    Returns:
+        int: Позиция (длина слова, если такой согласной нет)
+    """
+    for i in range(max(start, 1), len(word)):
+        if word[i] not in VOWELS and word[i - 1] in VOWELS:
+            return i + 1
+    return len(word)
+
+
+def _strip(word: str, start: int, after_a: Tuple[str, ...], endings: Tuple[str, ...]) -> Optional[str]:
+    """
+    Отсекает самое длинное из окончаний, целиком лежащее в области слова.
+
+    Args:
+        word (str): Слово
+        start (int): Начало области, в которой ищется окончание
+        after_a (Tuple[str, ...]): Окончания, которые отсекаются только после "а" или "я"
+        endings (Tuple[str, ...]): Остальные окончания
+
+    Returns:
+        Optional[str]: Слово без окончания или None, если окончание не найдено
+    """
+    best = ""
+    for ending in after_a + endings:
+        if len(ending) > len(best) and word.endswith(ending) and len(word) - len(ending) >= start:
+            best = ending
+    if not best:
+        return None
+    position = len(word) - len(best)
+    if best in after_a and best not in endings and (position - 1 < start or word[position - 1] not in "ая"):
+        return None
+    return word[:position]
+
+
+class StemIndex(KeywordIndex):
+    """
+    Индекс словоформ: основа слова -> множество ID вакансий, плюс основы
+    каждой вакансии (ID -> основы). Основы вычисляются один раз при записи
+    вакансии и хранятся на диске вместе с индексом, поэтому запрос приводит
+    к основам только свои слова: "менеджера" находит "Менеджер" и "менеджеров".
+    """
+
+    version = "stems-1"
+
+    def __init__(self, file_name: str):
+        """
+        Инициализация индекса.
+
+        Args:
+            file_name (str): Имя файла, в котором сохраняется индекс
+        """
+        super().__init__(file_name)
+        self.forms: Dict[str, FrozenSet[str]] = {}
+
+    def add(self, vacancy: Dict[str, Any], stems: Optional[Iterable[str]] = None) -> None:
+        """
+        Приводит слова вакансии к основам и добавляет их в индекс.
+
+        Args:
+            vacancy (Dict[str, Any]): Запись вакансии
+            stems (Optional[Iterable[str]]): Основы, уже вычисленные при записи
+                (None - вычислить по тексту вакансии)
+        """
+        stems = frozenset(vacancy_stems(vacancy) if stems is None else stems)
+        self.forms[vacancy["id"]] = stems
+        for token in stems:
+            self.postings.setdefault(token, set()).add(vacancy["id"])
+
+    def remove(self, vacancy: Dict[str, Any]) -> None:
+        """
+        Удаляет вакансию из индекса по сохранённым основам (без повторного разбора текста).
+
+        Args:
+            vacancy (Dict[str, Any]): Запись вакансии
+        """
+        for token in self.forms.pop(vacancy["id"], ()):
+            ids = self.postings.get(token)
+            if ids is None:
+                continue
+            ids.discard(vacancy["id"])
+            if not ids:
+                del self.postings[token]
+
+    def rebuild(self, vacancies: Iterable[Dict[str, Any]]) -> None:
+        """
+        Строит индекс заново по всем вакансиям.
+
+        Args:
+            vacancies (Iterable[Dict[str, Any]]): Записи вакансий
+        """
+        self.forms = {}
+        super().rebuild(vacancies)
+
+    def load(self, signature: Optional[List[int]]) -> bool:
+        """
+        Загружает индекс с диска и восстанавливает по нему основы вакансий.
+
+        Args:
+            signature (Optional[List[int]]): Текущая подпись файла данных
+
+        Returns:
+            bool: True если индекс загружен
+        """
+        if not super().load(signature):
+            return False
+        forms: Dict[str, Set[str]] = {}
+        for token, ids in self.postings.items():
+            for vacancy_id in ids:
+                forms.setdefault(vacancy_id, set()).add(token)
+        self.forms = {vacancy_id: frozenset(stems) for vacancy_id, stems in forms.items()}
+        return True
+
+    def candidates(self, keyword: str) -> Optional[Set[str]]:
+        """
+        Возвращает ID вакансий, в которых есть все слова запроса в любой форме.
+        Результат точный: проверять вакансии повторно не нужно.
+
+        Args:
+            keyword (str): Слово или фраза
+
+        Returns:
+            Optional[Set[str]]: Множество ID или None, если в запросе нет слов
+        """
+        query = set(normalize(keyword))
+        if not query:
+            return None
+        postings_lists = sorted((self.postings.get(token, set()) for token in query), key=len)
+        result = set(postings_lists[0])
+        for ids in postings_lists[1:]:
+            if not result:
+                break
+            result &= ids
+        return result
+
+    def stems_of(self, vacancy_id: str) -> Optional[FrozenSet[str]]:
+        """
+        Возвращает основы слов вакансии, вычисленные при записи.
+
+        Args:
+            vacancy_id (str): ID вакансии
+
+        Returns:
+            Optional[FrozenSet[str]]: Основы или None, если вакансии нет в индексе
+        """
+        return self.forms.get(vacancy_id)
+
+    def lookup(self, vacancy: Dict[str, Any]) -> Optional[FrozenSet[str]]:
+        """
+        Возвращает основы слов вакансии по её записи (источник основ для Filter.compile).
+
+        Args:
+            vacancy (Dict[str, Any]): Запись вакансии
+
+        Returns:
+            Optional[FrozenSet[str]]: Основы или None, если вакансии нет в индексе
+        """
+        return self.forms.get(vacancy.get("id"))
@@ -0,0 +1,195 @@
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Tuple
+import base64
+import binascii
+import heapq
+import itertools
+import json
+
+from salary_index import SalaryIndex
+
+ORDERS = ("insertion", "salary")
+# Поле файла с порядковым номером добавления записи (ключ выдачи insertion)
+SEQ_FIELD = "seq"
+
+
+class Page(list):
+    """
+    Страница результатов запроса: список вакансий и курсор следующей страницы
+    (None, если страница последняя).
+    """
+
+    def __init__(self, items: Iterable[Dict[str, Any]] = (), next_cursor: Optional[str] = None):
+        super().__init__(items)
+        self.next_cursor = next_cursor
+
+
+def encode_cursor(state: Dict[str, Any]) -> str:
+    """
+    Упаковывает позицию выдачи в непрозрачную строку.
+
+    Args:
+        state (Dict[str, Any]): Порядок выдачи и ключ последней вакансии страницы
+
+    Returns:
+        str: Курсор
+    """
+    raw = json.dumps(state, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str, order: str) -> Dict[str, Any]:
+    """
+    Распаковывает курсор и проверяет, что он выдан для того же порядка выдачи.
+
+    Args:
+        cursor (str): Курсор
+        order (str): Порядок выдачи запроса
+
+    Returns:
+        Dict[str, Any]: Позиция выдачи
+
+    Raises:
+        ValueError: Если курсор повреждён или выдан для другого порядка
+    """
+    try:
+        state = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8"))
+    except (ValueError, UnicodeError, binascii.Error):
+        raise ValueError("Некорректный курсор")
+    if not isinstance(state, dict) or state.get("o") != order:
+        raise ValueError("Курсор выдан для другого порядка выдачи")
+    return state
+
+
+def check_order(order: str) -> None:
+    """
+    Проверяет порядок выдачи.
+
+    Args:
+        order (str): insertion (порядок добавления) или salary (по убыванию зарплаты)
+
+    Raises:
+        ValueError: Если порядок неизвестен
+    """
+    if order not in ORDERS:
+        raise ValueError(f"Неизвестный порядок выдачи: {order}")
+
+
+def take_sequence(vacancies: Iterable[Dict[str, Any]], start: int = 0) -> Tuple[Dict[str, int], int]:
+    """
+    Извлекает из записей, прочитанных из файла, номера добавления (поле seq)
+    и убирает это поле из записей. Записям без номера (записаны до появления
+    номеров или сторонней программой) номера проставляются по порядку хранения;
+    уже выданные номера не меняются, если они идут по возрастанию.
+
+    Args:
+        vacancies (Iterable[Dict[str, Any]]): Вакансии в порядке хранения
+        start (int): Наименьший номер для записей без номера
+
+    Returns:
+        Tuple[Dict[str, int], int]: ID вакансии -> номер и номер для следующей новой вакансии
+    """
+    sequence: Dict[str, int] = {}
+    last = start - 1
+    for vacancy in vacancies:
+        seq = vacancy.pop(SEQ_FIELD, None)
+        if not isinstance(seq, int) or isinstance(seq, bool) or seq <= last:
+            seq = last + 1
+        sequence[vacancy["id"]] = last = seq
+    return sequence, last + 1
+
+
+def salary_key(vacancy: Dict[str, Any]) -> Tuple[float, str]:
+    """
+    Ключ порядка salary: зарплата по убыванию, при равной зарплате - ID по возрастанию.
+
+    Args:
+        vacancy (Dict[str, Any]): Запись вакансии
+
+    Returns:
+        Tuple[float, str]: Ключ сортировки
+    """
+    return -SalaryIndex.salary_of(vacancy), str(vacancy["id"])
+
+
+def paginate(vacancies: List[Dict[str, Any]], sequence: Dict[str, int],
+             predicate: Callable[[Dict[str, Any]], bool], limit: int, cursor: Optional[str] = None,
+             order: str = "insertion") -> Page:
+    """
+    Возвращает страницу вакансий из списка в порядке хранения (keyset-пагинация).
+    Для порядка insertion курсор хранит номер добавления последней вакансии
+    (хранилища сохраняют его вместе с записью, см. take_sequence): новые вакансии
+    получают большие номера и попадут на следующие страницы, а удаление любых
+    вакансий, в том числе самой вакансии курсора, не сдвигает выдачу. Для порядка
+    salary курсор хранит ключ (зарплата, ID). В обоих случаях выборка не зависит
+    от вставок и удалений.
+    Просматривается только нужная часть списка (для salary - без сортировки всех совпадений).
+
+    Args:
+        vacancies (List[Dict[str, Any]]): Вакансии в порядке хранения
+        sequence (Dict[str, int]): ID вакансии -> номер добавления (возрастает в порядке хранения)
+        predicate (Callable[[Dict[str, Any]], bool]): Критерий отбора
+        limit (int): Размер страницы
+        cursor (Optional[str]): Курсор предыдущей страницы (None - первая страница)
+        order (str): insertion или salary
+
+    Returns:
+        Page: Страница и курсор следующей
+    """
+    check_order(order)
+    if limit <= 0:
+        raise ValueError("Размер страницы должен быть положительным числом")
+    state = decode_cursor(cursor, order) if cursor is not None else None
+
+    if order == "salary":
+        matches: Iterator[Dict[str, Any]] = (vacancy for vacancy in vacancies if predicate(vacancy))
+        if state is not None:
+            try:
+                after = (-float(state["salary"]), str(state["id"]))
+            except (KeyError, TypeError, ValueError):
+                raise ValueError("Некорректный курсор")
+            matches = (vacancy for vacancy in matches if salary_key(vacancy) > after)
+        items = heapq.nsmallest(limit + 1, matches, key=salary_key)
+        page = Page(items[:limit])
+        if len(items) > limit:
+            last = page[-1]
+            page.next_cursor = encode_cursor({"o": order, "salary": SalaryIndex.salary_of(last), "id": last["id"]})
+        return page
+
+    start = _resume_position(vacancies, sequence, state) if state is not None else 0
+    positions = (position for position in range(start, len(vacancies)) if predicate(vacancies[position]))
+    found = list(itertools.islice(positions, limit + 1))
+    page = Page(vacancies[position] for position in found[:limit])
+    if len(found) > limit:
+        position = found[limit - 1]
+        page.next_cursor = encode_cursor({"o": order, "seq": sequence[vacancies[position]["id"]]})
+    return page
+
+
+def _resume_position(vacancies: List[Dict[str, Any]], sequence: Dict[str, int], state: Dict[str, Any]) -> int:
+    """
+    Находит позицию, с которой продолжается выдача insertion: первую вакансию
+    с номером добавления больше номера из курсора (двоичный поиск по списку,
+    упорядоченному по номерам).
+
+    Args:
+        vacancies (List[Dict[str, Any]]): Вакансии в порядке хранения
+        sequence (Dict[str, int]): ID вакансии -> номер добавления
+        state (Dict[str, Any]): Позиция из курсора
+
+    Returns:
+        int: Позиция первой вакансии следующей страницы
+
+    Raises:
+        ValueError: Если в курсоре нет номера добавления
+    """
+    after = state.get("seq")
+    if not isinstance(after, int) or isinstance(after, bool):
+        raise ValueError("Некорректный курсор")
+    low, high = 0, len(vacancies)
+    while low < high:
+        middle = (low + high) // 2
+        if sequence[vacancies[middle]["id"]] <= after:
+            low = middle + 1
+        else:
+            high = middle
+    return low
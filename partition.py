@@ -0,0 +1,164 @@
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import requests
+
+# Глубина выдачи API: не больше 20 страниц и не больше 2000 вакансий на запрос
+MAX_PAGES = 20
+MAX_ITEMS = 2000
+# Границы date_from/date_to включаются в выдачу и задаются с точностью до секунды
+DATE_STEP = timedelta(seconds=1)
+
+# Срез запроса: (номер базового среза, дополнительные параметры, начало, конец периода)
+Slice = Tuple[int, Dict[str, Any], datetime, datetime]
+
+
+def format_date(moment: datetime) -> str:
+    """
+    Форматирует дату для параметров date_from/date_to API.
+
+    Args:
+        moment (datetime): Дата
+
+    Returns:
+        str: Дата в формате ISO 8601 (2024-05-01T12:00:00+0000)
+    """
+    return moment.strftime("%Y-%m-%dT%H:%M:%S%z")
+
+
+class PartitionedHarvester:
+    """
+    Загрузка полной выдачи по широким запросам.
+    API отдаёт по одному запросу не больше 2000 вакансий, поэтому запрос
+    делится на непересекающиеся срезы по периоду публикации (и, при желании,
+    по регионам): срез, в котором найдено больше, чем помещается в выдачу,
+    делится пополам, пока каждый срез не уложится в лимит. Страницы всех
+    срезов загружаются параллельно, результаты объединяются без повторов по ID.
+    """
+
+    def __init__(self, hh: Any, max_items: int = MAX_ITEMS, min_span: timedelta = timedelta(minutes=1)):
+        """
+        Инициализация загрузчика.
+
+        Args:
+            hh: Экземпляр HH (запросы к API и запись в хранилище)
+            max_items (int): Максимальная глубина выдачи одного запроса
+            min_span (timedelta): Минимальная длина периода, который ещё делится пополам
+        """
+        self.hh = hh
+        self.max_items = max_items
+        self.min_span = min_span
+        self.slices = 0
+        self.truncated = 0
+        self.failed = 0
+
+    @property
+    def depth(self) -> int:
+        """
+        Сколько вакансий можно получить одним запросом при текущем per_page.
+
+        Returns:
+            int: Глубина выдачи
+        """
+        return min(self.max_items, MAX_PAGES * self.hh.params['per_page'])
+
+    def harvest(self, keyword: str, date_from: datetime, date_to: datetime,
+                areas: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Загружает все вакансии по ключевому слову за период и записывает их в хранилище.
+
+        Args:
+            keyword (str): Ключевое слово для поиска
+            date_from (datetime): Начало периода публикации
+            date_to (datetime): Конец периода публикации
+            areas (Optional[Iterable[str]]): ID регионов для дополнительного деления запроса
+
+        Returns:
+            List[Dict[str, Any]]: Загруженные вакансии без повторов
+        """
+        extras = [{"area": area} for area in areas] if areas else [{}]
+        pending: List[Slice] = [(number, extra, date_from, date_to) for number, extra in enumerate(extras)]
+        accepted: List[Tuple[Slice, Dict[str, Any]]] = []
+        self.slices = self.truncated = self.failed = 0
+
+        with ThreadPoolExecutor(max_workers=self.hh.concurrency) as pool:
+            # Первая страница среза служит и пробой: по полю found видно, нужно ли делить срез
+            while pending:
+                probes = list(pool.map(lambda part: self._fetch(keyword, part, 0), pending))
+                next_pending = []
+                for part, data in zip(pending, probes):
+                    if data is None:
+                        self.failed += 1
+                        continue
+                    _, extra, start, end = part
+                    if data.get('found', 0) > self.depth and end - start > max(self.min_span, DATE_STEP):
+                        # Обе границы включаются, поэтому правая половина начинается
+                        # через секунду после левой, иначе вакансии на границе попадут в оба среза
+                        middle = (start + (end - start) / 2).replace(microsecond=0)
+                        next_pending += [(part[0], extra, start, middle),
+                                         (part[0], extra, middle + DATE_STEP, end)]
+                        continue
+                    if data.get('found', 0) > self.depth:
+                        print(f"Срез {format_date(start)} - {format_date(end)} не помещается в выдачу, "
+                              f"часть вакансий будет пропущена")
+                        self.truncated += 1
+                    accepted.append((part, data))
+                pending = next_pending
+
+            accepted.sort(key=lambda entry: (entry[0][0], entry[0][2]))
+            self.slices = len(accepted)
+            futures = [
+                [pool.submit(self._fetch, keyword, part, page) for page in range(1, self._page_count(data))]
+                for part, data in accepted
+            ]
+
+            vacancies: Dict[str, Dict[str, Any]] = {}
+            for (part, first_page), page_futures in zip(accepted, futures):
+                for data in [first_page] + [future.result() for future in page_futures]:
+                    if data is None:
+                        self.failed += 1
+                        continue
+                    for vac in data.get('items', []):
+                        vacancy = self.hh._normalize(vac)
+                        vacancies.setdefault(vacancy["id"], vacancy)
+
+        merged = list(vacancies.values())
+        self.hh.add_vacs(merged)
+        return merged
+
+    def _fetch(self, keyword: str, part: Slice, page: int) -> Optional[Dict[str, Any]]:
+        """
+        Загружает страницу среза.
+
+        Args:
+            keyword (str): Ключевое слово для поиска
+            part (Slice): Срез запроса
+            page (int): Номер страницы
+
+        Returns:
+            Optional[Dict[str, Any]]: Ответ API или None при ошибке загрузки
+        """
+        _, extra, start, end = part
+        params = dict(self.hh.params, text=keyword, page=page,
+                      date_from=format_date(start), date_to=format_date(end), **extra)
+        try:
+            return self.hh._get_json(params)
+        except requests.RequestException as e:
+            # Ошибки считаются в основном потоке по результатам загрузки
+            print(f"Ошибка при загрузке вакансий: {e}")
+            return None
+
+    def _page_count(self, data: Dict[str, Any]) -> int:
+        """
+        Возвращает число страниц среза в пределах глубины выдачи.
+
+        Args:
+            data (Dict[str, Any]): Первая страница среза
+
+        Returns:
+            int: Количество страниц
+        """
+        per_page = self.hh.params['per_page']
+        found = min(data.get('found', 0), self.depth)
+        return min(data.get('pages', MAX_PAGES), (found + per_page - 1) // per_page)
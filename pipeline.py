@@ -0,0 +1,419 @@
+from typing import List, Dict, Any, Iterator, Optional, Callable
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
+import time
+
+import requests
+
+from checkpoint import HarvestCheckpoint
+from bloom_filter import BloomFilter
+
+# Маркер конца потока данных между стадиями
+_DONE = object()
+
+
+class StageStats:
+    """
+    Счётчики одной стадии конвейера: сколько элементов обработано и за какое время.
+    """
+
+    def __init__(self, name: str):
+        """
+        Инициализация счётчиков.
+
+        Args:
+            name (str): Название стадии
+        """
+        self.name = name
+        self.items = 0
+        self.busy = 0.0
+
+    def add(self, items: int, seconds: float) -> None:
+        """
+        Учитывает обработанные элементы.
+
+        Args:
+            items (int): Число элементов
+            seconds (float): Затраченное время
+        """
+        self.items += items
+        self.busy += seconds
+
+    def as_dict(self) -> Dict[str, float]:
+        """
+        Возвращает счётчики стадии.
+
+        Returns:
+            Dict[str, float]: Элементы, время работы и пропускная способность (элементов в секунду)
+        """
+        return {
+            "items": self.items,
+            "seconds": self.busy,
+            "per_second": self.items / self.busy if self.busy else 0.0,
+        }
+
+
+class HarvestPipeline:
+    """
+    Потоковый конвейер загрузки вакансий:
+    загрузка страниц -> нормализация -> удаление дубликатов -> пакетная запись.
+    Стадии работают в отдельных потоках и связаны очередями ограниченного размера,
+    поэтому медленная запись притормаживает загрузку страниц, а память не растёт
+    с числом страниц. Итерация по конвейеру возвращает вакансии после их записи в хранилище.
+    Загрузка прекращается раньше, если API сообщает, что страниц в выдаче меньше.
+    """
+
+    def __init__(self, hh: Any, keyword: str, page_numbers: List[int], commit: str = "page",
+                 checkpoint: Optional[HarvestCheckpoint] = None, queue_size: int = 4,
+                 seen_filter: Optional[BloomFilter] = None):
+        """
+        Инициализация конвейера.
+
+        Args:
+            hh: Экземпляр HH (загрузка страниц, нормализация и запись в хранилище)
+            keyword (str): Ключевое слово для поиска
+            page_numbers (List[int]): Номера страниц в порядке загрузки
+            commit (str): Режим записи: "page" - по странице, "harvest" - одной записью в конце
+            checkpoint (Optional[HarvestCheckpoint]): Контрольная точка загрузки
+            queue_size (int): Размер очередей между стадиями (в страницах)
+            seen_filter (Optional[BloomFilter]): Фильтр ID уже сохранённых вакансий; с ним
+                в хранилище передаются только новые вакансии, а загрузка прекращается
+                на первой странице, где все вакансии уже известны
+        """
+        self.hh = hh
+        self.keyword = keyword
+        self.page_numbers = page_numbers
+        self.commit = commit
+        self.checkpoint = checkpoint
+        self.queue_size = queue_size
+        self.seen_filter = seen_filter
+        self.failed = False
+        self.known = 0
+        # Номер страницы, начиная с которой загружать больше не нужно
+        self._page_limit: Optional[int] = None
+        self._limit_lock = threading.Lock()
+        self._stats = {name: StageStats(name) for name in ("fetch", "normalize", "dedup", "write")}
+        self._stop = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._threads: List[threading.Thread] = []
+        self._started = False
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """
+        Запускает стадии и возвращает вакансии по мере их записи в хранилище.
+
+        Returns:
+            Iterator[Dict[str, Any]]: Загруженные вакансии
+        """
+        if self._started:
+            raise RuntimeError("Конвейер уже запущен")
+        self._started = True
+
+        fetched = queue.Queue(self.queue_size)
+        normalized = queue.Queue(self.queue_size)
+        unique = queue.Queue(self.queue_size)
+        output = queue.Queue(self.queue_size * int(self.hh.params.get("per_page", 100)))
+
+        self._spawn("fetch", self._fetch_stage, fetched)
+        self._spawn("normalize", self._map_stage, "normalize", fetched, normalized, self._normalize)
+        self._spawn("dedup", self._map_stage, "dedup", normalized, unique, self._dedup_factory())
+        self._spawn("write", self._write_stage, unique, output)
+
+        try:
+            while True:
+                item = self._get(output)
+                if item is _DONE:
+                    break
+                yield item
+        finally:
+            self._stop_all()
+
+        if self._error is not None:
+            raise self._error
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Возвращает пропускную способность каждой стадии.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Название стадии -> счётчики
+        """
+        return {name: stage.as_dict() for name, stage in self._stats.items()}
+
+    def _spawn(self, name: str, target: Callable, *args: Any) -> None:
+        """
+        Запускает стадию в отдельном потоке. Исключение стадии останавливает конвейер
+        и передаётся потребителю.
+
+        Args:
+            name (str): Название стадии
+            target (Callable): Функция стадии
+            *args: Аргументы функции
+        """
+        def run():
+            try:
+                target(*args)
+            except BaseException as e:
+                if self._error is None:
+                    self._error = e
+                self._stop.set()
+
+        thread = threading.Thread(target=run, name=f"harvest-{name}", daemon=True)
+        self._threads.append(thread)
+        thread.start()
+
+    def _fetch_stage(self, out: queue.Queue) -> None:
+        """
+        Загружает страницы параллельно, но не более concurrency запросов одновременно,
+        и передаёт их дальше строго по порядку. Пока следующая стадия не забрала
+        страницы, новые запросы не отправляются. Страницы за пределами выдачи
+        (по полю pages ответа) не запрашиваются.
+
+        Args:
+            out (queue.Queue): Очередь загруженных страниц
+        """
+        stats = self._stats["fetch"]
+        window = deque()
+        with ThreadPoolExecutor(max_workers=self.hh.concurrency) as pool:
+            try:
+                pages = iter(self.page_numbers)
+                while True:
+                    while len(window) < self.hh.concurrency:
+                        page = next(pages, None)
+                        if page is None or self._beyond_limit(page):
+                            break
+                        window.append((page, pool.submit(self._timed_fetch, page)))
+                    if not window:
+                        break
+                    page, future = window.popleft()
+                    if self._beyond_limit(page):
+                        future.cancel()
+                        continue
+                    data, seconds = future.result()
+                    stats.add(1, seconds)
+                    if isinstance(data.get('pages'), int):
+                        self._limit_pages(data['pages'])
+                    if not self._put(out, (page, data)):
+                        break
+            except requests.RequestException as e:
+                print(f"Ошибка при загрузке вакансий: {e}")
+                self.failed = True
+            finally:
+                for _, future in window:
+                    future.cancel()
+        self._put(out, _DONE)
+
+    def _timed_fetch(self, page: int) -> tuple:
+        """
+        Загружает страницу и замеряет время запроса.
+
+        Args:
+            page (int): Номер страницы
+
+        Returns:
+            tuple: Ответ API и время загрузки в секундах
+        """
+        started = time.perf_counter()
+        data = self.hh._fetch_page(self.keyword, page)
+        return data, time.perf_counter() - started
+
+    def _map_stage(self, name: str, source: queue.Queue, out: queue.Queue,
+                   func: Callable[[Any], List[Dict[str, Any]]]) -> None:
+        """
+        Общая стадия: применяет функцию к каждой странице.
+
+        Args:
+            name (str): Название стадии
+            source (queue.Queue): Входная очередь
+            out (queue.Queue): Выходная очередь
+            func (Callable): Преобразование данных страницы в список вакансий
+        """
+        stats = self._stats[name]
+        while True:
+            item = self._get(source)
+            if item is _DONE:
+                break
+            page, payload = item
+            if self._beyond_limit(page):
+                continue
+            started = time.perf_counter()
+            vacancies = func(payload)
+            stats.add(len(vacancies), time.perf_counter() - started)
+            if not self._put(out, (page, vacancies)):
+                return
+        self._put(out, _DONE)
+
+    def _normalize(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Приводит вакансии страницы к формату хранилища.
+
+        Args:
+            data (Dict[str, Any]): Ответ API
+
+        Returns:
+            List[Dict[str, Any]]: Вакансии страницы
+        """
+        return [self.hh._normalize(vac) for vac in data.get('items', [])]
+
+    @staticmethod
+    def _dedup_factory() -> Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]:
+        """
+        Создаёт функцию удаления повторов по ID в пределах загрузки.
+
+        Returns:
+            Callable: Функция, оставляющая только ещё не встречавшиеся вакансии
+        """
+        seen_ids = set()
+
+        def dedup(vacancies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            batch = []
+            for vacancy in vacancies:
+                if vacancy["id"] in seen_ids:
+                    continue
+                seen_ids.add(vacancy["id"])
+                batch.append(vacancy)
+            return batch
+
+        return dedup
+
+    def _write_stage(self, source: queue.Queue, out: queue.Queue) -> None:
+        """
+        Записывает вакансии в хранилище пачками и отмечает страницы в контрольной точке.
+        В режиме "harvest" всё записывается одной пачкой в конце. С фильтром seen_filter
+        уже сохранённые вакансии отсекаются до обращения к хранилищу на запись.
+
+        Args:
+            source (queue.Queue): Очередь уникальных вакансий по страницам
+            out (queue.Queue): Очередь записанных вакансий для потребителя
+        """
+        stats = self._stats["write"]
+        pending: List[Dict[str, Any]] = []
+        pending_pages: List[int] = []
+
+        def flush() -> bool:
+            started = time.perf_counter()
+            self.hh.add_vacs(pending)
+            if self.seen_filter is not None:
+                self.seen_filter.update(vacancy["id"] for vacancy in pending)
+            if self.checkpoint:
+                self.checkpoint.mark(pending_pages)
+            stats.add(len(pending), time.perf_counter() - started)
+            for vacancy in pending:
+                if not self._put(out, vacancy):
+                    return False
+            pending.clear()
+            pending_pages.clear()
+            return True
+
+        while True:
+            item = self._get(source)
+            if item is _DONE:
+                break
+            page, vacancies = item
+            if self._beyond_limit(page):
+                continue
+            if self.seen_filter is not None:
+                vacancies = self._drop_known(page, vacancies)
+            pending.extend(vacancies)
+            pending_pages.append(page)
+            if self.commit == "page" and not flush():
+                return
+
+        # Уже полученные страницы сохраняем и при ошибке на середине загрузки
+        if not self._stop.is_set() and pending_pages and not flush():
+            return
+        if self.checkpoint and not self.failed and not self._stop.is_set():
+            self.checkpoint.clear()
+        if self.seen_filter is not None:
+            self.seen_filter.save()
+        self._put(out, _DONE)
+
+    def _drop_known(self, page: int, vacancies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Убирает вакансии, которые уже есть в хранилище. Фильтр Блума отсекает
+        точно новые ID, а его положительные ответы проверяются в хранилище.
+        Если известны все вакансии страницы, дальнейшие страницы не загружаются.
+
+        Args:
+            page (int): Номер страницы
+            vacancies (List[Dict[str, Any]]): Вакансии страницы
+
+        Returns:
+            List[Dict[str, Any]]: Новые вакансии
+        """
+        maybe_known = [vacancy["id"] for vacancy in vacancies if vacancy["id"] in self.seen_filter]
+        known = self.hh._stored_ids(maybe_known) if maybe_known else set()
+        fresh = [vacancy for vacancy in vacancies if vacancy["id"] not in known]
+        self.known += len(vacancies) - len(fresh)
+        if vacancies and not fresh:
+            self._limit_pages(page + 1)
+        return fresh
+
+    def _limit_pages(self, limit: int) -> None:
+        """
+        Запрещает загрузку и обработку страниц с номером limit и дальше.
+
+        Args:
+            limit (int): Первая ненужная страница
+        """
+        with self._limit_lock:
+            if self._page_limit is None or limit < self._page_limit:
+                self._page_limit = limit
+
+    def _beyond_limit(self, page: int) -> bool:
+        """
+        Проверяет, что страница уже не нужна.
+
+        Args:
+            page (int): Номер страницы
+
+        Returns:
+            bool: True если страницу нужно пропустить
+        """
+        return self._page_limit is not None and page >= self._page_limit
+
+    def _put(self, target: queue.Queue, item: Any) -> bool:
+        """
+        Кладёт элемент в очередь, ожидая свободного места (обратное давление).
+
+        Args:
+            target (queue.Queue): Очередь
+            item (Any): Элемент
+
+        Returns:
+            bool: False если конвейер остановлен
+        """
+        while not self._stop.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source: queue.Queue) -> Any:
+        """
+        Забирает элемент из очереди; при остановке конвейера возвращает маркер конца.
+
+        Args:
+            source (queue.Queue): Очередь
+
+        Returns:
+            Any: Элемент или _DONE
+        """
+        while not self._stop.is_set():
+            try:
+                return source.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _stop_all(self) -> None:
+        """
+        Останавливает стадии и дожидается завершения их потоков.
+        """
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
@@ -0,0 +1,402 @@
+from typing import List, Dict, Any, Callable, Optional, Set
+import math
+import threading
+
+from keyword_index import KeywordIndex, TOKEN_RE
+from salary_index import SalaryIndex
+from trigram_index import TrigramIndex
+from morphology import StemIndex
+from vacancy_filter import Filter, Compare, Contains, WordForms, SalaryRange, IdIn, And, Or, Not
+
+# Условная стоимость операций (в проверках предиката одной вакансии)
+SCAN_COST = 1.0
+LOOKUP_COST = 0.1
+TERM_COST = 0.05
+
+# Избирательность условий, для которых нет индекса и наблюдений
+DEFAULT_SELECTIVITY = {"==": 0.1, "!=": 0.9, "<": 0.3, "<=": 0.3, ">": 0.3, ">=": 0.3}
+CONTAINS_SELECTIVITY = 0.1
+CALLABLE_SELECTIVITY = 0.5
+
+MAX_OBSERVED = 256
+
+
+class AccessPath:
+    """
+    Способ получить кандидатов из индекса: оценка их числа, стоимость и сама выборка.
+    """
+
+    def __init__(self, label: str, rows: int, cost: float, fetch: Callable[[], Set[str]]):
+        self.label = label
+        self.rows = rows
+        self.cost = cost
+        self.fetch = fetch
+
+
+class QueryPlan:
+    """
+    Выбранный план запроса: стратегия, использованные индексы, оценка
+    и (после выполнения) фактическое число строк.
+    """
+
+    def __init__(self, operation: str, strategy: str, estimated_rows: float, cost: float,
+                 paths: Optional[List[AccessPath]] = None, access: Optional[List[str]] = None,
+                 exact: bool = False):
+        self.operation = operation
+        self.strategy = strategy
+        self.estimated_rows = estimated_rows
+        self.cost = cost
+        self.paths = paths or []
+        self.access = access if access is not None else [path.label for path in self.paths]
+        # Кандидаты плана и есть результат: проверять их предикатом не нужно
+        self.exact = exact
+        self.actual_rows: Optional[int] = None
+        self.examined: Optional[int] = None
+
+    def candidates(self) -> Optional[Set[str]]:
+        """
+        Выбирает кандидатов по путям доступа плана, начиная с самого избирательного.
+
+        Returns:
+            Optional[Set[str]]: Пересечение кандидатов или None (полный просмотр)
+        """
+        if not self.paths:
+            return None
+        result = self.paths[0].fetch()
+        for path in self.paths[1:]:
+            if not result:
+                break
+            result = result & path.fetch()
+        return result
+
+    def finish(self, actual_rows: int, examined: int) -> None:
+        """
+        Запоминает результат выполнения плана.
+
+        Args:
+            actual_rows (int): Число найденных вакансий
+            examined (int): Число вакансий, проверенных предикатом
+        """
+        self.actual_rows = actual_rows
+        self.examined = examined
+
+    def describe(self) -> Dict[str, Any]:
+        """
+        Возвращает план в виде словаря.
+
+        Returns:
+            Dict[str, Any]: Операция, стратегия, индексы, стоимость, оценка и факт
+        """
+        return {
+            "operation": self.operation,
+            "strategy": self.strategy,
+            "access": list(self.access),
+            "cost": round(self.cost, 1),
+            "estimated_rows": round(self.estimated_rows, 1),
+            "actual_rows": self.actual_rows,
+            "examined": self.examined,
+        }
+
+    def __str__(self) -> str:
+        access = f" [{', '.join(self.access)}]" if self.access else ""
+        return (f"{self.operation}: {self.strategy}{access} cost={self.cost:.1f} "
+                f"rows={self.estimated_rows:.0f} actual={self.actual_rows} examined={self.examined}")
+
+
+class QueryPlanner:
+    """
+    Стоимостный планировщик запросов к хранилищу.
+    Статистикой служат сами индексы: размеры списков слов, число зарплат
+    в диапазоне (по bisect, без выборки) и общее число вакансий;
+    для условий без индекса используются наблюдения прошлых запросов
+    или избирательность по умолчанию. Планировщик решает, брать ли
+    кандидатов из индексов (и из каких, начиная с самого избирательного)
+    или просматривать все вакансии, а для top-N - идти по индексу зарплат
+    с ранней остановкой или отобрать вакансии и отсортировать.
+    """
+
+    def __init__(self, keyword_index: Optional[KeywordIndex], salary_index: Optional[SalaryIndex],
+                 trigram_index: Optional[TrigramIndex] = None, stem_index: Optional[StemIndex] = None):
+        """
+        Инициализация планировщика.
+
+        Args:
+            keyword_index (Optional[KeywordIndex]): Индекс слов хранилища
+            salary_index (Optional[SalaryIndex]): Индекс зарплат хранилища
+            trigram_index (Optional[TrigramIndex]): Триграммный индекс хранилища
+            stem_index (Optional[StemIndex]): Индекс словоформ хранилища
+        """
+        self.keyword_index = keyword_index
+        self.salary_index = salary_index
+        self.trigram_index = trigram_index
+        self.stem_index = stem_index
+        # repr критерия -> наблюдавшаяся доля подходящих вакансий
+        self.observed: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def plan_filter(self, criteria: Filter, total: int, operation: str = "get_vacancies") -> QueryPlan:
+        """
+        Выбирает план отбора вакансий по критерию. Пути доступа по индексам
+        добавляются по возрастанию числа кандидатов, пока пересечение дешевле
+        проверки предикатом; сами кандидаты выбирает QueryPlan.candidates().
+
+        Args:
+            criteria (Filter): Критерий
+            total (int): Число вакансий в хранилище
+            operation (str): Имя запроса для explain
+
+        Returns:
+            QueryPlan: План
+        """
+        cache: Dict[int, Optional[AccessPath]] = {}
+        estimated = total * self.selectivity(criteria, total, cache)
+        best_cost = total * SCAN_COST
+        parts = criteria.parts if isinstance(criteria, And) else (criteria,)
+        paths = sorted((path for path in (self._path(part, cache) for part in parts) if path is not None),
+                       key=lambda p: p.rows)
+
+        chosen: List[AccessPath] = []
+        fetch_cost, rows = 0.0, total
+        for path in paths:
+            new_rows = min(rows, path.rows)
+            cost = fetch_cost + path.cost + total * LOOKUP_COST + new_rows * SCAN_COST
+            if cost >= best_cost:
+                break
+            chosen.append(path)
+            best_cost, fetch_cost, rows = cost, fetch_cost + path.cost, new_rows
+
+        if not chosen:
+            return QueryPlan(operation, "full scan", estimated, best_cost)
+        strategy = "index" if len(chosen) == 1 else "index intersection"
+        return QueryPlan(operation, strategy, min(estimated, rows), best_cost, chosen, exact=criteria.exact)
+
+    def plan_top(self, n: int, criteria: Optional[Callable[[Dict[str, Any]], bool]], total: int) -> QueryPlan:
+        """
+        Выбирает план top-N по зарплате: проход по индексу зарплат по убыванию
+        с остановкой после N подходящих вакансий или отбор с последующей сортировкой.
+
+        Args:
+            n (int): Количество вакансий
+            criteria (Optional[Callable]): Критерий отбора (None - все вакансии)
+            total (int): Число вакансий в хранилище
+
+        Returns:
+            QueryPlan: План; стратегия "salary index" или "filter + sort"
+        """
+        if criteria is None:
+            selectivity, filtered = 1.0, None
+        elif isinstance(criteria, Filter):
+            filtered = self.plan_filter(criteria, total, "top_salary")
+            selectivity = filtered.estimated_rows / total if total else 0.0
+        else:
+            selectivity, filtered = CALLABLE_SELECTIVITY, None
+        matches = total * selectivity
+        estimated = min(n, matches)
+
+        sort_rows = matches if filtered is None else filtered.estimated_rows
+        sort_cost = (filtered.cost if filtered is not None else total * SCAN_COST) \
+            + sort_rows * math.log2(sort_rows + 2) * LOOKUP_COST
+        sort_plan = QueryPlan("top_salary", "filter + sort", estimated, sort_cost,
+                              filtered.paths if filtered is not None else None,
+                              exact=filtered is not None and filtered.exact)
+        if self.salary_index is None:
+            return sort_plan
+
+        # До N-й подходящей вакансии придётся проверить примерно N / избирательность записей
+        walk_rows = total if selectivity <= 0 else min(total, n / selectivity)
+        walk_cost = walk_rows * (SCAN_COST if criteria is not None else LOOKUP_COST)
+        if walk_cost <= sort_cost:
+            return QueryPlan("top_salary", "salary index", estimated, walk_cost, access=["salary desc"])
+        return sort_plan
+
+    def selectivity(self, criteria: Filter, total: int,
+                    cache: Optional[Dict[int, Optional[AccessPath]]] = None) -> float:
+        """
+        Оценивает долю вакансий, подходящих под критерий.
+
+        Args:
+            criteria (Filter): Критерий
+            total (int): Число вакансий в хранилище
+            cache (Optional[Dict]): Пути доступа, уже найденные при планировании этого запроса
+
+        Returns:
+            float: Доля от 0 до 1
+        """
+        if total <= 0:
+            return 0.0
+        if cache is None:
+            cache = {}
+        observed = self.observed.get(repr(criteria))
+        if observed is not None:
+            return observed
+        if isinstance(criteria, And):
+            result = 1.0
+            for part in criteria.parts:
+                result *= self.selectivity(part, total, cache)
+            return result
+        if isinstance(criteria, Or):
+            result = 1.0
+            for part in criteria.parts:
+                result *= 1.0 - self.selectivity(part, total, cache)
+            return 1.0 - result
+        if isinstance(criteria, Not):
+            return 1.0 - self.selectivity(criteria.part, total, cache)
+        path = self._path(criteria, cache)
+        if path is not None:
+            return min(1.0, path.rows / total)
+        if isinstance(criteria, Compare):
+            return DEFAULT_SELECTIVITY[criteria.op]
+        if isinstance(criteria, IdIn):
+            return min(1.0, len(criteria.ids) / total)
+        return CONTAINS_SELECTIVITY
+
+    def observe(self, criteria: Any, actual_rows: int, total: int) -> None:
+        """
+        Запоминает фактическую избирательность критерия для следующих оценок.
+
+        Args:
+            criteria (Any): Выполненный критерий
+            actual_rows (int): Число найденных вакансий
+            total (int): Число вакансий в хранилище
+        """
+        if not isinstance(criteria, Filter) or total <= 0:
+            return
+        key = repr(criteria)
+        with self._lock:
+            if key not in self.observed and len(self.observed) >= MAX_OBSERVED:
+                self.observed.pop(next(iter(self.observed)))
+            self.observed[key] = actual_rows / total
+
+    def _path(self, criteria: Filter, cache: Dict[int, Optional[AccessPath]]) -> Optional[AccessPath]:
+        """
+        Возвращает путь доступа по индексу для критерия, если он есть
+        (один раз за планирование запроса).
+
+        Args:
+            criteria (Filter): Критерий
+            cache (Dict[int, Optional[AccessPath]]): Уже найденные пути доступа
+
+        Returns:
+            Optional[AccessPath]: Путь доступа или None
+        """
+        if id(criteria) not in cache:
+            cache[id(criteria)] = self._find_path(criteria, cache)
+        return cache[id(criteria)]
+
+    def _find_path(self, criteria: Filter, cache: Dict[int, Optional[AccessPath]]) -> Optional[AccessPath]:
+        """
+        Подбирает путь доступа по индексу для критерия.
+
+        Args:
+            criteria (Filter): Критерий
+            cache (Dict[int, Optional[AccessPath]]): Уже найденные пути доступа
+
+        Returns:
+            Optional[AccessPath]: Путь доступа или None
+        """
+        if isinstance(criteria, Contains):
+            trigram = self._trigram_path(criteria) if self.trigram_index is not None else None
+            # Просмотр словаря индекса слов не нужен, если триграммы заведомо дешевле
+            if self.keyword_index is None or (trigram is not None and trigram.cost <= self._vocabulary_cost(criteria)):
+                return trigram
+            paths = [path for path in (self._keyword_path(criteria), trigram) if path is not None]
+            return min(paths, key=lambda path: path.cost) if paths else None
+        if isinstance(criteria, WordForms) and self.stem_index is not None:
+            ids = self.stem_index.candidates(criteria.keyword)
+            if ids is None:
+                return None
+            return AccessPath(f"stems {criteria.keyword!r}", len(ids),
+                              (len(criteria.stems) + len(ids)) * LOOKUP_COST, lambda: ids)
+        if isinstance(criteria, IdIn) or (isinstance(criteria, Compare) and criteria.name == "id"):
+            ids = criteria.candidates(None, None)
+            if ids is None:
+                return None
+            return AccessPath(f"id ({len(ids)})", len(ids), len(ids) * LOOKUP_COST, lambda: ids)
+        if isinstance(criteria, (SalaryRange, Compare)) and self.salary_index is not None:
+            bounds = self._salary_bounds(criteria)
+            if bounds is None:
+                return None
+            rows = self.salary_index.count_between(*bounds)
+            return AccessPath(f"salary {bounds[0]:g}..{bounds[1]:g}", rows, rows * LOOKUP_COST,
+                              lambda: criteria.candidates(None, self.salary_index))
+        if isinstance(criteria, Or):
+            paths = [self._path(part, cache) for part in criteria.parts]
+            if not paths or any(path is None for path in paths):
+                return None
+            return AccessPath(" | ".join(path.label for path in paths),
+                              sum(path.rows for path in paths), sum(path.cost for path in paths),
+                              lambda: set().union(*(path.fetch() for path in paths)))
+        return None
+
+    def _keyword_path(self, criteria: Contains) -> Optional[AccessPath]:
+        """
+        Путь доступа по индексу слов. Кандидаты вычисляются сразу: это и есть
+        оценка, а крайние слова запроса требуют просмотра словаря.
+
+        Args:
+            criteria (Contains): Критерий вхождения строки
+
+        Returns:
+            Optional[AccessPath]: Путь доступа или None, если в запросе нет слов
+        """
+        ids = criteria.candidates(self.keyword_index, None)
+        if ids is None:
+            return None
+        return AccessPath(f"keyword {criteria.keyword!r}", len(ids),
+                          self._vocabulary_cost(criteria) + len(ids) * LOOKUP_COST, lambda: ids)
+
+    def _vocabulary_cost(self, criteria: Contains) -> float:
+        """
+        Стоимость просмотра словаря индекса слов: первое и последнее слово
+        запроса ищутся перебором словаря.
+
+        Args:
+            criteria (Contains): Критерий вхождения строки
+
+        Returns:
+            float: Стоимость
+        """
+        return len(self.keyword_index.postings) * TERM_COST if TOKEN_RE.search(criteria.keyword) else 0.0
+
+    def _trigram_path(self, criteria: Contains) -> Optional[AccessPath]:
+        """
+        Путь доступа по триграммному индексу: пересечение списков триграмм подстроки.
+        Оценка - размер самого короткого списка, стоимость - суммарная длина списков.
+
+        Args:
+            criteria (Contains): Критерий вхождения строки
+
+        Returns:
+            Optional[AccessPath]: Путь доступа или None, если подстрока короче трёх символов
+        """
+        if not set(criteria.fields) <= {"name", "requirement"}:
+            return None
+        lists = self.trigram_index.substring_lists(criteria.keyword)
+        if lists is None:
+            return None
+        return AccessPath(f"trigram {criteria.keyword!r}", len(lists[0]),
+                          sum(len(ids) for ids in lists) * LOOKUP_COST,
+                          lambda: self.trigram_index.substring_candidates(criteria.keyword))
+
+    @staticmethod
+    def _salary_bounds(criteria: Filter) -> Optional[tuple]:
+        """
+        Возвращает диапазон зарплат, покрывающий критерий.
+
+        Args:
+            criteria (Filter): SalaryRange или сравнение зарплаты
+
+        Returns:
+            Optional[tuple]: (нижняя, верхняя) граница или None
+        """
+        if isinstance(criteria, SalaryRange):
+            return criteria.lo, criteria.hi
+        if criteria.name != "salary" or not isinstance(criteria.value, (int, float)):
+            return None
+        if criteria.op in (">", ">="):
+            return criteria.value, float("inf")
+        if criteria.op in ("<", "<="):
+            return float("-inf"), criteria.value
+        if criteria.op == "==":
+            return criteria.value, criteria.value
+        return None
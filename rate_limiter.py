@@ -0,0 +1,175 @@
+from typing import Optional, Callable
+from email.utils import parsedate_to_datetime
+import random
+import threading
+import time
+
+# Ответы, после которых запрос имеет смысл повторить
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class TokenBucket:
+    """
+    Потокобезопасный ограничитель частоты запросов (token bucket) с адаптацией.
+    Каждый запрос забирает один токен, токены пополняются со скоростью rate в секунду.
+    При перегрузке сервера (429/5xx) скорость уменьшается вдвое, а при Retry-After
+    выдача токенов приостанавливается для всех потоков; после успешных ответов
+    скорость плавно возвращается к max_rate.
+    """
+
+    def __init__(self, rate: float = 20.0, capacity: Optional[float] = None,
+                 min_rate: float = 0.5, recovery: float = 0.5,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Инициализация ограничителя.
+
+        Args:
+            rate (float): Максимальное число запросов в секунду
+            capacity (Optional[float]): Размер "пачки" запросов без ожидания (по умолчанию равен rate)
+            min_rate (float): Нижняя граница скорости при снижении
+            recovery (float): Прибавка к скорости после каждого успешного ответа
+            clock (Callable[[], float]): Источник времени
+            sleep (Callable[[float], None]): Функция ожидания
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.min_rate = min_rate
+        self.recovery = recovery
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Забирает токен, при необходимости ожидая его появления.
+
+        Returns:
+            float: Сколько секунд пришлось ждать
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                else:
+                    delay = (1 - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+    def penalize(self, retry_after: Optional[float] = None) -> None:
+        """
+        Снижает скорость после ответа о перегрузке.
+
+        Args:
+            retry_after (Optional[float]): Пауза из заголовка Retry-After в секундах
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+
+    def reward(self) -> None:
+        """
+        Постепенно возвращает скорость к максимальной после успешного ответа.
+        """
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.recovery)
+
+    def _refill(self, now: float) -> None:
+        """
+        Пополняет токены за прошедшее время.
+
+        Args:
+            now (float): Текущее время
+        """
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+
+class RetryPolicy:
+    """
+    Параметры повторных попыток: число повторов и экспоненциальная задержка со случайным разбросом.
+    """
+
+    def __init__(self, max_retries: int = 4, backoff_base: float = 0.5, backoff_max: float = 30.0):
+        """
+        Инициализация политики повторов.
+
+        Args:
+            max_retries (int): Максимальное число повторов одного запроса
+            backoff_base (float): Базовая задержка в секундах
+            backoff_max (float): Максимальная задержка в секундах
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Возвращает задержку перед повтором ("full jitter").
+
+        Args:
+            attempt (int): Номер неудачной попытки, начиная с 0
+
+        Returns:
+            float: Задержка в секундах
+        """
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Разбирает заголовок Retry-After (число секунд или HTTP-дата).
+
+    Args:
+        value (Optional[str]): Значение заголовка
+
+    Returns:
+        Optional[float]: Пауза в секундах или None, если заголовок отсутствует или некорректен
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if moment is None:
+        return None
+    return max(0.0, moment.timestamp() - time.time())
+
+
+_shared_limiter: Optional[TokenBucket] = None
+_shared_lock = threading.Lock()
+
+
+def shared_limiter() -> TokenBucket:
+    """
+    Возвращает общий для процесса ограничитель, который используют все экземпляры HH.
+
+    Returns:
+        TokenBucket: Общий ограничитель
+    """
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = TokenBucket()
+        return _shared_limiter
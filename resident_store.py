@@ -0,0 +1,273 @@
+from typing import List, Dict, Any, Callable, Iterable, Optional, ContextManager
+import atexit
+import json
+import os
+import threading
+
+from user_request import UserAsk
+from keyword_index import file_signature
+from vacancy_filter import Filter
+from pagination import paginate
+
+
+class ResidentUserAsk(UserAsk):
+    """
+    Хранилище вакансий, целиком загруженное в память.
+    Файл читается один раз при создании, все запросы обслуживаются из словаря
+    по ID, а изменения сбрасываются на диск в фоне (write-behind): по таймеру
+    или после заданного числа изменений. Перед выходом данные сбрасываются в close().
+    """
+
+    def __init__(self, file_name: str, flush_interval: Optional[float] = 5.0,
+                 flush_threshold: int = 100, index: bool = False, trigrams: bool = False,
+                 morphology: bool = False):
+        """
+        Инициализация резидентного хранилища.
+
+        Args:
+            file_name (str): Имя файла для хранения вакансий
+            flush_interval (Optional[float]): Период фонового сброса в секундах
+                (None - сбрасывать только по порогу и явно)
+            flush_threshold (int): Число несохранённых изменений, после которого сброс запускается сразу
+            index (bool): Вести индекс слов для search_vac (сохраняется вместе с данными)
+            trigrams (bool): Вести триграммный индекс для поиска подстрок и fuzzy_search
+            morphology (bool): Искать в search_vac слова в любой форме
+                (индекс словоформ сохраняется вместе с данными)
+        """
+        super().__init__(file_name, index=index, trigrams=trigrams, morphology=morphology)
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self._data: Dict[str, Dict[str, Any]] = {v["id"]: v for v in self._load_data()}
+        if self.keyword_index is not None and not self.keyword_index.load(file_signature(file_name)):
+            self.keyword_index.rebuild(self._data.values())
+        if self.stem_index is not None and not self.stem_index.load(file_signature(file_name)):
+            self.stem_index.rebuild(self._data.values())
+        if self.salary_index is not None:
+            self.salary_index.rebuild(self._data.values())
+        if self.trigram_index is not None:
+            self.trigram_index.rebuild(self._data.values())
+        self._dirty = 0
+        self._lock = threading.RLock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._flusher = threading.Thread(target=self._flush_loop, name="vacancy-flusher", daemon=True)
+        self._flusher.start()
+        atexit.register(self.close)
+
+    def add_vacancy(self, vacancy: Dict[str, Any]) -> None:
+        """
+        Добавляет вакансию в память и помечает хранилище изменённым.
+
+        Args:
+            vacancy (Dict[str, Any]): Словарь с данными вакансии
+        """
+        vacancy_dict = self._make_record(vacancy)
+        with self._lock:
+            if vacancy_dict["id"] in self._data:
+                return
+            self._number(vacancy_dict)
+            self._data[vacancy_dict["id"]] = vacancy_dict
+            self._index_changed(added=[vacancy_dict])
+            self._mark_dirty()
+
+    def add_vacancies(self, vacancies: Iterable[Dict[str, Any]]) -> None:
+        """
+        Добавляет пачку вакансий в память.
+
+        Args:
+            vacancies (Iterable[Dict[str, Any]]): Вакансии для добавления
+        """
+        records = [self._make_record(vacancy) for vacancy in vacancies]
+        with self._lock:
+            added = []
+            for vacancy_dict in records:
+                if vacancy_dict["id"] not in self._data:
+                    self._number(vacancy_dict)
+                    self._data[vacancy_dict["id"]] = vacancy_dict
+                    added.append(vacancy_dict)
+            if added:
+                self._index_changed(added=added)
+                self._mark_dirty(len(added))
+
+    def update_vacancies(self, updates: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Дополняет вакансии в памяти новыми полями.
+
+        Args:
+            updates (Dict[str, Dict[str, Any]]): ID вакансии -> поля для добавления или замены
+
+        Returns:
+            int: Количество обновлённых вакансий
+        """
+        with self._lock:
+            removed, added = [], []
+            for vacancy_id, fields in updates.items():
+                vacancy = self._data.get(vacancy_id)
+                if vacancy is None or not fields:
+                    continue
+                updated = self._merge_fields(vacancy, fields)
+                self._data[vacancy_id] = updated
+                removed.append(vacancy)
+                added.append(updated)
+            if added:
+                self._index_changed(added=added, removed=removed)
+                self._mark_dirty(len(added))
+            return len(added)
+
+    def get_vacancies(self, criteria: Callable[[Dict[str, Any]], bool], limit: Optional[int] = None,
+                      cursor: Optional[str] = None, order: str = "insertion") -> List[Dict[str, Any]]:
+        """
+        Получает вакансии из памяти, соответствующие заданным критериям.
+
+        Args:
+            criteria (Callable[[Dict[str, Any]], bool]): Функция-критерий для фильтрации вакансий
+                или Filter (план запроса выбирает QueryPlanner)
+            limit (Optional[int]): Размер страницы (None - все вакансии списком)
+            cursor (Optional[str]): Курсор предыдущей страницы
+            order (str): Порядок страниц: insertion или salary
+
+        Returns:
+            List[Dict[str, Any]]: Список отфильтрованных вакансий или Page
+        """
+        with self._lock:
+            vacancies = list(self._data.values())
+            if limit is not None:
+                predicate = self._page_predicate(criteria, len(vacancies))
+            elif isinstance(criteria, Filter):
+                plan = self.planner.plan_filter(criteria, len(vacancies))
+                ids = plan.candidates()
+        if limit is not None:
+            return paginate(vacancies, self._sequence, predicate, limit, cursor, order)
+        if isinstance(criteria, Filter):
+            return self._execute_filter(plan, vacancies, criteria, ids)
+        return self._scan(vacancies, criteria)
+
+    def delete_vacancy(self, vacancy_id: str) -> bool:
+        """
+        Удаляет вакансию из памяти.
+
+        Args:
+            vacancy_id (str): ID вакансии для удаления
+
+        Returns:
+            bool: True если вакансия была удалена, False если не найдена
+        """
+        with self._lock:
+            vacancy = self._data.pop(vacancy_id, None)
+            if vacancy is None:
+                return False
+            # Номер добавления остаётся в _sequence: страница, собранная по снимку
+            # без блокировки, может ещё обратиться к нему
+            self._index_changed(removed=[vacancy])
+            self._mark_dirty()
+            return True
+
+    def flush(self) -> None:
+        """
+        Сбрасывает несохранённые изменения на диск.
+        Файл записывается во временный и атомарно подменяется.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                snapshot = self._with_sequence(self._data.values())
+                postings = self.keyword_index.dump() if self.keyword_index is not None else None
+                stems = self.stem_index.dump() if self.stem_index is not None else None
+                self._dirty = 0
+
+            tmp_name = self.file_name + ".tmp"
+            try:
+                with open(tmp_name, "w") as file:
+                    json.dump(snapshot, file, indent=4, ensure_ascii=False)
+                os.replace(tmp_name, self.file_name)
+                signature = file_signature(self.file_name)
+                if postings is not None:
+                    self.keyword_index.save(signature, postings)
+                if stems is not None:
+                    self.stem_index.save(signature, stems)
+            except OSError:
+                # Не потерять изменения: следующий сброс повторит запись
+                with self._lock:
+                    self._dirty += 1
+                raise
+
+    def close(self) -> None:
+        """
+        Останавливает фоновый сброс и записывает оставшиеся изменения.
+        Повторный вызов ничего не делает.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        if self._flusher is not threading.current_thread():
+            self._flusher.join()
+        self.flush()
+        atexit.unregister(self.close)
+        atexit.unregister(self.flush)
+
+    def __enter__(self) -> 'ResidentUserAsk':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _read_lock(self) -> ContextManager:
+        """
+        Возвращает блокировку данных в памяти.
+
+        Returns:
+            ContextManager: Блокировка хранилища
+        """
+        return self._lock
+
+    def _records_by_id(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Возвращает словарь вакансий в памяти без копирования.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: ID -> запись вакансии
+        """
+        return self._data
+
+    def _current_data(self) -> List[Dict[str, Any]]:
+        """
+        Возвращает вакансии из памяти; индексы поддерживаются при каждом изменении.
+
+        Returns:
+            List[Dict[str, Any]]: Список вакансий
+        """
+        with self._lock:
+            return list(self._data.values())
+
+    def _persist_indexes(self) -> None:
+        """
+        Индексы сохраняются вместе с данными в flush().
+        """
+
+    def _mark_dirty(self, count: int = 1) -> None:
+        """
+        Учитывает изменения и будит фоновый поток, если достигнут порог.
+
+        Args:
+            count (int): Число изменённых записей
+        """
+        self._dirty += count
+        if self._dirty >= self.flush_threshold:
+            self._wake.set()
+
+    def _flush_loop(self) -> None:
+        """
+        Фоновый цикл: сбрасывает изменения по таймеру или по сигналу порога.
+        """
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if self._closed:
+                break
+            try:
+                self.flush()
+            except OSError as e:
+                print(f"Ошибка при сохранении вакансий: {e}")
@@ -0,0 +1,151 @@
+from typing import List, Dict, Any, Iterable, Iterator, Tuple
+from bisect import bisect_left, bisect_right, insort
+
+# Ключ индекса: (зарплата, -порядковый номер добавления, ID).
+# Среди равных зарплат раньше добавленные вакансии стоят правее,
+# поэтому при чтении с конца они идут первыми, как при стабильной сортировке.
+SalaryKey = Tuple[float, int, str]
+
+
+class SalaryIndex:
+    """
+    Упорядоченный по зарплате индекс вакансий.
+    Ключи хранятся в отсортированном списке и вставляются через bisect,
+    поэтому топ-N и выборка по диапазону зарплат не требуют полной сортировки.
+    """
+
+    def __init__(self):
+        """
+        Инициализация пустого индекса.
+        """
+        self._keys: List[SalaryKey] = []
+        self._key_by_id: Dict[str, SalaryKey] = {}
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, vacancy: Dict[str, Any]) -> None:
+        """
+        Добавляет вакансию в индекс.
+
+        Args:
+            vacancy (Dict[str, Any]): Запись вакансии
+        """
+        if vacancy["id"] in self._key_by_id:
+            self.remove(vacancy)
+        self._seq += 1
+        key = (self.salary_of(vacancy), -self._seq, vacancy["id"])
+        self._key_by_id[vacancy["id"]] = key
+        insort(self._keys, key)
+
+    def remove(self, vacancy: Dict[str, Any]) -> None:
+        """
+        Удаляет вакансию из индекса.
+
+        Args:
+            vacancy (Dict[str, Any]): Запись вакансии
+        """
+        key = self._key_by_id.pop(vacancy["id"], None)
+        if key is None:
+            return
+        position = bisect_left(self._keys, key)
+        del self._keys[position]
+
+    def rebuild(self, vacancies: Iterable[Dict[str, Any]]) -> None:
+        """
+        Строит индекс заново по всем вакансиям.
+
+        Args:
+            vacancies (Iterable[Dict[str, Any]]): Записи вакансий
+        """
+        self._keys = []
+        self._key_by_id = {}
+        self._seq = 0
+        for vacancy in vacancies:
+            self._seq += 1
+            key = (self.salary_of(vacancy), -self._seq, vacancy["id"])
+            self._key_by_id[vacancy["id"]] = key
+            self._keys.append(key)
+        self._keys.sort()
+
+    def top(self, n: int) -> List[str]:
+        """
+        Возвращает ID N вакансий с наибольшей зарплатой.
+
+        Args:
+            n (int): Количество вакансий
+
+        Returns:
+            List[str]: ID вакансий по убыванию зарплаты
+        """
+        if n <= 0:
+            return []
+        return [key[2] for key in reversed(self._keys[-n:])]
+
+    def between(self, lo: float, hi: float) -> List[str]:
+        """
+        Возвращает ID вакансий с зарплатой в диапазоне [lo, hi].
+
+        Args:
+            lo (float): Нижняя граница зарплаты
+            hi (float): Верхняя граница зарплаты
+
+        Returns:
+            List[str]: ID вакансий по убыванию зарплаты
+        """
+        start = bisect_left(self._keys, (lo, float("-inf")))
+        end = bisect_right(self._keys, (hi, float("inf")))
+        return [key[2] for key in reversed(self._keys[start:end])]
+
+    def at_least(self, salary: float) -> List[str]:
+        """
+        Возвращает ID вакансий с зарплатой не ниже заданной.
+
+        Args:
+            salary (float): Минимальная зарплата
+
+        Returns:
+            List[str]: ID вакансий по убыванию зарплаты
+        """
+        start = bisect_left(self._keys, (salary, float("-inf")))
+        return [key[2] for key in reversed(self._keys[start:])]
+
+    def count_between(self, lo: float, hi: float) -> int:
+        """
+        Возвращает число вакансий с зарплатой в диапазоне [lo, hi] без выборки ID.
+
+        Args:
+            lo (float): Нижняя граница зарплаты
+            hi (float): Верхняя граница зарплаты
+
+        Returns:
+            int: Количество вакансий
+        """
+        start = bisect_left(self._keys, (lo, float("-inf")))
+        end = bisect_right(self._keys, (hi, float("inf")))
+        return max(0, end - start)
+
+    def iter_desc(self) -> Iterator[str]:
+        """
+        Перебирает ID вакансий по убыванию зарплаты (для выборки с ранней остановкой).
+
+        Returns:
+            Iterator[str]: ID вакансий
+        """
+        for key in reversed(self._keys):
+            yield key[2]
+
+    @staticmethod
+    def salary_of(vacancy: Dict[str, Any]) -> float:
+        """
+        Возвращает зарплату вакансии для сортировки (неуказанная считается нулевой).
+
+        Args:
+            vacancy (Dict[str, Any]): Запись вакансии
+
+        Returns:
+            float: Зарплата
+        """
+        salary = vacancy.get("salary")
+        return salary if isinstance(salary, (int, float)) else 0
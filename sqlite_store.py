@@ -0,0 +1,566 @@
+from typing import List, Dict, Any, Callable, FrozenSet, Iterable, Optional, Set
+import json
+import sqlite3
+import threading
+
+from user_request import UserAsk
+from morphology import vacancy_stems
+from vacancy_filter import Filter, Contains, WordForms
+from pagination import Page, check_order, decode_cursor, encode_cursor
+
+# Столбцы вакансии; поля, для которых нет столбца, хранятся в details как JSON
+FIELDS = ("id", "name", "url", "salary", "requirement")
+COLUMNS = ", ".join(FIELDS + ("details",))
+
+
+class SQLiteUserAsk(UserAsk):
+    """
+    Хранилище вакансий в базе SQLite.
+    Первичный ключ по ID вакансии, B-tree индекс по зарплате для top_salary
+    и полнотекстовая таблица FTS5 (триграммы) по названию и требованиям для search_vac.
+    Основы слов названия и требований вычисляются при записи и хранятся
+    в столбце stems с таблицей FTS5 по нему для поиска словоформ (WordForms);
+    проверка критериев тоже читает основы из столбца, а не разбирает тексты заново.
+    Может использоваться вместо UserAsk в HH и main.py.
+    """
+
+    def __init__(self, file_name: str, morphology: bool = False):
+        """
+        Инициализация SQLite-хранилища.
+
+        Args:
+            file_name (str): Имя файла базы данных
+            morphology (bool): Искать в search_vac слова в любой форме (по столбцу stems)
+        """
+        super().__init__(file_name)
+        self.morphology = morphology
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(file_name, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self.has_fts = False
+        self._create_schema()
+
+    def add_vacancy(self, vacancy: Dict[str, Any]) -> None:
+        """
+        Добавляет вакансию, если вакансии с таким ID ещё нет.
+
+        Args:
+            vacancy (Dict[str, Any]): Словарь с данными вакансии
+        """
+        self.add_vacancies([vacancy])
+
+    def add_vacancies(self, vacancies: Iterable[Dict[str, Any]]) -> None:
+        """
+        Добавляет пачку вакансий одной транзакцией.
+
+        Args:
+            vacancies (Iterable[Dict[str, Any]]): Вакансии для добавления
+        """
+        rows = [self._to_row(self._make_record(vacancy)) for vacancy in vacancies]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO vacancies (id, name, url, salary, requirement, stems) "
+                "VALUES (:id, :name, :url, :salary, :requirement, :stems)",
+                rows,
+            )
+
+    def update_vacancies(self, updates: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Дополняет вакансии новыми полями одной транзакцией.
+        Поля таблицы обновляются в своих столбцах, остальные - в JSON-столбце details.
+
+        Args:
+            updates (Dict[str, Dict[str, Any]]): ID вакансии -> поля для добавления или замены
+
+        Returns:
+            int: Количество обновлённых вакансий
+        """
+        updated = 0
+        with self._lock, self._conn:
+            for vacancy_id, fields in updates.items():
+                row = self._conn.execute("SELECT details FROM vacancies WHERE id = ?", (vacancy_id,)).fetchone()
+                if row is None or not fields:
+                    continue
+                details = json.loads(row["details"]) if row["details"] else {}
+                columns = {}
+                for name, value in fields.items():
+                    if name == "id":
+                        continue
+                    if name in FIELDS:
+                        columns[name] = value
+                    else:
+                        details[name] = value
+                assignments = "".join(f"{name} = :{name}, " for name in columns)
+                self._conn.execute(
+                    f"UPDATE vacancies SET {assignments}details = :details WHERE id = :id",
+                    dict(columns, details=json.dumps(details, ensure_ascii=False), id=vacancy_id),
+                )
+                if "name" in columns or "requirement" in columns:
+                    self._update_stems("id = ?", (vacancy_id,))
+                updated += 1
+        return updated
+
+    def get_vacancies(self, criteria: Callable[[Dict[str, Any]], bool], limit: Optional[int] = None,
+                      cursor: Optional[str] = None, order: str = "insertion") -> List[Dict[str, Any]]:
+        """
+        Получает вакансии, соответствующие заданным критериям.
+        С limit страница читается keyset-запросом (по rowid или по зарплате и ID).
+
+        Args:
+            criteria (Callable[[Dict[str, Any]], bool]): Функция-критерий для фильтрации вакансий
+                или Filter (переводится в условие WHERE по индексам таблицы)
+            limit (Optional[int]): Размер страницы (None - все вакансии списком)
+            cursor (Optional[str]): Курсор предыдущей страницы
+            order (str): Порядок страниц: insertion или salary
+
+        Returns:
+            List[Dict[str, Any]]: Список отфильтрованных вакансий или Page
+        """
+        if limit is not None:
+            return self._page(criteria, limit, cursor, order)
+        where = criteria.to_sql(self.has_fts) if isinstance(criteria, Filter) else None
+        if where is None:
+            vacancies = self._query(f"SELECT {self._columns(criteria)} FROM vacancies ORDER BY rowid")
+        elif criteria.exact:
+            return self._query(f"SELECT {COLUMNS} FROM vacancies WHERE {where[0]} ORDER BY rowid",
+                               tuple(where[1]))
+        else:
+            vacancies = self._query(f"SELECT {self._columns(criteria)} FROM vacancies "
+                                    f"WHERE {where[0]} ORDER BY rowid", tuple(where[1]))
+        return self._matching(vacancies, criteria)
+
+    def existing_ids(self, ids: Iterable[str]) -> Set[str]:
+        """
+        Проверяет, какие из ID уже есть в базе (поиск по первичному ключу).
+
+        Args:
+            ids (Iterable[str]): ID вакансий
+
+        Returns:
+            Set[str]: ID, которые есть в хранилище
+        """
+        ids = list(ids)
+        found = set()
+        with self._lock:
+            # Число параметров запроса в SQLite ограничено
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT id FROM vacancies WHERE id IN ({', '.join('?' * len(chunk))})", chunk
+                ).fetchall()
+                found.update(row["id"] for row in rows)
+        return found
+
+    def delete_vacancy(self, vacancy_id: str) -> bool:
+        """
+        Удаляет вакансию по её ID.
+
+        Args:
+            vacancy_id (str): ID вакансии для удаления
+
+        Returns:
+            bool: True если вакансия была удалена, False если не найдена
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM vacancies WHERE id = ?", (vacancy_id,))
+        return cursor.rowcount > 0
+
+    def search_vac(self, keyword: str, limit: Optional[int] = None, cursor: Optional[str] = None,
+                   order: str = "insertion") -> List[Dict[str, Any]]:
+        """
+        Поиск вакансий по ключевому слову в названии или описании.
+        Кандидаты берутся из триграммного индекса FTS5 и проверяются точным
+        сравнением подстроки; короткие (меньше 3 символов) ключевые слова
+        и базы без FTS5 обрабатываются полным просмотром.
+
+        Args:
+            keyword (str): Ключевое слово для поиска
+            limit (Optional[int]): Размер страницы (None - все найденные вакансии)
+            cursor (Optional[str]): Курсор предыдущей страницы
+            order (str): Порядок страниц: insertion или salary
+
+        Returns:
+            List[Dict[str, Any]]: Список найденных вакансий или Page
+        """
+        if self.morphology:
+            return self.get_vacancies(WordForms(keyword), limit=limit, cursor=cursor, order=order)
+        if limit is not None or not self.has_fts or len(keyword) < 3:
+            return self.get_vacancies(Contains(keyword), limit=limit, cursor=cursor, order=order)
+
+        candidates = self._query(
+            "SELECT v.id, v.name, v.url, v.salary, v.requirement, v.details "
+            "FROM vacancies_fts JOIN vacancies v ON v.rowid = vacancies_fts.rowid "
+            "WHERE vacancies_fts MATCH ? ORDER BY v.rowid",
+            ('"' + keyword.replace('"', '""') + '"',),
+        )
+        needle = keyword.lower()
+        return [
+            vacancy for vacancy in candidates
+            if needle in vacancy["name"].lower() or needle in vacancy["requirement"].lower()
+        ]
+
+    def top_salary(self, n: int, criteria: Optional[Callable[[Dict[str, Any]], bool]] = None) -> List[Dict[str, Any]]:
+        """
+        Возвращает топ N вакансий по зарплате (неуказанная считается нулевой),
+        читая индекс по зарплате с конца. Без критерия или с Filter, который точно
+        переводится в условие WHERE, выполняется один запрос с LIMIT; остальные
+        критерии (условие WHERE отсекает лишнее заранее) проверяются пачками
+        по убыванию зарплаты до N подходящих вакансий.
+
+        Args:
+            n (int): Количество вакансий для возврата
+            criteria (Optional[Callable[[Dict[str, Any]], bool]]): Критерий отбора (функция или Filter)
+
+        Returns:
+            List[Dict[str, Any]]: Список вакансий, отсортированных по зарплате
+        """
+        if n <= 0:
+            return []
+        where = criteria.to_sql(self.has_fts) if isinstance(criteria, Filter) else None
+        filter_sql, filter_params = (f" AND ({where[0]})", list(where[1])) if where is not None else ("", [])
+        if criteria is None or (where is not None and criteria.exact):
+            return self._query(
+                f"SELECT {COLUMNS} FROM vacancies WHERE 1{filter_sql} "
+                "ORDER BY COALESCE(salary, 0) DESC, rowid LIMIT ?",
+                tuple(filter_params + [n]),
+            )
+
+        columns = self._columns(criteria)
+        predicate = criteria.compile(self._row_stems) if isinstance(criteria, Filter) else criteria
+        result: List[Dict[str, Any]] = []
+        key: Optional[tuple] = None
+        # Пачки не меньше 100 строк, чтобы редкие совпадения не стоили запроса на строку
+        batch = max(n, 100)
+        while True:
+            if key is None:
+                keyset, params = "1", []
+            else:
+                keyset = "(COALESCE(salary, 0) < ? OR (COALESCE(salary, 0) = ? AND rowid > ?))"
+                params = [key[0], key[0], key[1]]
+            rows = self._query(
+                f"SELECT rowid AS row_key, {columns} FROM vacancies WHERE {keyset}{filter_sql} "
+                "ORDER BY COALESCE(salary, 0) DESC, rowid LIMIT ?",
+                tuple(params + filter_params + [batch]),
+            )
+            for vacancy in rows:
+                key = (vacancy["salary"] or 0, vacancy.pop("row_key"))
+                matched = predicate(vacancy)
+                vacancy.pop("stems", None)
+                if matched:
+                    result.append(vacancy)
+                    if len(result) >= n:
+                        return result
+            if len(rows) < batch:
+                return result
+
+    def salary_between(self, lo: float, hi: float) -> List[Dict[str, Any]]:
+        """
+        Возвращает вакансии с зарплатой от lo до hi включительно (диапазон по индексу).
+        Неуказанная зарплата считается нулевой, как в остальных хранилищах.
+
+        Args:
+            lo (float): Нижняя граница зарплаты
+            hi (float): Верхняя граница зарплаты
+
+        Returns:
+            List[Dict[str, Any]]: Список вакансий по убыванию зарплаты
+        """
+        return self._query(
+            f"SELECT {COLUMNS} FROM vacancies "
+            "WHERE COALESCE(salary, 0) BETWEEN ? AND ? ORDER BY COALESCE(salary, 0) DESC, rowid",
+            (lo, hi),
+        )
+
+    def salary_at_least(self, salary: float) -> List[Dict[str, Any]]:
+        """
+        Возвращает вакансии с зарплатой не ниже заданной (диапазон по индексу).
+        Неуказанная зарплата считается нулевой, как в остальных хранилищах.
+
+        Args:
+            salary (float): Минимальная зарплата
+
+        Returns:
+            List[Dict[str, Any]]: Список вакансий по убыванию зарплаты
+        """
+        return self._query(
+            f"SELECT {COLUMNS} FROM vacancies "
+            "WHERE COALESCE(salary, 0) >= ? ORDER BY COALESCE(salary, 0) DESC, rowid",
+            (salary,),
+        )
+
+    def close(self) -> None:
+        """
+        Закрывает соединение с базой данных.
+        """
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> 'SQLiteUserAsk':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _create_schema(self) -> None:
+        """
+        Создаёт таблицу вакансий, индексы и FTS5-таблицы (триграммы по тексту
+        и основы слов) с триггерами синхронизации. Если SQLite собран без FTS5
+        или без триграммного токенизатора, поиск работает полным просмотром
+        (словоформы - просмотром столбца stems).
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS vacancies ("
+                "id TEXT PRIMARY KEY, name TEXT NOT NULL, url TEXT NOT NULL, "
+                "salary INTEGER, requirement TEXT NOT NULL, details TEXT, stems TEXT)"
+            )
+            # Базы, созданные до появления столбца details
+            existing = {row["name"] for row in self._conn.execute("PRAGMA table_info(vacancies)")}
+            if "details" not in existing:
+                self._conn.execute("ALTER TABLE vacancies ADD COLUMN details TEXT")
+            # Базы, созданные до появления столбца stems: основы вычисляются один раз
+            if "stems" not in existing:
+                self._conn.execute("ALTER TABLE vacancies ADD COLUMN stems TEXT")
+                self._update_stems("stems IS NULL")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_vacancies_salary ON vacancies (salary)")
+            # Запросы по зарплате считают неуказанную нулевой: индекс по выражению
+            # отдаёт строки по убыванию зарплаты, а равные - в порядке добавления
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_vacancies_salary_or_zero "
+                               "ON vacancies (COALESCE(salary, 0) DESC)")
+
+        try:
+            with self._lock, self._conn:
+                # DDL не открывает транзакцию неявно, а executescript фиксирует её:
+                # операторы выполняются по одному внутри явной транзакции, чтобы при
+                # сбое (нет FTS5 или токенизатора) не осталось части таблиц и триггеров
+                self._conn.execute("BEGIN")
+                self._conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS vacancies_fts USING fts5("
+                    "name, requirement, content='vacancies', content_rowid='rowid', "
+                    "tokenize='trigram')"
+                )
+                self._conn.execute(
+                    "CREATE TRIGGER IF NOT EXISTS vacancies_ai AFTER INSERT ON vacancies BEGIN "
+                    "INSERT INTO vacancies_fts (rowid, name, requirement) "
+                    "VALUES (new.rowid, new.name, new.requirement); END"
+                )
+                self._conn.execute(
+                    "CREATE TRIGGER IF NOT EXISTS vacancies_ad AFTER DELETE ON vacancies BEGIN "
+                    "INSERT INTO vacancies_fts (vacancies_fts, rowid, name, requirement) "
+                    "VALUES ('delete', old.rowid, old.name, old.requirement); END"
+                )
+                self._conn.execute(
+                    "CREATE TRIGGER IF NOT EXISTS vacancies_au AFTER UPDATE ON vacancies BEGIN "
+                    "INSERT INTO vacancies_fts (vacancies_fts, rowid, name, requirement) "
+                    "VALUES ('delete', old.rowid, old.name, old.requirement); "
+                    "INSERT INTO vacancies_fts (rowid, name, requirement) "
+                    "VALUES (new.rowid, new.name, new.requirement); END"
+                )
+                # Основы слов уже приведены к нижнему регистру; диакритику не снимаем,
+                # чтобы "й" не совпадала с "и"
+                created = self._conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'vacancies_stems_fts'").fetchone() is None
+                self._conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS vacancies_stems_fts USING fts5("
+                    "stems, content='vacancies', content_rowid='rowid', "
+                    "tokenize=\"unicode61 remove_diacritics 0 tokenchars '_'\")"
+                )
+                self._conn.execute(
+                    "CREATE TRIGGER IF NOT EXISTS vacancies_stems_ai AFTER INSERT ON vacancies BEGIN "
+                    "INSERT INTO vacancies_stems_fts (rowid, stems) VALUES (new.rowid, new.stems); END"
+                )
+                self._conn.execute(
+                    "CREATE TRIGGER IF NOT EXISTS vacancies_stems_ad AFTER DELETE ON vacancies BEGIN "
+                    "INSERT INTO vacancies_stems_fts (vacancies_stems_fts, rowid, stems) "
+                    "VALUES ('delete', old.rowid, old.stems); END"
+                )
+                self._conn.execute(
+                    "CREATE TRIGGER IF NOT EXISTS vacancies_stems_au AFTER UPDATE OF stems ON vacancies BEGIN "
+                    "INSERT INTO vacancies_stems_fts (vacancies_stems_fts, rowid, stems) "
+                    "VALUES ('delete', old.rowid, old.stems); "
+                    "INSERT INTO vacancies_stems_fts (rowid, stems) VALUES (new.rowid, new.stems); END"
+                )
+                # Базы, созданные до появления таблицы основ
+                if created:
+                    self._conn.execute("INSERT INTO vacancies_stems_fts (vacancies_stems_fts) VALUES ('rebuild')")
+            self.has_fts = True
+        except sqlite3.OperationalError:
+            self.has_fts = False
+
+    def _page(self, criteria: Callable[[Dict[str, Any]], bool], limit: int,
+              cursor: Optional[str], order: str) -> Page:
+        """
+        Читает страницу keyset-запросами: строки после ключа курсора выбираются
+        пачками в порядке выдачи и проверяются критерием, пока не наберётся
+        limit + 1 подходящих (лишняя показывает, что есть следующая страница).
+
+        Args:
+            criteria (Callable[[Dict[str, Any]], bool]): Функция-критерий или Filter
+            limit (int): Размер страницы
+            cursor (Optional[str]): Курсор предыдущей страницы
+            order (str): insertion (по rowid) или salary (по зарплате и ID)
+
+        Returns:
+            Page: Страница и курсор следующей
+        """
+        check_order(order)
+        if limit <= 0:
+            raise ValueError("Размер страницы должен быть положительным числом")
+        state = decode_cursor(cursor, order) if cursor is not None else None
+        where = criteria.to_sql(self.has_fts) if isinstance(criteria, Filter) else None
+        filter_sql, filter_params = (f" AND ({where[0]})", list(where[1])) if where is not None else ("", [])
+        exact = where is not None and criteria.exact
+        columns = COLUMNS if exact else self._columns(criteria)
+        predicate = criteria.compile(self._row_stems) if isinstance(criteria, Filter) else criteria
+
+        try:
+            if order == "insertion":
+                key = (int(state["rowid"]),) if state is not None else (0,)
+            else:
+                key = (float(state["salary"]), str(state["id"])) if state is not None else None
+        except (KeyError, TypeError, ValueError):
+            raise ValueError("Некорректный курсор")
+
+        found: List[tuple] = []
+        batch = limit + 1
+        while len(found) <= limit:
+            if order == "insertion":
+                keyset, params, order_sql = "rowid > ?", list(key), "rowid"
+            elif key is None:
+                keyset, params, order_sql = "1", [], "COALESCE(salary, 0) DESC, id"
+            else:
+                keyset = "(COALESCE(salary, 0) < ? OR (COALESCE(salary, 0) = ? AND id > ?))"
+                params, order_sql = [key[0], key[0], key[1]], "COALESCE(salary, 0) DESC, id"
+            rows = self._query(
+                f"SELECT rowid AS row_key, {columns} FROM vacancies WHERE {keyset}{filter_sql} "
+                f"ORDER BY {order_sql} LIMIT ?",
+                tuple(params + filter_params + [batch]),
+            )
+            for vacancy in rows:
+                row_key = vacancy.pop("row_key")
+                key = (row_key,) if order == "insertion" else (vacancy["salary"] or 0, vacancy["id"])
+                matched = exact or predicate(vacancy)
+                vacancy.pop("stems", None)
+                if matched:
+                    found.append((key, vacancy))
+                    if len(found) > limit:
+                        break
+            if len(rows) < batch:
+                break
+
+        page = Page(vacancy for _, vacancy in found[:limit])
+        if len(found) > limit:
+            last_key = found[limit - 1][0]
+            state = {"o": order, "rowid": last_key[0]} if order == "insertion" \
+                else {"o": order, "salary": last_key[0], "id": last_key[1]}
+            page.next_cursor = encode_cursor(state)
+        return page
+
+    def _query(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        """
+        Выполняет запрос и возвращает строки в виде словарей вакансий
+        (поля из details добавляются в словарь).
+
+        Args:
+            sql (str): SQL-запрос
+            params (tuple): Параметры запроса
+
+        Returns:
+            List[Dict[str, Any]]: Список вакансий
+        """
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        vacancies = []
+        for row in rows:
+            vacancy = dict(row)
+            details = vacancy.pop("details", None)
+            if details:
+                vacancy.update(json.loads(details))
+            vacancies.append(vacancy)
+        return vacancies
+
+    @staticmethod
+    def _columns(criteria: Callable[[Dict[str, Any]], bool]) -> str:
+        """
+        Возвращает столбцы для строк, которые будут проверяться критерием:
+        для Filter добавляется столбец stems (основы слов для WordForms).
+
+        Args:
+            criteria (Callable[[Dict[str, Any]], bool]): Функция-критерий или Filter
+
+        Returns:
+            str: Список столбцов для SELECT
+        """
+        return f"{COLUMNS}, stems" if isinstance(criteria, Filter) else COLUMNS
+
+    def _matching(self, vacancies: List[Dict[str, Any]],
+                  criteria: Callable[[Dict[str, Any]], bool]) -> List[Dict[str, Any]]:
+        """
+        Проверяет строки критерием; предикат Filter читает основы слов из столбца
+        stems, который затем убирается из вакансий.
+
+        Args:
+            vacancies (List[Dict[str, Any]]): Строки, прочитанные со столбцами _columns(criteria)
+            criteria (Callable[[Dict[str, Any]], bool]): Функция-критерий или Filter
+
+        Returns:
+            List[Dict[str, Any]]: Подходящие вакансии
+        """
+        if not isinstance(criteria, Filter):
+            return [vacancy for vacancy in vacancies if criteria(vacancy)]
+        predicate = criteria.compile(self._row_stems)
+        result = []
+        for vacancy in vacancies:
+            if predicate(vacancy):
+                result.append(vacancy)
+            vacancy.pop("stems", None)
+        return result
+
+    @staticmethod
+    def _row_stems(vacancy: Dict[str, Any]) -> Optional[FrozenSet[str]]:
+        """
+        Возвращает основы слов из столбца stems прочитанной строки.
+
+        Args:
+            vacancy (Dict[str, Any]): Строка вакансии
+
+        Returns:
+            Optional[FrozenSet[str]]: Основы или None, если столбец не прочитан
+        """
+        stems = vacancy.get("stems")
+        return frozenset(stems.split()) if stems is not None else None
+
+    @staticmethod
+    def _to_row(vacancy: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Приводит запись вакансии к значениям столбцов таблицы.
+
+        Args:
+            vacancy (Dict[str, Any]): Запись вакансии
+
+        Returns:
+            Dict[str, Any]: Значения для вставки
+        """
+        row = dict(vacancy)
+        row["name"] = row["name"] or ""
+        row["url"] = row["url"] or ""
+        row["requirement"] = row["requirement"] or ""
+        row["stems"] = " ".join(sorted(vacancy_stems(row)))
+        return row
+
+    def _update_stems(self, where: str, params: tuple = ()) -> None:
+        """
+        Пересчитывает столбец stems для выбранных строк (вызывается внутри транзакции).
+
+        Args:
+            where (str): Условие выбора строк
+            params (tuple): Параметры условия
+        """
+        rows = self._conn.execute(f"SELECT rowid, name, requirement FROM vacancies WHERE {where}",
+                                  params).fetchall()
+        self._conn.executemany(
+            "UPDATE vacancies SET stems = ? WHERE rowid = ?",
+            [(" ".join(sorted(vacancy_stems(dict(row)))), row["rowid"]) for row in rows],
+        )
@@ -0,0 +1,140 @@
+from typing import Dict, Any, List, Optional, Iterable
+from datetime import datetime
+import hashlib
+import json
+import os
+import time
+
+# Сколько последних ID хранить для распознавания уже виденных вакансий
+# (столько же вакансий API отдаёт по одному запросу: 20 страниц по 100)
+MAX_KNOWN_IDS = 2000
+
+
+def parse_published_at(value: Optional[str]) -> Optional[datetime]:
+    """
+    Разбирает дату публикации вакансии из ответа API (например, 2024-05-01T12:00:00+0300).
+
+    Args:
+        value (Optional[str]): Дата публикации
+
+    Returns:
+        Optional[datetime]: Дата с часовым поясом или None, если формат не распознан
+    """
+    if not value:
+        return None
+    for fmt in ("%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+class SyncCursor:
+    """
+    Курсор инкрементальной синхронизации по ключевому слову.
+    Хранит дату публикации самой свежей из загруженных вакансий
+    и ID последних загруженных вакансий, чтобы следующая синхронизация
+    запрашивала только новые публикации и останавливалась на уже известных.
+    Если выдача не поместилась в лимит страниц, в gap хранится ещё не
+    загруженный промежуток дат публикации [от, до] (граница "от" может быть None).
+    """
+
+    def __init__(self, directory: str, keyword: str):
+        """
+        Инициализация курсора (существующий файл загружается).
+
+        Args:
+            directory (str): Каталог с файлами курсоров
+            keyword (str): Ключевое слово синхронизации
+        """
+        self.keyword = keyword
+        digest = hashlib.sha256(keyword.lower().encode("utf-8")).hexdigest()[:16]
+        self.file_name = os.path.join(directory, f"sync-{digest}.json")
+        self.published_at: Optional[str] = None
+        self.known_ids: List[str] = []
+        self.gap: Optional[List[Optional[str]]] = None
+        self._known = set()
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    def is_known(self, vacancy_id: Any) -> bool:
+        """
+        Проверяет, загружалась ли вакансия при прошлых синхронизациях.
+
+        Args:
+            vacancy_id: ID вакансии
+
+        Returns:
+            bool: True если вакансия уже известна
+        """
+        return str(vacancy_id) in self._known
+
+    def observe(self, items: Iterable[Dict[str, Any]]) -> None:
+        """
+        Учитывает вакансии из ответа API: сдвигает дату публикации и запоминает ID.
+
+        Args:
+            items (Iterable[Dict[str, Any]]): Вакансии из ответа API
+        """
+        latest = parse_published_at(self.published_at)
+        for item in items:
+            vacancy_id = str(item.get("id", ""))
+            if vacancy_id not in self._known:
+                self._known.add(vacancy_id)
+                self.known_ids.append(vacancy_id)
+            published = parse_published_at(item.get("published_at"))
+            if published is not None and (latest is None or self._later(published, latest)):
+                latest = published
+                self.published_at = item["published_at"]
+
+        if len(self.known_ids) > MAX_KNOWN_IDS:
+            dropped = self.known_ids[:-MAX_KNOWN_IDS]
+            self.known_ids = self.known_ids[-MAX_KNOWN_IDS:]
+            self._known.difference_update(dropped)
+
+    def save(self) -> None:
+        """
+        Атомарно записывает курсор.
+        """
+        state = {
+            "keyword": self.keyword,
+            "published_at": self.published_at,
+            "known_ids": self.known_ids,
+            "gap": self.gap,
+            "updated_at": time.time(),
+        }
+        tmp_name = self.file_name + ".tmp"
+        with open(tmp_name, "w", encoding="utf-8") as file:
+            json.dump(state, file, ensure_ascii=False, indent=4)
+        os.replace(tmp_name, self.file_name)
+
+    def _load(self) -> None:
+        """
+        Загружает сохранённый курсор, если файл есть.
+        """
+        try:
+            with open(self.file_name, "r", encoding="utf-8") as file:
+                stored = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        self.published_at = stored.get("published_at")
+        self.known_ids = [str(vacancy_id) for vacancy_id in stored.get("known_ids", [])]
+        self._known = set(self.known_ids)
+        self.gap = stored.get("gap")
+
+    @staticmethod
+    def _later(first: datetime, second: datetime) -> bool:
+        """
+        Сравнивает даты; даты без часового пояса считаются в том же поясе, что и вторая.
+
+        Args:
+            first (datetime): Первая дата
+            second (datetime): Вторая дата
+
+        Returns:
+            bool: True если первая дата позже второй
+        """
+        if (first.tzinfo is None) != (second.tzinfo is None):
+            first = first.replace(tzinfo=second.tzinfo)
+        return first > second
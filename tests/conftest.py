@@ -1,13 +1,31 @@
 import os
 import sys
 import pytest
-from typing import Dict, Any
+from typing import Callable, Dict, Any, Optional
 from unittest.mock import Mock
 
 # Добавляем корневую директорию проекта в sys.path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
+from rate_limiter import TokenBucket  # noqa: E402
+from hh_simulator import HHSimulator  # noqa: E402
+from HH import HH  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def fresh_rate_limiter(monkeypatch):
+    """Свой общий ограничитель частоты в каждом тесте, чтобы тесты не тормозили друг друга"""
+    limiter = TokenBucket(rate=1000)
+    monkeypatch.setattr("rate_limiter._shared_limiter", limiter)
+    return limiter
+
+@pytest.fixture
+def hh_simulator():
+    """Локальный имитатор API HeadHunter (задержку и ошибки можно настроить в тесте)"""
+    with HHSimulator(count=500) as simulator:
+        yield simulator
+
 @pytest.fixture
 def test_vacancy_data() -> Dict[str, Any]:
     """Фикстура с тестовыми данными вакансии"""
@@ -19,6 +37,30 @@ def test_vacancy_data() -> Dict[str, Any]:
         "description": "Python, Django required"
     }
 
+@pytest.fixture
+def make_vacancy() -> Callable[..., Dict[str, Any]]:
+    """Фабрика вакансий в формате хранилищ: make_vacancy("1", salary=150000)"""
+    def make(vacancy_id: str, salary: Optional[int] = 100000, name: Optional[str] = None,
+             url: Optional[str] = None, description: str = "Python") -> Dict[str, Any]:
+        return {"id": vacancy_id, "name": name or f"Dev {vacancy_id}",
+                "url": url or f"https://test.com/{vacancy_id}", "salary": salary,
+                "description": description}
+    return make
+
+@pytest.fixture
+def make_hh() -> Callable[..., HH]:
+    """Фабрика клиентов HH с быстрым ограничителем частоты: make_hh(file_worker, url=simulator.url)"""
+    def make(file_worker: Any, url: Optional[str] = None, per_page: Optional[int] = None,
+             **options: Any) -> HH:
+        options.setdefault("rate_limiter", TokenBucket(rate=1000))
+        hh = HH(file_worker, **options)
+        if url is not None:
+            hh.url = url
+        if per_page is not None:
+            hh.params["per_page"] = per_page
+        return hh
+    return make
+
 @pytest.fixture
 def test_file(tmp_path) -> str:
     """Фикстура для создания временного тестового файла"""
@@ -57,7 +99,7 @@ def mock_hh_response() -> Dict[str, Any]:
 
 @pytest.fixture
 def mock_requests_get(monkeypatch, mock_hh_response):
-    """Фикстура для мока requests.get"""
+    """Фикстура для мока запросов через requests.Session.get"""
     mock_response = Mock()
     mock_response.status_code = 200
     mock_response.json.return_value = mock_hh_response
@@ -65,7 +107,7 @@ def mock_requests_get(monkeypatch, mock_hh_response):
     def mock_get(*args, **kwargs):
         return mock_response
     
-    monkeypatch.setattr("requests.get", mock_get)
+    monkeypatch.setattr("requests.Session.get", mock_get)
     return mock_get
 
 @pytest.fixture
@@ -187,7 +187,7 @@ class TestJSONFileManager:
 
 # === Тесты UserAsk ===
 class TestUserAsk:
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_vacancies_from_hh(self, mock_get, mock_hh_response, test_file):
         mock_response = Mock()
         mock_response.json.return_value = mock_hh_response
@@ -240,7 +240,7 @@ class TestUserAsk:
         assert top_vacancies[0]["salary"] == 200000
         assert top_vacancies[1]["salary"] == 180000
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_error_handling(self, mock_get, test_file):
         # Настраиваем мок для имитации ошибки API
         mock_response = Mock()
@@ -257,7 +257,7 @@ class TestUserAsk:
 
 # === Тесты HH ===
 class TestHH:
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_vacancies_by_keyword(self, mock_get, mock_hh_response, test_file):
         mock_response = Mock()
         mock_response.json.return_value = mock_hh_response
@@ -271,7 +271,7 @@ class TestHH:
         assert len(vacancies) > 0
         assert "Python" in vacancies[0]["name"]
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_api_error_handling(self, mock_get, test_file):
         mock_response = Mock()
         mock_response.status_code = 404
@@ -318,7 +318,7 @@ class TestHH:
 
 # === Тесты Functionality ===
 class TestFunctionality:
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_full_workflow(self, mock_get, mock_hh_response, test_file):
         """Тест полного рабочего процесса: поиск, сохранение, фильтрация вакансий"""
         # Настраиваем мок для API
@@ -0,0 +1,148 @@
+import asyncio
+import json
+from urllib.parse import urlsplit, parse_qs
+from unittest.mock import Mock
+from async_hh import AsyncHH
+from user_request import UserAsk
+from rate_limiter import RetryPolicy
+
+
+def page_items(page, per_page=3):
+    return [{
+        "id": f"{page}-{i}",
+        "name": f"Python Developer {page}-{i}",
+        "alternate_url": f"https://hh.ru/vacancy/{page}-{i}",
+        "salary": {"from": 100000, "to": None},
+        "snippet": {"requirement": "Python"},
+    } for i in range(per_page)]
+
+
+class StubServer:
+    """Локальный asyncio-сервер, отвечающий как /vacancies"""
+
+    def __init__(self, latency=0.05, fail_page=None):
+        self.latency = latency
+        self.fail_page = fail_page
+        self.active = 0
+        self.max_active = 0
+        self.requests = 0
+
+    async def handle(self, reader, writer):
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            while (await reader.readline()) not in (b"\r\n", b""):
+                pass
+            query = parse_qs(urlsplit(request_line.split()[1].decode()).query)
+            page = int(query["page"][0])
+
+            self.requests += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            await asyncio.sleep(self.latency / (page + 1))
+            self.active -= 1
+
+            status = "500 Internal Server Error" if page == self.fail_page else "200 OK"
+            body = json.dumps({"items": page_items(page)}).encode()
+            writer.write(f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                         f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+            await writer.drain()
+        writer.close()
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/vacancies"
+        return self
+
+    async def __aexit__(self, *exc):
+        self.server.close()
+        await self.server.wait_closed()
+
+
+class AsyncStorage:
+    """Хранилище с асинхронными методами"""
+
+    def __init__(self):
+        self.batches = []
+
+    async def add_vacancies(self, vacancies):
+        await asyncio.sleep(0)
+        self.batches.append(list(vacancies))
+
+    async def get_vacancies(self, criteria):
+        return [v for batch in self.batches for v in batch if criteria(v)]
+
+    async def delete_vacancy(self, vacancy_id):
+        return False
+
+
+def make_client(file_worker, url, concurrency=4):
+    client = AsyncHH(file_worker, concurrency=concurrency, retry=RetryPolicy(max_retries=0))
+    client.hh.url = url
+    return client
+
+
+class TestAsyncHH:
+    def test_load_with_async_storage(self):
+        async def scenario():
+            storage = AsyncStorage()
+            async with StubServer() as server:
+                async with make_client(storage, server.url, concurrency=3) as client:
+                    vacancies = await client.load_vacancies("Python", 6)
+                    found = await client.get_vac(lambda v: v["id"].startswith("5-"))
+            return storage, server, vacancies, found
+
+        storage, server, vacancies, found = asyncio.run(scenario())
+        assert len(vacancies) == 18
+        assert [batch[0]["id"] for batch in storage.batches] == [f"{p}-0" for p in range(6)]
+        assert len(found) == 3
+        assert server.max_active == 3
+
+    def test_event_loop_not_blocked(self):
+        async def ticker(stop):
+            ticks = 0
+            while not stop.is_set():
+                await asyncio.sleep(0.005)
+                ticks += 1
+            return ticks
+
+        async def scenario():
+            async with StubServer(latency=0.2) as server:
+                async with make_client(Mock(), server.url) as client:
+                    stop = asyncio.Event()
+                    tick_task = asyncio.ensure_future(ticker(stop))
+                    await client.load_vacancies("Python", 2)
+                    stop.set()
+                    return await tick_task
+
+        assert asyncio.run(scenario()) > 10
+
+    def test_sync_storage_and_error(self, tmp_path):
+        user_ask = UserAsk(str(tmp_path / "vacancies.json"))
+
+        async def scenario():
+            async with StubServer(latency=0.01, fail_page=2) as server:
+                async with make_client(user_ask, server.url, concurrency=2) as client:
+                    loaded = await client.load_vacancies("Python", 5)
+                    items = await client.get_vacancies_by_keyword("Python")
+                    deleted = await client.del_vac("0-0")
+            return loaded, items, deleted
+
+        loaded, items, deleted = asyncio.run(scenario())
+        assert {v["id"].split("-")[0] for v in loaded} == {"0", "1"}
+        assert len(items) == 3
+        assert deleted is True
+        assert len(user_ask.get_vacancies(lambda v: True)) == 5
+
+    def test_add_vac_normalizes(self):
+        storage = Mock()
+
+        async def scenario():
+            client = AsyncHH(storage)
+            await client.add_vac(page_items(0, 1)[0])
+            client.close()
+
+        asyncio.run(scenario())
+        assert storage.add_vacancy.call_args[0][0]["url"] == "https://hh.ru/vacancy/0-0"
@@ -0,0 +1,111 @@
+import json
+import pytest
+from unittest.mock import Mock, patch
+from user_request import UserAsk
+from json_add_vac import JSONVacancy
+from journal_store import JournalUserAsk
+from resident_store import ResidentUserAsk
+from HH import HH
+
+
+def api_page(ids):
+    return {"items": [{
+        "id": vacancy_id,
+        "name": f"Python Developer {vacancy_id}",
+        "alternate_url": f"https://hh.ru/vacancy/{vacancy_id}",
+        "salary": {"from": 100000, "to": None},
+        "snippet": {"requirement": "Python"},
+    } for vacancy_id in ids]}
+
+
+def mock_pages(mock_get, pages):
+    def get(url, headers=None, params=None, **kwargs):
+        response = Mock()
+        response.json.return_value = api_page(pages[params["page"]])
+        return response
+    mock_get.side_effect = get
+
+
+class TestAddVacancies:
+    def test_user_ask_single_write(self, tmp_path, make_vacancy):
+        file_name = str(tmp_path / "vacancies.json")
+        user_ask = UserAsk(file_name)
+        user_ask.add_vacancy(make_vacancy("1"))
+
+        with patch.object(UserAsk, "_save_data", wraps=user_ask._save_data) as save:
+            user_ask.add_vacancies([make_vacancy("1"), make_vacancy("2"), make_vacancy("2"),
+                                    make_vacancy("3")])
+        assert save.call_count == 1
+        assert [v["id"] for v in user_ask.get_vacancies(lambda v: True)] == ["1", "2", "3"]
+
+    def test_user_ask_nothing_new(self, tmp_path):
+        file_name = str(tmp_path / "vacancies.json")
+        user_ask = UserAsk(file_name)
+        user_ask.add_vacancies([])
+        assert not (tmp_path / "vacancies.json").exists()
+
+    def test_json_vacancy(self, tmp_path, make_vacancy):
+        file_name = str(tmp_path / "vacancies.json")
+        manager = JSONVacancy(file_name)
+        manager.add_vacancies([make_vacancy("1"), make_vacancy("1"), make_vacancy("2")])
+        with open(file_name) as f:
+            assert [v["id"] for v in json.load(f)] == ["1", "2"]
+
+    def test_json_vacancy_nothing_new(self, tmp_path, make_vacancy):
+        file_name = str(tmp_path / "vacancies.json")
+        manager = JSONVacancy(file_name)
+        manager.add_vacancies([])
+        assert not (tmp_path / "vacancies.json").exists()
+
+        manager.add_vacancies([make_vacancy("1")])
+        with patch("json_add_vac.json.dump") as dump:
+            manager.add_vacancies([make_vacancy("1"), make_vacancy("1")])
+        dump.assert_not_called()
+
+    def test_journal_single_append(self, tmp_path, make_vacancy):
+        file_name = str(tmp_path / "vacancies.jsonl")
+        store = JournalUserAsk(file_name)
+        store.add_vacancies([make_vacancy("1"), make_vacancy("2"), make_vacancy("1")])
+        with open(file_name) as f:
+            assert len(f.readlines()) == 2
+
+    def test_resident(self, tmp_path, make_vacancy):
+        file_name = str(tmp_path / "vacancies.json")
+        with ResidentUserAsk(file_name, flush_interval=None) as store:
+            store.add_vacancies([make_vacancy("1"), make_vacancy("2")])
+            assert len(store.get_vacancies(lambda v: True)) == 2
+        with open(file_name) as f:
+            assert len(json.load(f)) == 2
+
+
+class TestLoadVacanciesBatching:
+    @patch('requests.Session.get')
+    def test_one_write_per_page(self, mock_get):
+        mock_pages(mock_get, [["1", "2"], ["2", "3"]])
+        file_worker = Mock()
+        hh = HH(file_worker)
+
+        vacancies = hh.load_vacancies("Python", 2)
+
+        assert [v["id"] for v in vacancies] == ["1", "2", "3"]
+        assert file_worker.add_vacancies.call_count == 2
+        file_worker.add_vacancy.assert_not_called()
+        stored = file_worker.add_vacancies.call_args_list[0][0][0]
+        assert stored[0] == {"id": "1", "name": "Python Developer 1",
+                             "url": "https://hh.ru/vacancy/1", "salary": 100000,
+                             "description": "Python"}
+
+    @patch('requests.Session.get')
+    def test_one_write_per_harvest(self, mock_get, tmp_path):
+        mock_pages(mock_get, [["1", "2"], ["3"]])
+        user_ask = UserAsk(str(tmp_path / "vacancies.json"))
+        hh = HH(user_ask)
+
+        with patch.object(UserAsk, "_save_data", wraps=user_ask._save_data) as save:
+            hh.load_vacancies("Python", 2, commit="harvest")
+        assert save.call_count == 1
+        assert len(user_ask.get_vacancies(lambda v: True)) == 3
+
+    def test_unknown_commit_mode(self):
+        with pytest.raises(ValueError):
+            HH(Mock()).load_vacancies("Python", 1, commit="item")
@@ -0,0 +1,75 @@
+import time
+import pytest
+from unittest.mock import Mock
+from cassette import Cassette, CassetteMiss
+from hh_simulator import HHSimulator
+from rate_limiter import RetryPolicy
+from user_request import UserAsk
+
+
+@pytest.fixture
+def recorded(tmp_path, make_hh):
+    """Кассета с тремя страницами выдачи, записанная с имитатора API"""
+    path = str(tmp_path / "hh.jsonl.gz")
+    with HHSimulator(count=300, latency=0.05) as simulator:
+        with Cassette(path, mode="record") as cassette:
+            hh = make_hh(Mock(), url=simulator.url, retry=RetryPolicy(max_retries=0), cassette=cassette)
+            vacancies = hh.load_vacancies("Python", pages=3)
+        url = simulator.url
+    return path, url, vacancies
+
+
+class TestCassette:
+    def test_file_is_compressed(self, recorded):
+        path, _, _ = recorded
+        with open(path, "rb") as file:
+            assert file.read(2) == b"\x1f\x8b"
+
+    def test_replay_offline(self, recorded, tmp_path, make_hh):
+        path, url, original = recorded
+        user_ask = UserAsk(str(tmp_path / "vacancies.json"))
+        hh = make_hh(user_ask, url=url, retry=RetryPolicy(max_retries=0), cassette=Cassette(path))
+
+        started = time.perf_counter()
+        vacancies = hh.load_vacancies("Python", pages=3)
+        elapsed = time.perf_counter() - started
+
+        assert vacancies == original
+        assert len(user_ask.get_vacancies(lambda v: True)) == 300
+        # Задержка имитатора (0.05 с на страницу) не воспроизводится
+        assert elapsed < 0.1
+
+    def test_replay_original_latency(self, recorded, make_hh):
+        path, url, _ = recorded
+        hh = make_hh(Mock(), url=url, retry=RetryPolicy(max_retries=0),
+                     cassette=Cassette(path, latency="original"))
+        hh.concurrency = 1
+
+        started = time.perf_counter()
+        hh.load_vacancies("Python", pages=3)
+
+        assert time.perf_counter() - started >= 0.15
+
+    def test_unknown_request_fails(self, recorded, make_hh):
+        path, url, _ = recorded
+        hh = make_hh(Mock(), url=url, retry=RetryPolicy(max_retries=0), cassette=Cassette(path))
+
+        with pytest.raises(CassetteMiss):
+            hh.load_vacancies("Java", pages=1)
+
+    def test_repeated_requests_in_order(self, tmp_path, make_hh):
+        path = str(tmp_path / "hh.jsonl.gz")
+        with HHSimulator(count=10) as simulator:
+            with Cassette(path, mode="record") as cassette:
+                hh = make_hh(Mock(), url=simulator.url, retry=RetryPolicy(max_retries=0),
+                             cassette=cassette)
+                simulator.error_rate = 1.0
+                assert hh._send(hh.headers, {"page": 0}).status_code == 503
+                simulator.error_rate = 0.0
+                assert hh._send(hh.headers, {"page": 0}).status_code == 200
+            url = simulator.url
+
+        replay = Cassette(path)
+        assert replay.play(url, {"page": 0}).status_code == 503
+        assert replay.play(url, {"page": "0"}).status_code == 200
+        assert replay.play(url, {"page": 0}).status_code == 200
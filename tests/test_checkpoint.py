@@ -0,0 +1,92 @@
+import json
+import os
+import pytest
+import requests
+from unittest.mock import Mock
+from checkpoint import HarvestCheckpoint
+from HH import HH
+from rate_limiter import RetryPolicy
+
+
+def page_response(page, fail=False):
+    response = Mock()
+    response.status_code = 200
+    if fail:
+        response.raise_for_status.side_effect = requests.HTTPError("502 Bad Gateway")
+    response.json.return_value = {"items": [{
+        "id": str(page), "name": f"Dev {page}", "alternate_url": f"https://hh.ru/vacancy/{page}",
+        "salary": None, "snippet": {"requirement": "Python"},
+    }]}
+    return response
+
+
+@pytest.fixture
+def checkpoint_hh(tmp_path, make_hh):
+    """Фабрика клиентов HH с контрольными точками и заданными сбойными страницами"""
+    def make(fail_pages=()):
+        file_worker = Mock()
+        hh = make_hh(file_worker, concurrency=1, checkpoint_dir=str(tmp_path / "checkpoints"),
+                     retry=RetryPolicy(max_retries=0))
+        requested = []
+
+        def get(url, headers=None, params=None, **kwargs):
+            requested.append(params["page"])
+            return page_response(params["page"], fail=params["page"] in fail_pages)
+
+        hh.session.get = Mock(side_effect=get)
+        return hh, file_worker, requested
+    return make
+
+
+class TestHarvestCheckpoint:
+    def test_roundtrip(self, tmp_path):
+        checkpoint = HarvestCheckpoint(str(tmp_path), "python", {"per_page": 100, "page": 3})
+        checkpoint.mark([0, 1, 3])
+        assert checkpoint.cursor == 2
+
+        reopened = HarvestCheckpoint(str(tmp_path), "python", {"per_page": 100, "page": 7})
+        assert reopened.pending(5) == [2, 4]
+        with open(reopened.file_name) as f:
+            assert json.load(f)["cursor"] == 2
+
+        other = HarvestCheckpoint(str(tmp_path), "python", {"per_page": 50})
+        assert other.pending(2) == [0, 1]
+
+        reopened.clear()
+        assert not os.path.exists(reopened.file_name)
+
+
+class TestResumableHarvest:
+    def test_resume_skips_committed_pages(self, tmp_path, checkpoint_hh):
+        hh, file_worker, requested = checkpoint_hh(fail_pages={3})
+        first = hh.load_vacancies("Python", 6)
+        assert [v["id"] for v in first] == ["0", "1", "2"]
+
+        hh, file_worker, requested = checkpoint_hh()
+        second = hh.load_vacancies("Python", 6, resume=True)
+        assert requested == [3, 4, 5]
+        assert [v["id"] for v in second] == ["3", "4", "5"]
+
+        # Загрузка завершена - контрольная точка удалена
+        assert os.listdir(str(tmp_path / "checkpoints")) == []
+
+    def test_without_resume_starts_over(self, checkpoint_hh):
+        hh, _, _ = checkpoint_hh(fail_pages={1})
+        hh.load_vacancies("Python", 3)
+
+        hh, _, requested = checkpoint_hh()
+        hh.load_vacancies("Python", 3)
+        assert requested == [0, 1, 2]
+
+    def test_harvest_commit_marks_pages(self, checkpoint_hh):
+        hh, file_worker, _ = checkpoint_hh(fail_pages={2})
+        hh.load_vacancies("Python", 4, commit="harvest")
+        assert file_worker.add_vacancies.call_count == 1
+
+        hh, _, requested = checkpoint_hh()
+        hh.load_vacancies("Python", 4, commit="harvest", resume=True)
+        assert requested == [2, 3]
+
+    def test_resume_requires_directory(self):
+        with pytest.raises(ValueError):
+            HH(Mock()).load_vacancies("Python", 2, resume=True)
@@ -0,0 +1,206 @@
+import json
+import threading
+import pytest
+import requests
+from unittest.mock import Mock, patch
+from HH import HH
+from detail_cache import DetailCache
+from json_add_vac import JSONVacancy
+from user_request import UserAsk
+from journal_store import JournalUserAsk
+from resident_store import ResidentUserAsk
+from sqlite_store import SQLiteUserAsk
+
+
+def detail_get(fail_id=None, together=0):
+    """
+    Ответ /vacancies/{id} с учётом числа одновременных запросов.
+    Первые together запросов отвечают только после того, как начаты все они.
+    """
+    calls = []
+    active = {"now": 0, "max": 0}
+    lock = threading.Lock()
+    started = threading.Barrier(together) if together else None
+    gate = {"left": together}
+
+    def get(url, headers=None, params=None, **kwargs):
+        vacancy_id = url.rsplit("/", 1)[1]
+        with lock:
+            calls.append(vacancy_id)
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+            gated = gate["left"] > 0
+            if gated:
+                gate["left"] -= 1
+        if gated:
+            started.wait(5)
+        with lock:
+            active["now"] -= 1
+        response = Mock()
+        if vacancy_id == fail_id:
+            response.raise_for_status.side_effect = requests.HTTPError("404 Not Found")
+        response.json.return_value = {
+            "id": vacancy_id,
+            "description": "<p>Пишем на <strong>Python</strong> &amp; Django</p>",
+            "key_skills": [{"name": "Python"}, {"name": "SQL"}],
+            "experience": {"id": "between1And3", "name": "От 1 года до 3 лет"},
+            "employment": {"id": "full", "name": "Полная занятость"},
+            "employer": {"id": "1", "name": "Компания"},
+        }
+        return response
+
+    return get, calls, active
+
+
+def mock_storage(ids):
+    """Mock-хранилище с записями вакансий ids, которое применяет update_vacancies"""
+    records = [{"id": vacancy_id, "name": f"Dev {vacancy_id}"} for vacancy_id in ids]
+    file_worker = Mock()
+    file_worker.get_vacancies.side_effect = lambda criteria: [v for v in records if criteria(v)]
+
+    def update_vacancies(updates):
+        for vacancy in records:
+            vacancy.update(updates.get(vacancy["id"], {}))
+        return len(updates)
+
+    file_worker.update_vacancies.side_effect = update_vacancies
+    return file_worker
+
+
+class TestEnrich:
+    def test_fields_are_extracted(self, tmp_path):
+        file_worker = mock_storage(["1"])
+        hh = HH(file_worker)
+        get, _, _ = detail_get()
+
+        with patch.object(hh.session, "get", side_effect=get):
+            updates = hh.enrich(["1"])
+
+        assert updates["1"] == {
+            "full_description": "Пишем на Python & Django",
+            "key_skills": ["Python", "SQL"],
+            "experience": "От 1 года до 3 лет",
+            "employment": "Полная занятость",
+            "employer": "Компания",
+        }
+        file_worker.update_vacancies.assert_called_once_with(updates)
+
+    def test_bounded_concurrency_and_cache(self, tmp_path):
+        cache = DetailCache(str(tmp_path / "details"))
+        hh = HH(mock_storage([str(i) for i in range(12)]), concurrency=3, detail_cache=cache)
+        get, calls, active = detail_get(together=3)
+
+        with patch.object(hh.session, "get", side_effect=get):
+            hh.enrich([str(i) for i in range(10)])
+            assert active["max"] == 3
+            calls.clear()
+            updates = hh.enrich([str(i) for i in range(12)])
+
+        assert sorted(calls) == ["10", "11"]
+        assert len(updates) == 12
+        assert len(list((tmp_path / "details" / "objects").iterdir())) == 12
+        assert len(DetailCache(str(tmp_path / "details"))) == 12
+
+    def test_cached_details_are_not_rewritten(self, tmp_path):
+        file_worker = mock_storage(["1", "2", "3"])
+        hh = HH(file_worker, detail_cache=DetailCache(str(tmp_path / "details")))
+        get, _, _ = detail_get()
+
+        with patch.object(hh.session, "get", side_effect=get):
+            hh.enrich(["1", "2"])
+            file_worker.update_vacancies.reset_mock()
+            hh.enrich(["1", "2", "3"])
+            assert list(file_worker.update_vacancies.call_args[0][0]) == ["3"]
+            file_worker.update_vacancies.reset_mock()
+            hh.enrich(["1", "2"])
+            file_worker.update_vacancies.assert_not_called()
+            hh.enrich(["1"], force=True)
+            assert list(file_worker.update_vacancies.call_args[0][0]) == ["1"]
+
+    def test_json_vacancy_storage(self, tmp_path, make_vacancy):
+        storage = JSONVacancy(str(tmp_path / "vacancies.json"))
+        storage.add_vacancies([make_vacancy("1")])
+        hh = HH(storage)
+        get, _, _ = detail_get()
+
+        with patch.object(hh.session, "get", side_effect=get):
+            hh.enrich(["1"])
+            assert storage.get_vacancies(lambda v: True)[0]["employer"] == "Компания"
+            with pytest.raises(TypeError):
+                HH(object()).enrich(["1"])
+
+    def test_cached_details_reach_later_stored_vacancy(self, tmp_path, make_vacancy):
+        storage = UserAsk(str(tmp_path / "vacancies.json"))
+        hh = HH(storage, detail_cache=DetailCache(str(tmp_path / "details")))
+        get, calls, _ = detail_get()
+
+        with patch.object(hh.session, "get", side_effect=get):
+            hh.enrich(["1"])
+            storage.add_vacancy(make_vacancy("1"))
+            hh.enrich(["1"])
+
+        # Второй вызов обслужен кэшем, но описание всё равно записано в новую запись
+        assert calls == ["1"]
+        assert storage.get_vacancies(lambda v: True)[0]["full_description"] == "Пишем на Python & Django"
+
+    def test_failed_id_is_skipped(self):
+        file_worker = mock_storage(["1", "2"])
+        hh = HH(file_worker)
+        get, _, _ = detail_get(fail_id="2")
+
+        with patch.object(hh.session, "get", side_effect=get):
+            updates = hh.enrich(["1", "2"])
+
+        assert list(updates) == ["1"]
+
+
+@pytest.fixture(params=["json", "journal", "resident", "sqlite"])
+def storage(request, tmp_path):
+    if request.param == "json":
+        store = UserAsk(str(tmp_path / "vacancies.json"), index=True)
+    elif request.param == "journal":
+        store = JournalUserAsk(str(tmp_path / "vacancies.jsonl"))
+    elif request.param == "resident":
+        store = ResidentUserAsk(str(tmp_path / "vacancies.json"), flush_interval=None)
+    else:
+        store = SQLiteUserAsk(str(tmp_path / "vacancies.db"))
+    yield store
+    if hasattr(store, "close"):
+        store.close()
+
+
+class TestUpdateVacancies:
+    def test_fields_are_merged(self, storage, make_vacancy):
+        storage.add_vacancies([make_vacancy("1"), make_vacancy("2")])
+
+        updated = storage.update_vacancies({
+            "1": {"key_skills": ["Python"], "employer": "Компания"},
+            "3": {"employer": "Нет такой"},
+        })
+
+        assert updated == 1
+        vacancies = {v["id"]: v for v in storage.get_vacancies(lambda v: True)}
+        assert vacancies["1"]["key_skills"] == ["Python"]
+        assert vacancies["1"]["employer"] == "Компания"
+        assert vacancies["1"]["name"] == "Dev 1"
+        assert "employer" not in vacancies["2"]
+
+    def test_updated_name_is_searchable(self, storage, make_vacancy):
+        storage.add_vacancies([make_vacancy("1")])
+        storage.update_vacancies({"1": {"name": "Senior Rust Developer"}})
+
+        assert [v["id"] for v in storage.search_vac("Rust")] == ["1"]
+
+    def test_journal_appends_single_line(self, tmp_path, make_vacancy):
+        store = JournalUserAsk(str(tmp_path / "vacancies.jsonl"))
+        store.add_vacancies([make_vacancy("1"), make_vacancy("2")])
+        size = (tmp_path / "vacancies.jsonl").stat().st_size
+
+        store.update_vacancies({"1": {"employer": "Компания"}, "2": {"employer": "Другая"}})
+
+        with open(tmp_path / "vacancies.jsonl", "rb") as file:
+            file.seek(size)
+            tail = [json.loads(line) for line in file.read().splitlines()]
+        assert [entry["op"] for entry in tail] == ["upd", "upd"]
+        reopened = JournalUserAsk(str(tmp_path / "vacancies.jsonl"))
+        assert reopened.get_vacancies(lambda v: v["id"] == "2")[0]["employer"] == "Другая"
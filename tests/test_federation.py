@@ -0,0 +1,168 @@
+import json
+import threading
+import time
+import pytest
+import requests
+from unittest.mock import Mock
+from CAPI import Parser
+from federation import SourceRegistry, FederatedSearcher, normalize_record
+from file_source import FileSource
+from rate_limiter import RetryPolicy
+
+
+def write_source(path, vacancies):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(vacancies, file, ensure_ascii=False)
+    return str(path)
+
+
+@pytest.fixture
+def registry(tmp_path, make_vacancy):
+    registry = SourceRegistry()
+    registry.register("first", FileSource(write_source(tmp_path / "first.json", [
+        make_vacancy("1", name="Python Developer"),
+        make_vacancy("2", name="Java Developer"),
+        make_vacancy("3", name="Senior Python", url="https://shared.test/3"),
+    ])))
+    registry.register("second", FileSource(write_source(tmp_path / "second.json", [
+        make_vacancy("1", name="Python Engineer", url="https://other.test/1"),
+        make_vacancy("9", name="Python Lead", url="https://shared.test/3"),
+    ])))
+    return registry
+
+
+def test_normalize_record():
+    hh_record = {"id": 5, "name": "Dev", "alternate_url": "https://hh.ru/vacancy/5",
+                 "salary": {"from": 100, "to": None}, "snippet": {"requirement": "Python"}}
+    assert normalize_record(hh_record, "hh") == {
+        "id": "5", "name": "Dev", "url": "https://hh.ru/vacancy/5", "salary": 100,
+        "description": "Python", "source": "hh"}
+    assert normalize_record({"id": "6", "name": "Dev", "salary": None, "requirement": "SQL"}, "db")["salary"] == 0
+
+
+def test_merge_without_duplicates(registry):
+    with FederatedSearcher(registry) as searcher:
+        vacancies = searcher.search("Python")
+
+    assert [(v["source"], v["id"]) for v in vacancies] == [("first", "1"), ("first", "3"), ("second", "1")]
+    assert searcher.report["first"]["status"] == "ok"
+    assert searcher.report["second"]["count"] == 2
+
+
+@pytest.fixture
+def blocking_source(tmp_path, make_vacancy):
+    """Файловый источник, поиск в котором ждёт события release"""
+    def make(name, release):
+        source = FileSource(write_source(tmp_path / f"{name}.json", [make_vacancy("7", name="Python")]))
+        search_vac = source.file_worker.search_vac
+        source.file_worker.search_vac = lambda keyword: release.wait(5) and search_vac(keyword)
+        return source
+    return make
+
+
+def test_slow_source_does_not_delay_search(registry, blocking_source):
+    release = threading.Event()
+    registry.register("slow", blocking_source("slow", release), timeout=0.2)
+
+    try:
+        with FederatedSearcher(registry) as searcher:
+            started = time.monotonic()
+            vacancies = searcher.search("Python")
+            elapsed = time.monotonic() - started
+
+            assert elapsed < 1.0
+            assert len(vacancies) == 3
+            assert searcher.report["slow"]["status"] == "timeout"
+            assert searcher.hung == ["slow"]
+
+            # Зависший источник не опрашивается повторно, пока не завершится
+            searcher.search("Python")
+            assert searcher.report["slow"]["status"] == "busy"
+            release.set()
+            while searcher.hung:
+                time.sleep(0.01)
+            searcher.search("Python")
+            assert searcher.report["slow"]["status"] == "ok"
+    finally:
+        release.set()
+
+
+def test_many_sources_do_not_wait_in_queue(blocking_source):
+    # Источников больше, чем потоков в общем пуле: все успевают, никто не ждёт очереди
+    release = threading.Event()
+    registry = SourceRegistry()
+    for number in range(12):
+        registry.register(f"source{number}", blocking_source(f"source{number}", release), timeout=2.0)
+    threading.Timer(0.1, release.set).start()
+
+    with FederatedSearcher(registry) as searcher:
+        searcher.search("Python")
+
+    assert {report["status"] for report in searcher.report.values()} == {"ok"}
+
+
+def test_failing_source_is_reported(registry, tmp_path):
+    broken = FileSource(write_source(tmp_path / "broken.json", []))
+    broken.file_worker.search_vac = Mock(side_effect=OSError("disk error"))
+    registry.register("broken", broken)
+
+    with FederatedSearcher(registry) as searcher:
+        vacancies = searcher.search("Python")
+
+    assert len(vacancies) == 3
+    assert searcher.report["broken"]["status"] == "error"
+    assert searcher.report["broken"]["error"] == "disk error"
+
+
+def test_hh_and_file_sources(hh_simulator, tmp_path, make_vacancy, make_hh):
+    hh = make_hh(None, url=hh_simulator.url, retry=RetryPolicy(max_retries=0))
+    registry = SourceRegistry()
+    registry.register("hh", hh)
+    registry.register("file", FileSource(write_source(tmp_path / "file.json", [make_vacancy("x1", name="Python")])))
+
+    with FederatedSearcher(registry, timeout=5.0) as searcher:
+        vacancies = searcher.search("Python", pages=2)
+
+    assert searcher.report["hh"] == {**searcher.report["hh"], "status": "ok", "count": 200}
+    assert len(vacancies) == 201
+    assert vacancies[-1]["source"] == "file"
+
+
+def test_register_rejects_duplicates(registry, tmp_path):
+    with pytest.raises(ValueError):
+        registry.register("first", FileSource(str(tmp_path / "other.json")))
+    with pytest.raises(TypeError):
+        registry.register("plain", object())
+
+    class NoSearch(Parser):
+        def add_vac(self, vacancy):
+            pass
+
+        def get_vac(self, criteria):
+            return []
+
+        def del_vac(self, vacancy_id):
+            return False
+
+    # Источник без поиска нельзя даже создать, а значит и зарегистрировать
+    with pytest.raises(TypeError):
+        registry.register("no_search", NoSearch())
+    assert registry.unregister("second")
+    assert [name for name, _, _ in registry.items()] == ["first"]
+
+
+def test_hh_search_keeps_loaded_pages(hh_simulator, make_hh):
+    hh = make_hh(None, url=hh_simulator.url, retry=RetryPolicy(max_retries=0))
+    fetch_page = hh._fetch_page
+
+    def flaky(keyword, page):
+        if page == 1:
+            raise requests.ConnectionError("обрыв")
+        return fetch_page(keyword, page)
+
+    hh._fetch_page = flaky
+    assert len(hh.search("Python", pages=3)) == 200
+
+    hh._fetch_page = Mock(side_effect=requests.ConnectionError("нет сети"))
+    with pytest.raises(requests.ConnectionError):
+        hh.search("Python", pages=2)
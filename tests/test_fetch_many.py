@@ -0,0 +1,77 @@
+import json
+import threading
+import requests
+from unittest.mock import Mock, patch
+from user_request import UserAsk
+
+# Выдача по словам: вакансия "2" находится и по Python, и по Django
+RESULTS = {
+    "Python": [["1", "2"], ["3"]],
+    "Django": [["2", "4"], ["4"]],
+}
+
+
+def api_item(vacancy_id):
+    return {
+        "id": vacancy_id,
+        "name": f"Developer {vacancy_id}",
+        "alternate_url": f"https://hh.ru/vacancy/{vacancy_id}",
+        "salary": {"from": 100000, "to": None},
+        "snippet": {"requirement": "Опыт от года"},
+    }
+
+
+def fake_get(fail=None):
+    calls = []
+    lock = threading.Lock()
+
+    def get(url, headers=None, params=None, **kwargs):
+        with lock:
+            calls.append((params["text"], params["page"]))
+        response = Mock()
+        if (params["text"], params["page"]) == fail:
+            response.raise_for_status.side_effect = requests.HTTPError("500 Server Error")
+        pages = RESULTS[params["text"]]
+        ids = pages[params["page"]] if params["page"] < len(pages) else []
+        response.json.return_value = {"items": [api_item(i) for i in ids]}
+        return response
+
+    return get, calls
+
+
+class TestFetchMany:
+    def test_hits_and_union(self, tmp_path):
+        user_ask = UserAsk(str(tmp_path / "vacancies.json"))
+        get, calls = fake_get()
+
+        with patch("requests.Session.get", side_effect=get):
+            hits, union = user_ask.fetch_many(["Python", "Django"], pages=2)
+
+        assert sorted(calls) == [("Django", 0), ("Django", 1), ("Python", 0), ("Python", 1)]
+        assert [v["id"] for v in hits["Python"]] == ["1", "2", "3"]
+        assert [v["id"] for v in hits["Django"]] == ["2", "4"]
+        assert [v["id"] for v in union] == ["1", "2", "3", "4"]
+
+        with open(user_ask.file_name, encoding="utf-8") as file:
+            stored = json.load(file)
+        assert [v["id"] for v in stored] == ["1", "2", "3", "4"]
+
+    def test_single_storage_write(self, tmp_path):
+        user_ask = UserAsk(str(tmp_path / "vacancies.json"))
+        get, _ = fake_get()
+
+        with patch("requests.Session.get", side_effect=get), \
+                patch.object(UserAsk, "_save_data", autospec=True) as save:
+            user_ask.fetch_many(["Python", "Django"], pages=2)
+
+        assert save.call_count == 1
+
+    def test_failed_page_is_skipped(self, tmp_path):
+        user_ask = UserAsk(str(tmp_path / "vacancies.json"))
+        get, _ = fake_get(fail=("Python", 1))
+
+        with patch("requests.Session.get", side_effect=get):
+            hits, union = user_ask.fetch_many(["Python", "Django"], pages=2)
+
+        assert [v["id"] for v in hits["Python"]] == ["1", "2"]
+        assert [v["id"] for v in union] == ["1", "2", "4"]
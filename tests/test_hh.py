@@ -33,7 +33,7 @@ class TestHH(unittest.TestCase):
         # Тест с пустыми данными
         self.assertEqual(self.hh._parse_salary(None), 0)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_load_vacancies(self, mock_get):
         # Мокаем ответ API
         mock_response = Mock()
@@ -52,7 +52,7 @@ class TestHH(unittest.TestCase):
         
         self.assertEqual(len(vacancies), 1)
         self.assertEqual(vacancies[0]['name'], 'Python Developer')
-        self.mock_file_worker.add_vacancy.assert_called_once()
+        self.mock_file_worker.add_vacancies.assert_called_once()
 
     def test_add_vac(self):
         vacancy = {
@@ -0,0 +1,110 @@
+import json
+import os
+import threading
+import time
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from unittest.mock import Mock
+from hh_cache import ResponseCache
+
+
+class ETagServer:
+    """Локальный сервер /vacancies с поддержкой ETag"""
+
+    def __init__(self):
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query)
+                page = int(query["page"][0])
+                etag = f'"page-{page}"'
+                server.requests.append((page, self.headers.get("If-None-Match")))
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                body = json.dumps({"items": [{
+                    "id": str(page), "name": "Python Developer",
+                    "alternate_url": f"https://hh.ru/vacancy/{page}",
+                    "salary": None, "snippet": {"requirement": "Python"},
+                }]}).encode()
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/vacancies"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    srv = ETagServer()
+    yield srv
+    srv.close()
+
+
+class TestResponseCache:
+    def test_key_normalizes_text(self):
+        key = ResponseCache.make_key
+        assert key("u", {"text": "Python  Developer ", "page": 0}) == key("u", {"page": "0", "text": "python developer"})
+        assert key("u", {"text": "python", "page": 0}) != key("u", {"text": "python", "page": 1})
+
+    def test_lru_eviction(self, tmp_path):
+        cache = ResponseCache(str(tmp_path), max_bytes=450)
+        for page in range(3):
+            cache.put("u", {"page": page}, {"items": ["x" * 50]})
+        cache.get("u", {"page": 0})  # страница 0 стала недавно использованной
+        cache.put("u", {"page": 3}, {"items": ["x" * 50]})
+
+        assert cache.get("u", {"page": 1}) is None
+        assert cache.get("u", {"page": 0}) is not None
+        assert cache.stats()["bytes"] <= 450
+
+    def test_persists_between_instances(self, tmp_path):
+        ResponseCache(str(tmp_path)).put("u", {"page": 0}, {"items": [1]})
+        cache = ResponseCache(str(tmp_path))
+        assert cache.get("u", {"page": 0}).body == {"items": [1]}
+        assert cache.stats()["entries"] == 1
+
+
+class TestHHCache:
+    def test_repeat_harvest_served_locally(self, tmp_path, server, make_hh):
+        cache = ResponseCache(str(tmp_path / "cache"), ttl=60)
+        first = make_hh(Mock(), url=server.url, concurrency=2, cache=cache).load_vacancies("Python", 3)
+        second = make_hh(Mock(), url=server.url, concurrency=2, cache=cache).load_vacancies("python", 3)
+
+        assert first == second
+        assert len(server.requests) == 3
+        assert cache.stats()["hits"] == 3
+        assert cache.stats()["misses"] == 3
+
+    def test_stale_entry_revalidated(self, tmp_path, server, make_hh):
+        cache = ResponseCache(str(tmp_path / "cache"), ttl=0)
+        make_hh(Mock(), url=server.url, concurrency=2, cache=cache).load_vacancies("Python", 2)
+        vacancies = make_hh(Mock(), url=server.url, concurrency=2, cache=cache).load_vacancies("Python", 2)
+
+        assert [v["id"] for v in vacancies] == ["0", "1"]
+        assert sorted(server.requests[2:]) == [(0, '"page-0"'), (1, '"page-1"')]
+        assert cache.stats()["revalidations"] == 2
+
+    def test_get_vacancies_by_keyword_cached(self, tmp_path, server, make_hh):
+        cache = ResponseCache(str(tmp_path / "cache"))
+        hh = make_hh(Mock(), url=server.url, concurrency=2, cache=cache)
+        assert hh.get_vacancies_by_keyword("Python") == hh.get_vacancies_by_keyword("Python")
+        assert len(server.requests) == 1
@@ -0,0 +1,92 @@
+import threading
+import requests
+from unittest.mock import Mock, patch
+from HH import HH
+
+
+def page_items(page):
+    return [{
+        "id": f"{page}-{i}",
+        "name": f"Python Developer {page}-{i}",
+        "alternate_url": f"https://hh.ru/vacancy/{page}-{i}",
+        "salary": None,
+        "snippet": {"requirement": "Python"},
+    } for i in range(2)]
+
+
+def gated_get(hold=lambda page: None, fail_page=None):
+    """Ответ сервера, который hold(page) задерживает до нужного события"""
+    active = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    def get(url, headers=None, params=None, **kwargs):
+        with lock:
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+        try:
+            hold(params["page"])
+            response = Mock()
+            if params["page"] == fail_page:
+                response.raise_for_status.side_effect = requests.HTTPError("500 Server Error")
+            response.json.return_value = {"items": page_items(params["page"])}
+            return response
+        finally:
+            with lock:
+                active["now"] -= 1
+
+    return get, active
+
+
+class TestConcurrentLoad:
+    def test_pages_committed_in_order(self):
+        # Первая страница отвечает последней из окна, но записывается первой
+        started = threading.Barrier(4)
+        answered = threading.Semaphore(0)
+
+        def hold(page):
+            if page < 4:
+                started.wait(5)  # все четыре запроса окна выполняются одновременно
+            if page == 0:
+                assert all(answered.acquire(timeout=5) for _ in range(3))
+            elif page < 4:
+                answered.release()
+
+        get, active = gated_get(hold)
+        file_worker = Mock()
+        hh = HH(file_worker, concurrency=4)
+
+        with patch.object(hh.session, "get", side_effect=get):
+            vacancies = hh.load_vacancies("Python", 6)
+
+        pages = [call[0][0][0]["id"].split("-")[0] for call in file_worker.add_vacancies.call_args_list]
+        assert pages == ["0", "1", "2", "3", "4", "5"]
+        assert [v["id"] for v in vacancies][:3] == ["0-0", "0-1", "1-0"]
+        assert active["max"] == 4
+
+    def test_pages_fetched_in_parallel(self):
+        # Ни одна страница не ответит, пока не начаты запросы всех восьми
+        started = threading.Barrier(8)
+        get, active = gated_get(lambda page: started.wait(5))
+        hh = HH(Mock(), concurrency=8)
+
+        with patch.object(hh.session, "get", side_effect=get):
+            vacancies = hh.load_vacancies("Python", 8)
+
+        assert len(vacancies) == 16
+        assert active["max"] == 8
+
+    def test_error_keeps_earlier_pages(self):
+        get, _ = gated_get(fail_page=2)
+        file_worker = Mock()
+        hh = HH(file_worker, concurrency=2)
+
+        with patch.object(hh.session, "get", side_effect=get):
+            vacancies = hh.load_vacancies("Python", 5)
+
+        assert {v["id"].split("-")[0] for v in vacancies} == {"0", "1"}
+        assert file_worker.add_vacancies.call_count == 2
+
+    def test_session_pool_size(self):
+        hh = HH(Mock(), concurrency=6)
+        adapter = hh.session.get_adapter("https://api.hh.ru/vacancies")
+        assert adapter._pool_maxsize == 6
@@ -0,0 +1,54 @@
+import requests
+from rate_limiter import RetryPolicy
+from unittest.mock import Mock
+
+
+class TestHHSimulator:
+    def test_pagination(self, hh_simulator, make_hh):
+        hh = make_hh(Mock(), url=hh_simulator.url)
+
+        vacancies = hh.load_vacancies("Python", pages=3)
+
+        assert len(vacancies) == 300
+        assert len({v["id"] for v in vacancies}) == 300
+        assert hh_simulator.requests == 3
+
+    def test_corpus_follows_sample_file(self, hh_simulator):
+        vacancy = hh_simulator.corpus[0]
+        assert vacancy["name"]
+        assert vacancy["alternate_url"].startswith("https://hh.ru/vacancy/")
+        assert vacancy["salary"] is None or vacancy["salary"]["from"] > 0
+
+    def test_depth_limit(self, hh_simulator, make_hh):
+        hh_simulator.max_depth = 200
+        hh = make_hh(Mock(), url=hh_simulator.url)
+
+        response = requests.get(hh_simulator.url, params={"page": 2, "per_page": 100})
+        assert response.status_code == 400
+        assert len(hh.load_vacancies("Python", pages=5)) == 200
+
+    def test_throttling_is_retried(self, hh_simulator, make_hh):
+        hh_simulator.throttle_rate = 0.3
+        hh_simulator.retry_after = 0.01
+        hh = make_hh(Mock(), url=hh_simulator.url, retry=RetryPolicy(max_retries=10, backoff_base=0.01))
+
+        vacancies = hh.load_vacancies("Python", pages=5)
+
+        assert len(vacancies) == 500
+        assert hh_simulator.statuses[429] > 0
+
+    def test_server_errors_without_retries(self, hh_simulator, make_hh):
+        hh_simulator.error_rate = 1.0
+        hh = make_hh(Mock(), url=hh_simulator.url, retry=RetryPolicy(max_retries=0))
+
+        assert hh.load_vacancies("Python", pages=2) == []
+        assert hh_simulator.statuses[503] >= 1
+
+    def test_date_filter_and_details(self, hh_simulator, make_hh):
+        newest = hh_simulator.corpus[0]
+        data = hh_simulator.search({"date_from": newest["published_at"], "per_page": "10"})
+        assert [item["id"] for item in data["items"]] == [newest["id"]]
+
+        hh = make_hh(Mock(**{"get_vacancies.return_value": []}), url=hh_simulator.url)
+        updates = hh.enrich([newest["id"]])
+        assert updates[newest["id"]]["employer"] == "Компания"
@@ -0,0 +1,175 @@
+import json
+import pytest
+from journal_store import JournalUserAsk
+from HH import HH
+
+
+@pytest.fixture
+def journal_file(tmp_path):
+    return str(tmp_path / "vacancies.jsonl")
+
+
+@pytest.fixture
+def sample_vacancies():
+    return [
+        {"id": "1", "name": "Python Developer", "url": "https://test.com/1",
+         "salary": 200000, "description": "Python, Django"},
+        {"id": "2", "name": "Java Developer", "url": "https://test.com/2",
+         "salary": 150000, "description": "Java, Spring"},
+    ]
+
+
+def read_lines(file_name):
+    with open(file_name, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+class TestJournalUserAsk:
+    def test_add_appends_one_line(self, journal_file, sample_vacancies):
+        store = JournalUserAsk(journal_file)
+        for vac in sample_vacancies:
+            store.add_vacancy(vac)
+        store.add_vacancy(sample_vacancies[0])  # дубликат не пишется
+
+        lines = read_lines(journal_file)
+        assert [line["op"] for line in lines] == ["add", "add"]
+        assert lines[0]["vacancy"]["requirement"] == "Python, Django"
+
+    def test_delete_writes_tombstone(self, journal_file, sample_vacancies):
+        store = JournalUserAsk(journal_file)
+        for vac in sample_vacancies:
+            store.add_vacancy(vac)
+
+        assert store.delete_vacancy("1") is True
+        assert store.delete_vacancy("1") is False
+        assert read_lines(journal_file)[-1] == {"op": "del", "id": "1"}
+        assert [v["id"] for v in store.get_vacancies(lambda v: True)] == ["2"]
+
+    def test_replay_on_startup(self, journal_file, sample_vacancies):
+        store = JournalUserAsk(journal_file)
+        for vac in sample_vacancies:
+            store.add_vacancy(vac)
+        store.delete_vacancy("2")
+
+        reopened = JournalUserAsk(journal_file)
+        assert [v["id"] for v in reopened.get_vacancies(lambda v: True)] == ["1"]
+        assert reopened.search_vac("django")[0]["id"] == "1"
+
+    def test_compact_keeps_live_set(self, journal_file, sample_vacancies):
+        store = JournalUserAsk(journal_file)
+        for vac in sample_vacancies:
+            store.add_vacancy(vac)
+        store.delete_vacancy("1")
+        store.compact()
+
+        lines = read_lines(journal_file)
+        # Первая строка уплотнённого журнала - его поколение
+        assert [line["op"] for line in lines] == ["gen", "add"]
+        assert lines[1]["vacancy"]["id"] == "2"
+        assert JournalUserAsk(journal_file).top_salary(5)[0]["id"] == "2"
+
+    def test_auto_compact(self, journal_file, sample_vacancies):
+        store = JournalUserAsk(journal_file, compact_ratio=0.5, compact_min=2)
+        for vac in sample_vacancies:
+            store.add_vacancy(vac)
+        store.delete_vacancy("1")
+
+        assert [line["op"] for line in read_lines(journal_file)] == ["gen", "add"]
+
+    def test_compaction_by_other_process(self, journal_file, sample_vacancies):
+        store = JournalUserAsk(journal_file)
+        store.add_vacancies(sample_vacancies)
+        other = JournalUserAsk(journal_file)
+        other.delete_vacancy("1")
+        other.compact()
+        # Уплотнённый журнал снова длиннее прежнего смещения первого экземпляра
+        other.add_vacancies({"id": str(i), "name": f"Dev {i}", "url": "https://test.com",
+                             "salary": i, "description": "Go"} for i in range(3, 13))
+        assert len(read_lines(journal_file)) > 2
+
+        assert [v["id"] for v in store.get_vacancies(lambda v: True)] == [str(i) for i in range(2, 13)]
+
+    def test_rewrite_in_place_is_detected(self, journal_file, sample_vacancies, tmp_path):
+        store = JournalUserAsk(journal_file)
+        store.add_vacancies(sample_vacancies)
+        other = JournalUserAsk(str(tmp_path / "other.jsonl"))
+        other.add_vacancies({"id": str(i), "name": f"Dev {i}", "url": "https://test.com",
+                             "salary": i, "description": "Go"} for i in range(3, 13))
+        other.compact()
+
+        # Тот же inode, файл длиннее прежнего: расхождение видно по поколению журнала
+        with open(str(tmp_path / "other.jsonl"), "rb") as source, open(journal_file, "r+b") as target:
+            target.write(source.read())
+            target.truncate()
+
+        assert [v["id"] for v in store.get_vacancies(lambda v: True)] == [str(i) for i in range(3, 13)]
+
+    def test_torn_tail_is_ignored(self, journal_file, sample_vacancies):
+        store = JournalUserAsk(journal_file)
+        store.add_vacancy(sample_vacancies[0])
+        with open(journal_file, "a", encoding="utf-8") as f:
+            f.write('{"op": "add", "vac')
+
+        assert len(JournalUserAsk(journal_file).get_vacancies(lambda v: True)) == 1
+
+    def test_torn_line_is_reclaimed(self, journal_file, sample_vacancies):
+        store = JournalUserAsk(journal_file)
+        store.add_vacancy(sample_vacancies[0])
+        with open(journal_file, "a", encoding="utf-8") as f:
+            f.write('{"op": "add", "vac')
+        JournalUserAsk(journal_file).add_vacancy(sample_vacancies[1])
+
+        # Оборванная строка помечена при дозаписи и не мешает уплотнению
+        reopened = JournalUserAsk(journal_file)
+        reopened.compact()
+        assert [entry["op"] for entry in read_lines(journal_file)] == ["gen", "add", "add"]
+
+    def test_legacy_json_array_is_imported(self, journal_file, sample_vacancies):
+        records = [JournalUserAsk._make_record(vac) for vac in sample_vacancies]
+        with open(journal_file, "w", encoding="utf-8") as f:
+            json.dump(records + records[:1], f, indent=4, ensure_ascii=False)
+
+        store = JournalUserAsk(journal_file, compact_min=1, compact_ratio=0)
+        assert store.get_vacancies(lambda v: True) == records
+        store.add_vacancy(dict(sample_vacancies[0], id="3"))
+        store.delete_vacancy("3")
+
+        assert [v["id"] for v in JournalUserAsk(journal_file).get_vacancies(lambda v: True)] == ["1", "2"]
+        assert read_lines(journal_file)[0]["op"] == "gen"
+
+    def test_broken_legacy_file_is_refused(self, journal_file):
+        with open(journal_file, "w", encoding="utf-8") as f:
+            f.write('[{"id": "1", "name": ')
+
+        with pytest.raises(ValueError):
+            JournalUserAsk(journal_file)
+        with open(journal_file, encoding="utf-8") as f:
+            assert f.read() == '[{"id": "1", "name": '
+
+    def test_unreadable_lines_are_kept(self, journal_file, sample_vacancies):
+        store = JournalUserAsk(journal_file)
+        store.add_vacancy(sample_vacancies[0])
+        with open(journal_file, "a", encoding="utf-8") as f:
+            f.write('not a journal line\n{"id": "9"}\n')
+
+        store = JournalUserAsk(journal_file, compact_min=1, compact_ratio=0)
+        store.add_vacancy(sample_vacancies[1])
+        store.delete_vacancy("2")
+
+        with open(journal_file, encoding="utf-8") as f:
+            assert "not a journal line" in f.read()
+        with pytest.raises(ValueError):
+            store.compact()
+
+    def test_hh_uses_journal(self, journal_file):
+        store = JournalUserAsk(journal_file)
+        hh = HH(store)
+        hh.add_vac({
+            "id": "10",
+            "name": "Data Engineer",
+            "alternate_url": "https://hh.ru/vacancy/10",
+            "salary": {"from": 100000, "to": None},
+            "snippet": {"requirement": "SQL"},
+        })
+        assert hh.get_vac(lambda v: v["salary"] == 100000)[0]["id"] == "10"
+        assert hh.del_vac("10") is True
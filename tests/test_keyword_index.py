@@ -0,0 +1,136 @@
+import json
+import os
+import pytest
+from unittest.mock import patch
+from keyword_index import KeywordIndex, tokenize
+from user_request import UserAsk
+from resident_store import ResidentUserAsk
+
+
+@pytest.fixture
+def sample_vacancies():
+    return [
+        {"id": "1", "name": "Senior Python Developer", "url": "https://test.com/1",
+         "salary": 200000, "description": "Python, Django, PostgreSQL"},
+        {"id": "2", "name": "Java Developer", "url": "https://test.com/2",
+         "salary": 180000, "description": "Java, Spring"},
+        {"id": "3", "name": "Менеджер по продажам", "url": "https://test.com/3",
+         "salary": 90000, "description": "Опыт работы с клиентами"},
+        {"id": "4", "name": "Pythonista", "url": "https://test.com/4",
+         "salary": 0, "description": None},
+    ]
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    return str(tmp_path / "vacancies.json")
+
+
+class TestKeywordIndex:
+    def test_tokenize(self):
+        assert tokenize("Python, Django-REST") == ["python", "django", "rest"]
+        assert tokenize(None) == []
+
+    def test_candidates(self, tmp_path):
+        index = KeywordIndex(str(tmp_path / "idx"))
+        index.rebuild([
+            {"id": "1", "name": "Python Developer", "requirement": "Django"},
+            {"id": "2", "name": "Java Developer", "requirement": "Spring"},
+        ])
+        assert index.candidates("developer") == {"1", "2"}
+        assert index.candidates("python developer") == {"1"}
+        assert index.candidates("velop") == {"1", "2"}
+        assert index.candidates("on dev") == {"1"}
+        assert index.candidates("rust") == set()
+        assert index.candidates("!!") is None
+
+        index.remove({"id": "1", "name": "Python Developer", "requirement": "Django"})
+        assert "python" not in index.postings
+        assert index.candidates("developer") == {"2"}
+
+
+class TestUserAskIndex:
+    def test_search_matches_scan(self, data_file, sample_vacancies, tmp_path):
+        indexed = UserAsk(data_file, index=True)
+        indexed.add_vacancies(sample_vacancies)
+        reference = UserAsk(str(tmp_path / "reference.json"))
+        reference.add_vacancies(sample_vacancies)
+
+        for keyword in ["python", "Python Developer", "thon dev", "вы", "работы с", "c++", "ista", "", "Go"]:
+            assert indexed.search_vac(keyword) == reference.search_vac(keyword), keyword
+
+    def test_index_persisted_and_incremental(self, data_file, sample_vacancies):
+        user_ask = UserAsk(data_file, index=True)
+        user_ask.add_vacancies(sample_vacancies[:2])
+        user_ask.add_vacancy(sample_vacancies[2])
+        user_ask.delete_vacancy("2")
+        user_ask.flush()
+
+        with open(data_file + ".idx", encoding="utf-8") as f:
+            stored = json.load(f)
+        assert stored["postings"]["менеджер"] == ["3"]
+        assert "java" not in stored["postings"]
+
+        # Тёплый старт: индекс читается с диска и не перестраивается
+        with patch.object(KeywordIndex, "rebuild") as rebuild:
+            warm = UserAsk(data_file, index=True)
+            assert [v["id"] for v in warm.search_vac("developer")] == ["1"]
+        rebuild.assert_not_called()
+
+    def test_single_changes_do_not_rewrite_index(self, data_file, sample_vacancies):
+        user_ask = UserAsk(data_file, index=True)
+        with patch.object(KeywordIndex, "save") as save:
+            user_ask.add_vacancies(sample_vacancies[:2])
+            assert save.call_count == 1
+            with user_ask.batch():
+                user_ask.add_vacancy(sample_vacancies[2])
+                user_ask.delete_vacancy("1")
+            assert save.call_count == 2
+            user_ask.add_vacancy(sample_vacancies[3])
+            user_ask.delete_vacancy("2")
+            assert save.call_count == 2
+            assert [v["id"] for v in user_ask.search_vac("python")] == ["4"]
+
+        # Устаревший файл индекса перестраивается при следующей загрузке и сохраняется
+        with patch.object(KeywordIndex, "rebuild", autospec=True, side_effect=KeywordIndex.rebuild) as rebuild:
+            reader = UserAsk(data_file, index=True)
+            assert [v["id"] for v in reader.search_vac("python")] == ["4"]
+        rebuild.assert_called_once()
+        with patch.object(KeywordIndex, "rebuild") as rebuild:
+            assert [v["id"] for v in UserAsk(data_file, index=True).search_vac("продаж")] == ["3"]
+        rebuild.assert_not_called()
+
+    def test_close_saves_deferred_index(self, data_file, sample_vacancies):
+        with patch("user_request.atexit") as at_exit:
+            with UserAsk(data_file, index=True) as user_ask:
+                user_ask.add_vacancies(sample_vacancies[:2])
+                user_ask.add_vacancy(sample_vacancies[2])
+                user_ask.delete_vacancy("1")
+                at_exit.register.assert_called_once_with(user_ask.flush)
+        at_exit.unregister.assert_called_with(user_ask.flush)
+
+        with patch.object(KeywordIndex, "rebuild") as rebuild:
+            reader = UserAsk(data_file, index=True)
+            assert [v["id"] for v in reader.search_vac("продаж")] == ["3"]
+            assert reader.search_vac("python") == []
+        rebuild.assert_not_called()
+
+    def test_external_change_rebuilds_index(self, data_file, sample_vacancies):
+        user_ask = UserAsk(data_file, index=True)
+        user_ask.add_vacancies(sample_vacancies[:1])
+        assert user_ask.search_vac("java") == []
+
+        UserAsk(data_file).add_vacancy(sample_vacancies[1])  # запись без индекса
+        assert [v["id"] for v in user_ask.search_vac("java")] == ["2"]
+
+    def test_resident_index(self, data_file, sample_vacancies):
+        with ResidentUserAsk(data_file, flush_interval=None, index=True) as store:
+            store.add_vacancies(sample_vacancies)
+            store.delete_vacancy("1")
+            assert [v["id"] for v in store.search_vac("python")] == ["4"]
+            assert not os.path.exists(data_file + ".idx")
+
+        with patch.object(KeywordIndex, "rebuild") as rebuild:
+            with ResidentUserAsk(data_file, flush_interval=None, index=True) as store:
+                assert [v["id"] for v in store.search_vac("продаж")] == ["3"]
+        rebuild.assert_not_called()
@@ -39,7 +39,7 @@ def mock_hh_response():
     }
 
 class TestUserAsk:
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_vacancies_from_hh(self, mock_get, mock_hh_response, test_file):
         # Настраиваем мок для API запроса
         mock_response = Mock()
@@ -97,7 +97,7 @@ class TestUserAsk:
         assert top_vacancies[0]["salary"] == 200000
         assert top_vacancies[1]["salary"] == 180000
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_error_handling(self, mock_get, test_file):
         # Тестируем обработку ошибок API
         mock_response = Mock()
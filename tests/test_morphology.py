@@ -0,0 +1,160 @@
+import sqlite3
+from unittest.mock import patch
+import pytest
+import morphology
+import journal_store
+import vacancy_filter
+from morphology import stem, normalize, StemIndex
+from vacancy_filter import WordForms, SalaryRange, Contains
+from user_request import UserAsk
+from journal_store import JournalUserAsk
+from resident_store import ResidentUserAsk
+from sqlite_store import SQLiteUserAsk
+
+VACANCIES = [
+    {"id": "1", "name": "Менеджер по продажам", "url": "https://test.com/1", "salary": 80000,
+     "description": "Опыт продаж от года"},
+    {"id": "2", "name": "Старший менеджер проектов", "url": "https://test.com/2", "salary": 150000,
+     "description": "Управление командой менеджеров"},
+    {"id": "3", "name": "Python-разработчик", "url": "https://test.com/3", "salary": 200000,
+     "description": "Опыт работы с Django, ведение проектов"},
+    {"id": "4", "name": "Водитель погрузчика", "url": "https://test.com/4", "salary": 60000,
+     "description": "Работа на складе, ёлочные игрушки"},
+]
+
+
+@pytest.mark.parametrize("words", [
+    ["Менеджер", "менеджера", "менеджеров", "МЕНЕДЖЕРАМ"],
+    ["разработчик", "разработчика", "разработчиков", "разработчиками"],
+    ["продажи", "продажам", "продаж"],
+    ["ведущий", "ведущего", "ведущая"],
+    ["ёлочные", "елочных"],
+])
+def test_inflections_share_stem(words):
+    assert len({stem(word) for word in words}) == 1
+
+
+def test_normalize():
+    assert normalize("Менеджеров ПО продажам, Python") == ["менеджер", "по", "продаж", "python"]
+    assert normalize(None) == []
+
+
+@pytest.fixture(params=["json", "indexed", "journal", "resident", "sqlite"])
+def store(request, tmp_path):
+    stores = {
+        "json": lambda: UserAsk(str(tmp_path / "vacancies.json"), morphology=True),
+        "indexed": lambda: UserAsk(str(tmp_path / "vacancies.json"), index=True, morphology=True),
+        "journal": lambda: JournalUserAsk(str(tmp_path / "vacancies.jsonl"), morphology=True),
+        "resident": lambda: ResidentUserAsk(str(tmp_path / "vacancies.json"), flush_interval=None, morphology=True),
+        "sqlite": lambda: SQLiteUserAsk(str(tmp_path / "vacancies.db"), morphology=True),
+    }
+    store = stores[request.param]()
+    store.add_vacancies(VACANCIES)
+    yield store
+    if hasattr(store, "close"):
+        store.close()
+
+
+@pytest.mark.parametrize("keyword, expected", [
+    ("менеджеров", ["1", "2"]),
+    ("Менеджер", ["1", "2"]),
+    ("менеджера проекта", ["2"]),
+    ("проекты", ["2", "3"]),
+    ("елочная", ["4"]),
+    ("разработчики", ["3"]),
+    ("водители автобусов", []),
+    ("", ["1", "2", "3", "4"]),
+])
+def test_search_matches_word_forms(store, keyword, expected):
+    assert [v["id"] for v in store.search_vac(keyword)] == expected
+    assert [v["id"] for v in store.search_vac(keyword, limit=1, order="salary")] == \
+        sorted(expected, key=lambda i: -VACANCIES[int(i) - 1]["salary"])[:1]
+
+
+def test_filters_combine(store):
+    criteria = WordForms("менеджеры") & SalaryRange(100000, 300000)
+    assert [v["id"] for v in store.get_vacancies(criteria)] == ["2"]
+    assert [v["id"] for v in store.top_salary(1, WordForms("проектов"))] == ["3"]
+
+    store.update_vacancies({"4": {"name": "Менеджер склада"}})
+    assert [v["id"] for v in store.search_vac("менеджерам")] == ["1", "2", "4"]
+    store.delete_vacancy("1")
+    assert [v["id"] for v in store.search_vac("менеджерам")] == ["2", "4"]
+
+
+def test_predicates_read_stored_stems(store):
+    # Под Or и Not, а также при проверке кандидатов основы берутся из хранилища
+    with patch.object(vacancy_filter, "vacancy_stems", side_effect=AssertionError):
+        assert [v["id"] for v in store.get_vacancies(WordForms("менеджеров") | Contains("склад"))] == ["1", "2", "4"]
+        assert [v["id"] for v in store.get_vacancies(~WordForms("менеджеров"))] == ["3", "4"]
+        assert [v["id"] for v in store.get_vacancies(~WordForms("проект"), limit=1)] == ["1"]
+        assert [v["id"] for v in store.top_salary(2, ~WordForms("опыт"))] == ["2", "4"]
+
+
+def test_journal_keeps_stems_in_entries(tmp_path):
+    file_name = str(tmp_path / "vacancies.jsonl")
+    store = JournalUserAsk(file_name, morphology=True)
+    store.add_vacancies(VACANCIES)
+    store.update_vacancies({"4": {"name": "Менеджер склада"}, "3": {"salary": 1}})
+    store.delete_vacancy("1")
+
+    # Проигрывание журнала и уплотнение не разбирают тексты вакансий заново
+    with patch.object(morphology, "vacancy_stems", side_effect=AssertionError), \
+            patch.object(journal_store, "vacancy_stems", side_effect=AssertionError):
+        reopened = JournalUserAsk(file_name, morphology=True)
+        assert [v["id"] for v in reopened.search_vac("менеджерам")] == ["2", "4"]
+        assert [v["id"] for v in reopened.search_vac("проекты")] == ["2", "3"]
+        reopened.compact()
+        assert [v["id"] for v in JournalUserAsk(file_name, morphology=True).search_vac("склады")] == ["4"]
+
+
+def test_sqlite_word_forms_use_fts(tmp_path):
+    with SQLiteUserAsk(str(tmp_path / "vacancies.db"), morphology=True) as store:
+        if not store.has_fts:
+            pytest.skip("SQLite собран без FTS5")
+        store.add_vacancies(VACANCIES + [{"id": "5", "name": "Мойщик", "url": "https://test.com/5",
+                                          "salary": 1, "description": ""}])
+        assert "vacancies_stems_fts" in WordForms("менеджер").to_sql(store.has_fts)[0]
+        assert [v["id"] for v in store.search_vac("мойщика")] == ["5"]
+        assert [v["id"] for v in store.search_vac("моищик")] == []
+
+
+def test_stems_computed_once_at_write(tmp_path):
+    store = UserAsk(str(tmp_path / "vacancies.json"), morphology=True)
+    store.add_vacancies(VACANCIES)
+
+    plan = store.explain("search_vac", "менеджеров")
+    assert plan.access == ["stems 'менеджеров'"]
+    assert plan.actual_rows == 2
+
+    # Запросы и новый процесс с тем же файлом не разбирают тексты вакансий заново
+    with patch.object(morphology, "vacancy_stems", side_effect=AssertionError):
+        reopened = UserAsk(str(tmp_path / "vacancies.json"), morphology=True)
+        assert [v["id"] for v in reopened.search_vac("менеджерами")] == ["1", "2"]
+        store.delete_vacancy("2")
+        store.flush()
+        assert [v["id"] for v in reopened.search_vac("менеджерами")] == ["1"]
+
+
+def test_stem_index_candidates():
+    index = StemIndex("unused.stems")
+    index.rebuild(UserAsk._make_record(vacancy) for vacancy in VACANCIES)
+
+    assert index.candidates("Менеджеров") == {"1", "2"}
+    assert index.candidates("ёлочными игрушками") == {"4"}
+    assert index.candidates("...") is None
+    assert "менеджер" in index.stems_of("2")
+
+
+def test_sqlite_backfills_stems(tmp_path):
+    file_name = str(tmp_path / "vacancies.db")
+    with sqlite3.connect(file_name) as conn:
+        conn.execute("CREATE TABLE vacancies (id TEXT PRIMARY KEY, name TEXT NOT NULL, url TEXT NOT NULL, "
+                     "salary INTEGER, requirement TEXT NOT NULL, details TEXT)")
+        conn.execute("INSERT INTO vacancies VALUES ('1', 'Менеджер', 'https://test.com/1', 1, '', NULL)")
+    conn.close()
+
+    with SQLiteUserAsk(file_name, morphology=True) as store:
+        assert [v["id"] for v in store.search_vac("менеджеров")] == ["1"]
+        assert store.get_vacancies(lambda v: True)[0] == {"id": "1", "name": "Менеджер", "url": "https://test.com/1",
+                                                          "salary": 1, "requirement": ""}
@@ -0,0 +1,107 @@
+import pytest
+from unittest.mock import patch
+from vacancy_filter import Contains, SalaryRange
+from pagination import encode_cursor
+from salary_index import SalaryIndex
+from user_request import UserAsk
+from journal_store import JournalUserAsk
+from resident_store import ResidentUserAsk
+from sqlite_store import SQLiteUserAsk
+import main
+
+
+def make_vacancies(start, count):
+    return [{"id": str(i), "name": ("Python" if i % 3 == 0 else "Java") + f" Developer {i}",
+             "url": f"https://test.com/{i}", "salary": (i % 7) * 10000 or None,
+             "description": "Опыт от года"} for i in range(start, start + count)]
+
+
+@pytest.fixture(params=["json", "indexed", "journal", "resident", "sqlite"])
+def store(request, tmp_path):
+    stores = {
+        "json": lambda: UserAsk(str(tmp_path / "vacancies.json")),
+        "indexed": lambda: UserAsk(str(tmp_path / "vacancies.json"), index=True),
+        "journal": lambda: JournalUserAsk(str(tmp_path / "vacancies.jsonl")),
+        "resident": lambda: ResidentUserAsk(str(tmp_path / "vacancies.json"), flush_interval=None, index=True),
+        "sqlite": lambda: SQLiteUserAsk(str(tmp_path / "vacancies.db")),
+    }
+    store = stores[request.param]()
+    store.add_vacancies(make_vacancies(0, 50))
+    yield store
+    if hasattr(store, "close"):
+        store.close()
+
+
+def collect(fetch):
+    items, cursor, pages = [], None, 0
+    while True:
+        page = fetch(cursor)
+        items.extend(page)
+        pages += 1
+        if page.next_cursor is None:
+            return items, pages
+        cursor = page.next_cursor
+
+
+@pytest.mark.parametrize("criteria", [lambda v: True, Contains("python"), SalaryRange(20000, 50000)])
+def test_pages_cover_results(store, criteria):
+    expected = store.get_vacancies(criteria)
+
+    items, pages = collect(lambda cursor: store.get_vacancies(criteria, limit=4, cursor=cursor))
+    assert [v["id"] for v in items] == [v["id"] for v in expected]
+    assert pages == (len(expected) + 3) // 4
+
+    by_salary, _ = collect(lambda cursor: store.get_vacancies(criteria, limit=4, cursor=cursor, order="salary"))
+    assert [v["id"] for v in by_salary] == \
+        [v["id"] for v in sorted(expected, key=lambda v: (-SalaryIndex.salary_of(v), v["id"]))]
+
+
+def test_stable_under_inserts(store):
+    first = store.search_vac("python", limit=5)
+    first_salary = store.search_vac("python", limit=5, order="salary")
+    store.add_vacancies(make_vacancies(50, 10))
+
+    rest, _ = collect(lambda cursor: store.search_vac("python", limit=5, cursor=cursor or first.next_cursor))
+    ids = [v["id"] for v in first] + [v["id"] for v in rest]
+    assert ids == [v["id"] for v in store.search_vac("python")]
+
+    rest, _ = collect(lambda cursor: store.search_vac("python", limit=5, cursor=cursor or first_salary.next_cursor,
+                                                      order="salary"))
+    ids = [v["id"] for v in first_salary] + [v["id"] for v in rest]
+    assert len(ids) == len(set(ids))
+
+
+def test_stable_under_deletes_before_cursor(store):
+    first = store.get_vacancies(lambda v: True, limit=2)
+    assert [v["id"] for v in first] == ["0", "1"]
+    store.delete_vacancy("0")
+    store.delete_vacancy("1")
+
+    rest, _ = collect(lambda cursor: store.get_vacancies(lambda v: True, limit=2, cursor=cursor or first.next_cursor))
+    assert [v["id"] for v in rest] == [str(i) for i in range(2, 50)]
+
+    page = store.get_vacancies(lambda v: True, limit=2, cursor=first.next_cursor)
+    store.add_vacancies(make_vacancies(0, 1))
+    rest, _ = collect(lambda cursor: store.get_vacancies(lambda v: True, limit=2, cursor=cursor or page.next_cursor))
+    assert [v["id"] for v in page + rest] == [str(i) for i in range(2, 50)] + ["0"]
+
+
+def test_bad_cursor(store):
+    with pytest.raises(ValueError):
+        store.get_vacancies(lambda v: True, limit=5, cursor="не курсор")
+    with pytest.raises(ValueError):
+        store.get_vacancies(lambda v: True, limit=5, cursor=encode_cursor({"o": "salary", "salary": 1, "id": "1"}))
+    with pytest.raises(ValueError):
+        store.get_vacancies(lambda v: True, limit=0)
+
+
+def test_cli_pages_lazily(tmp_path):
+    store = UserAsk(str(tmp_path / "vacancies.json"))
+    store.add_vacancies(make_vacancies(0, 30))
+
+    with patch.object(main, "PAGE_SIZE", 4), patch.object(store, "search_vac", wraps=store.search_vac) as search, \
+            patch("builtins.input", side_effect=["2", "python", "да", "нет", "6"]), patch("builtins.print"):
+        main.run_menu(store)
+
+    # Показаны две страницы из трёх, третья не запрашивалась
+    assert search.call_count == 2
@@ -0,0 +1,136 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+import pytest
+import requests
+from partition import PartitionedHarvester
+from rate_limiter import RetryPolicy
+
+START = datetime(2024, 5, 1, tzinfo=timezone.utc)
+
+
+class DepthLimitedAPI:
+    """Выдача с фильтром по периоду публикации и ограничением глубины, как у API hh.ru"""
+
+    def __init__(self, count, max_items, area_of=lambda i: "1", step=timedelta(minutes=7)):
+        self.items = [{
+            "id": str(i),
+            "name": f"Python Developer {i}",
+            "alternate_url": f"https://hh.ru/vacancy/{i}",
+            "salary": None,
+            "snippet": {"requirement": "Python"},
+            "published": START + step * i,
+            "area": area_of(i),
+        } for i in range(count)]
+        self.max_items = max_items
+        self.requests = 0
+        self.ranges = set()
+        self.fail_pages = set()
+        self.failures = 0
+        self.lock = threading.Lock()
+
+    def get(self, url, headers=None, params=None, **kwargs):
+        date_from = datetime.strptime(params["date_from"], "%Y-%m-%dT%H:%M:%S%z")
+        date_to = datetime.strptime(params["date_to"], "%Y-%m-%dT%H:%M:%S%z")
+        with self.lock:
+            self.requests += 1
+            self.ranges.add((date_from, date_to))
+        found = [item for item in self.items
+                 if date_from <= item["published"] <= date_to
+                 and ("area" not in params or item["area"] == params["area"])]
+        per_page = params["per_page"]
+        start = params["page"] * per_page
+        response = Mock()
+        if params["page"] in self.fail_pages:
+            with self.lock:
+                self.failures += 1
+            response.raise_for_status.side_effect = requests.HTTPError("502 Bad Gateway")
+        elif start >= self.max_items:
+            response.raise_for_status.side_effect = Exception("400 Bad Request")
+        page = [{k: v for k, v in item.items() if k != "published"} for item in found[start:start + per_page]]
+        response.json.return_value = {
+            "items": page,
+            "found": len(found),
+            "pages": min((len(found) + per_page - 1) // per_page, self.max_items // per_page),
+        }
+        return response
+
+
+@pytest.fixture
+def hh(make_hh):
+    return make_hh(Mock(), per_page=5, concurrency=4)
+
+
+class TestPartitionedHarvester:
+    def test_collects_beyond_depth_limit(self, hh):
+        api = DepthLimitedAPI(100, max_items=20)
+        harvester = PartitionedHarvester(hh, max_items=20)
+
+        with patch.object(hh.session, "get", side_effect=api.get):
+            vacancies = harvester.harvest("Python", START, START + timedelta(days=1))
+
+        assert sorted(int(v["id"]) for v in vacancies) == list(range(100))
+        assert harvester.slices >= 5
+        assert harvester.truncated == 0
+        hh.file_worker.add_vacancies.assert_called_once()
+
+    def test_small_query_is_not_split(self, hh):
+        api = DepthLimitedAPI(12, max_items=20)
+        harvester = PartitionedHarvester(hh, max_items=20)
+
+        with patch.object(hh.session, "get", side_effect=api.get):
+            vacancies = harvester.harvest("Python", START, START + timedelta(days=1))
+
+        assert [v["id"] for v in vacancies] == [str(i) for i in range(12)]
+        assert harvester.slices == 1
+        assert api.requests == 3
+
+    def test_split_by_area(self, hh):
+        api = DepthLimitedAPI(30, max_items=20, area_of=lambda i: "1" if i % 2 else "2")
+        harvester = PartitionedHarvester(hh, max_items=20)
+
+        with patch.object(hh.session, "get", side_effect=api.get):
+            vacancies = harvester.harvest("Python", START, START + timedelta(days=1), areas=["1", "2"])
+
+        assert len(vacancies) == 30
+        assert harvester.slices == 2
+
+    def test_unsplittable_slice_is_reported(self, hh):
+        api = DepthLimitedAPI(30, max_items=20)
+        harvester = PartitionedHarvester(hh, max_items=20, min_span=timedelta(days=2))
+
+        with patch.object(hh.session, "get", side_effect=api.get):
+            vacancies = harvester.harvest("Python", START, START + timedelta(days=1))
+
+        assert len(vacancies) == 20
+        assert harvester.truncated == 1
+
+    def test_slices_do_not_overlap(self, hh):
+        # Вакансии ровно на границах делений периода пополам
+        api = DepthLimitedAPI(48, max_items=20, step=timedelta(minutes=30))
+        harvester = PartitionedHarvester(hh, max_items=20)
+
+        with patch.object(hh.session, "get", side_effect=api.get):
+            vacancies = harvester.harvest("Python", START, START + timedelta(days=1))
+
+        assert len(vacancies) == 48
+        # Итоговые срезы (не делившиеся дальше) покрывают каждую вакансию ровно один раз
+        leaves = [(lo, hi) for lo, hi in api.ranges
+                  if not any((lo, hi) != other and lo <= other[0] and other[1] <= hi for other in api.ranges)]
+        assert len(leaves) == harvester.slices
+        for item in api.items:
+            assert sum(lo <= item["published"] <= hi for lo, hi in leaves) == 1
+
+    def test_failures_are_counted(self, make_hh):
+        hh = make_hh(Mock(), per_page=5, concurrency=4, retry=RetryPolicy(max_retries=0))
+        api = DepthLimitedAPI(100, max_items=20)
+        api.fail_pages = {1, 2}
+        harvester = PartitionedHarvester(hh, max_items=20)
+
+        with patch.object(hh.session, "get", side_effect=api.get):
+            vacancies = harvester.harvest("Python", START, START + timedelta(days=1))
+
+        # Страницы загружаются в потоках пула, но каждая ошибка учтена ровно один раз
+        assert api.failures > harvester.slices
+        assert harvester.failed == api.failures
+        assert 0 < len(vacancies) < 100
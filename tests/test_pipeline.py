@@ -0,0 +1,110 @@
+import pytest
+import threading
+from unittest.mock import Mock, patch
+from HH import HH
+from pipeline import HarvestPipeline
+
+
+def page_items(page, per_page=2):
+    return [{
+        "id": f"{page}-{i}",
+        "name": f"Python Developer {page}-{i}",
+        "alternate_url": f"https://hh.ru/vacancy/{page}-{i}",
+        "salary": {"from": 100000, "to": None},
+        "snippet": {"requirement": "Python"},
+    } for i in range(per_page)]
+
+
+def counting_get():
+    """Ответ сервера, запоминающий запрошенные страницы"""
+    requested = []
+    lock = threading.Lock()
+
+    def get(url, headers=None, params=None, **kwargs):
+        with lock:
+            requested.append(params["page"])
+        response = Mock()
+        response.json.return_value = {"items": page_items(params["page"])}
+        return response
+
+    return get, requested
+
+
+class TestHarvestPipeline:
+    def test_iterator_yields_stored_vacancies(self):
+        get, _ = counting_get()
+        file_worker = Mock()
+        hh = HH(file_worker, concurrency=2)
+
+        with patch.object(hh.session, "get", side_effect=get):
+            pipeline = hh.iter_vacancies("Python", 3)
+            assert isinstance(pipeline, HarvestPipeline)
+            assert file_worker.add_vacancies.call_count == 0
+            vacancies = list(pipeline)
+
+        assert [v["id"] for v in vacancies] == ["0-0", "0-1", "1-0", "1-1", "2-0", "2-1"]
+        assert vacancies[0]["salary"] == 100000
+        assert file_worker.add_vacancies.call_count == 3
+
+    def test_slow_storage_throttles_fetchers(self):
+        get, requested = counting_get()
+        file_worker = Mock()
+        writing = threading.Event()
+        release = threading.Event()
+        overflow = threading.Event()
+        file_worker.add_vacancies.side_effect = lambda batch: writing.set() or release.wait(5)
+        hh = HH(file_worker, concurrency=2)
+
+        def get_while_blocked(*args, **kwargs):
+            response = get(*args, **kwargs)
+            if len(requested) >= 10 and not release.is_set():
+                overflow.set()
+            return response
+
+        with patch.object(hh.session, "get", side_effect=get_while_blocked):
+            pipeline = HarvestPipeline(hh, "Python", list(range(20)), queue_size=1)
+            consumer = threading.Thread(target=lambda: list(pipeline))
+            consumer.start()
+            assert writing.wait(5)
+            # Пока запись стоит, загружается лишь несколько страниц, а не все 20
+            assert not overflow.wait(0.5)
+            release.set()
+            consumer.join(5)
+
+        assert len(requested) == 20
+
+    def test_stats_per_stage(self):
+        get, _ = counting_get()
+        hh = HH(Mock(), concurrency=2)
+
+        with patch.object(hh.session, "get", side_effect=get):
+            pipeline = hh.iter_vacancies("Python", 4)
+            list(pipeline)
+
+        stats = pipeline.stats()
+        assert set(stats) == {"fetch", "normalize", "dedup", "write"}
+        assert stats["fetch"]["items"] == 4
+        assert stats["write"]["items"] == 8
+        assert stats["normalize"]["per_second"] > 0
+
+    def test_early_stop_releases_threads(self):
+        get, requested = counting_get()
+        hh = HH(Mock(), concurrency=2)
+
+        with patch.object(hh.session, "get", side_effect=get):
+            iterator = iter(HarvestPipeline(hh, "Python", list(range(20)), queue_size=1))
+            next(iterator)
+            iterator.close()
+
+        assert len(requested) < 20
+        assert not [t for t in threading.enumerate() if t.name.startswith("harvest-")]
+
+    def test_storage_error_is_raised(self):
+        get, _ = counting_get()
+        file_worker = Mock()
+        file_worker.add_vacancies.side_effect = OSError("disk full")
+        hh = HH(file_worker, concurrency=2)
+
+        with patch.object(hh.session, "get", side_effect=get):
+            with pytest.raises(OSError, match="disk full"):
+                list(hh.iter_vacancies("Python", 3))
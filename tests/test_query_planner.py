@@ -0,0 +1,92 @@
+import math
+import pytest
+from vacancy_filter import field, Contains, SalaryRange
+from salary_index import SalaryIndex
+from user_request import UserAsk
+from journal_store import JournalUserAsk
+from resident_store import ResidentUserAsk
+from sqlite_store import SQLiteUserAsk
+
+
+def make_vacancies(count=1000):
+    # Каждая 50-я вакансия - Python, зарплаты от 10 000 до 1 000 000
+    return [{"id": str(i), "name": ("Python" if i % 50 == 0 else "Java") + f" Developer {i}",
+             "url": f"https://test.com/{i}", "salary": (i % 100 + 1) * 10000,
+             "description": "Команда и офис"} for i in range(count)]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ResidentUserAsk(str(tmp_path / "vacancies.json"), flush_interval=None, index=True)
+    store.add_vacancies(make_vacancies())
+    yield store
+    store.close()
+
+
+def test_selective_keyword_is_used_alone(store):
+    plan = store.explain("get_vacancies", Contains("python") & SalaryRange(0, 100000))
+
+    assert plan.strategy == "index"
+    assert plan.access == ["keyword 'python'"]
+    assert plan.examined == 20
+    assert plan.actual_rows == 10
+
+
+def test_selective_salary_goes_first(store):
+    plan = store.explain("get_vacancies", (field("salary") >= 1000000) & Contains("developer"))
+
+    assert plan.access[0] == "salary 1e+06..inf"
+    assert plan.examined == 10
+    assert plan.actual_rows == 10
+
+
+def test_broad_query_scans(store):
+    plan = store.explain("get_vacancies", Contains("developer") | (field("salary") < 0))
+    assert plan.strategy == "full scan"
+    assert plan.actual_rows == 1000
+
+    plan = store.explain("search_vac", "команда")
+    assert plan.operation == "search_vac"
+    assert plan.actual_rows == 1000
+
+
+def test_top_salary_plans(store):
+    plan = store.explain("top_salary", 5, Contains("developer"))
+    assert plan.strategy == "salary index"
+    assert plan.examined == 5
+
+    plan = store.explain("top_salary", 5, Contains("python"))
+    assert plan.strategy == "filter + sort"
+    assert [v["id"] for v in store.top_salary(2, Contains("python"))] == ["50", "150"]
+
+
+def test_estimates_learn_from_execution(store):
+    criteria = Contains("developer") & ~(field("name") == "x")
+    first = store.explain("get_vacancies", criteria)
+    second = store.explain("get_vacancies", criteria)
+
+    assert first.estimated_rows != first.actual_rows
+    assert second.estimated_rows == second.actual_rows == 1000
+    assert "estimated_rows" in second.describe()
+
+
+@pytest.mark.parametrize("kind", ["json", "indexed", "journal", "sqlite"])
+def test_top_salary_with_criteria(kind, tmp_path):
+    stores = {
+        "json": lambda: UserAsk(str(tmp_path / "vacancies.json")),
+        "indexed": lambda: UserAsk(str(tmp_path / "vacancies.json"), index=True),
+        "journal": lambda: JournalUserAsk(str(tmp_path / "vacancies.jsonl")),
+        "sqlite": lambda: SQLiteUserAsk(str(tmp_path / "vacancies.db")),
+    }
+    store = stores[kind]()
+    store.add_vacancies(make_vacancies(300))
+    criteria = Contains("python") | SalaryRange(990000, 1000000)
+    expected = sorted(store.get_vacancies(criteria), key=SalaryIndex.salary_of, reverse=True)[:4]
+
+    assert [v["salary"] for v in store.top_salary(4, criteria)] == [v["salary"] for v in expected]
+    assert len(store.top_salary(3, lambda v: v["name"].startswith("Java"))) == 3
+    plan = store.explain("top_salary", 4)
+    assert plan.actual_rows == 4
+    if kind == "sqlite":
+        assert plan.strategy == "delegated" and math.isnan(plan.estimated_rows)
+        store.close()
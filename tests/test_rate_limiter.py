@@ -0,0 +1,119 @@
+import pytest
+import requests
+from email.utils import formatdate
+import time
+from unittest.mock import Mock, patch
+from rate_limiter import TokenBucket, RetryPolicy, parse_retry_after, shared_limiter
+from HH import HH
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_response(status, headers=None, items=None):
+    response = Mock()
+    response.status_code = status
+    response.headers = headers or {}
+    response.json.return_value = {"items": items or []}
+    if status >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(f"{status} Error")
+    return response
+
+
+@pytest.fixture
+def scripted_hh(make_hh):
+    """Фабрика клиентов HH, получающих заданную последовательность ответов"""
+    def make(responses, limiter=None, max_retries=3):
+        hh = make_hh(Mock(), concurrency=1, rate_limiter=limiter or TokenBucket(rate=1000),
+                     retry=RetryPolicy(max_retries=max_retries, backoff_base=0.001))
+        hh.session.get = Mock(side_effect=responses)
+        return hh
+    return make
+
+
+class TestTokenBucket:
+    def test_burst_then_rate(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock, sleep=clock.sleep)
+        for _ in range(4):
+            bucket.acquire()
+        assert abs(clock.now - 1.0) < 1e-9
+
+    def test_penalize_and_recover(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=8, min_rate=1, recovery=1, clock=clock, sleep=clock.sleep)
+        bucket.penalize()
+        bucket.penalize()
+        assert bucket.rate == 2
+        for _ in range(10):
+            bucket.reward()
+        assert bucket.rate == 8
+
+    def test_retry_after_pauses_everyone(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=100, clock=clock, sleep=clock.sleep)
+        bucket.penalize(retry_after=5)
+        bucket.acquire()
+        assert clock.now >= 5
+
+    def test_shared_limiter_is_singleton(self):
+        assert shared_limiter() is shared_limiter()
+        assert HH(Mock()).rate_limiter is HH(Mock()).rate_limiter
+
+
+class TestParseRetryAfter:
+    def test_formats(self):
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        assert 8 <= parse_retry_after(formatdate(time.time() + 10, usegmt=True)) <= 10
+
+    def test_backoff_bounds(self):
+        policy = RetryPolicy(backoff_base=1, backoff_max=4)
+        assert all(0 <= policy.backoff(attempt) <= 4 for attempt in range(10))
+
+
+class TestHHRetries:
+    def test_retries_429_honouring_retry_after(self, scripted_hh):
+        limiter = TokenBucket(rate=1000)
+        hh = scripted_hh([make_response(429, {"Retry-After": "0.05"}),
+                      make_response(200, items=[{"id": "1", "name": "Dev", "alternate_url": "u"}])],
+                     limiter=limiter)
+        started = time.monotonic()
+        vacancies = hh.load_vacancies("Python", 1)
+
+        assert [v["id"] for v in vacancies] == ["1"]
+        assert time.monotonic() - started >= 0.05
+        assert limiter.rate < 1000
+
+    def test_retries_5xx_and_connection_errors(self, scripted_hh):
+        hh = scripted_hh([make_response(503), requests.ConnectionError("reset"),
+                      make_response(200, items=[{"id": "1", "name": "Dev", "alternate_url": "u"}])])
+        assert len(hh.load_vacancies("Python", 1)) == 1
+        assert hh.session.get.call_count == 3
+
+    def test_gives_up_after_max_retries(self, scripted_hh):
+        hh = scripted_hh([make_response(500)] * 3, max_retries=2)
+        assert hh.load_vacancies("Python", 1) == []
+        assert hh.session.get.call_count == 3
+
+    def test_timeout_passed(self, scripted_hh):
+        hh = scripted_hh([make_response(200)])
+        hh.timeout = 7
+        hh.load_vacancies("Python", 1)
+        assert hh.session.get.call_args[1]["timeout"] == 7
+
+    def test_client_errors_not_retried(self, scripted_hh):
+        hh = scripted_hh([make_response(404)])
+        assert hh.get_vacancies_by_keyword("Python") == []
+        assert hh.session.get.call_count == 1
@@ -0,0 +1,90 @@
+import json
+import threading
+import pytest
+from resident_store import ResidentUserAsk
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    filename = tmp_path / "vacancies.json"
+    filename.write_text(json.dumps([
+        {"id": "1", "name": "Python Developer", "url": "https://test.com/1",
+         "salary": 200000, "requirement": "Python, Django"},
+    ]))
+    return str(filename)
+
+
+def read_ids(file_name):
+    with open(file_name) as f:
+        return [v["id"] for v in json.load(f)]
+
+
+def watch_flushes(store):
+    """Событие, выставляемое после каждого сброса хранилища на диск"""
+    flushed = threading.Event()
+    flush = store.flush
+
+    def flush_and_signal():
+        flush()
+        flushed.set()
+
+    store.flush = flush_and_signal
+    return flushed
+
+
+class TestResidentUserAsk:
+    def test_serves_from_memory(self, data_file, make_vacancy):
+        store = ResidentUserAsk(data_file, flush_interval=None)
+        store.add_vacancy(make_vacancy("2", 300000))
+
+        # На диск ещё ничего не записано, а запросы уже видят изменения
+        assert read_ids(data_file) == ["1"]
+        assert store.top_salary(1)[0]["id"] == "2"
+        assert store.search_vac("django")[0]["id"] == "1"
+        store.close()
+
+    def test_explicit_flush(self, data_file, make_vacancy):
+        store = ResidentUserAsk(data_file, flush_interval=None)
+        store.add_vacancy(make_vacancy("2"))
+        assert store.delete_vacancy("1") is True
+        assert store.delete_vacancy("1") is False
+        store.flush()
+
+        assert read_ids(data_file) == ["2"]
+        store.close()
+
+    def test_close_flushes(self, data_file, make_vacancy):
+        with ResidentUserAsk(data_file, flush_interval=None) as store:
+            store.add_vacancy(make_vacancy("2"))
+        assert read_ids(data_file) == ["1", "2"]
+        store.close()  # повторный вызов безопасен
+
+    def test_threshold_triggers_background_flush(self, data_file, make_vacancy):
+        store = ResidentUserAsk(data_file, flush_interval=None, flush_threshold=2)
+        flushed = watch_flushes(store)
+        store.add_vacancy(make_vacancy("2"))
+        assert not flushed.is_set()
+        store.add_vacancy(make_vacancy("3"))
+
+        assert flushed.wait(5)
+        assert read_ids(data_file) == ["1", "2", "3"]
+        store.close()
+
+    def test_interval_flush(self, data_file, make_vacancy):
+        store = ResidentUserAsk(data_file, flush_interval=0.05)
+        flushed = watch_flushes(store)
+        store.add_vacancy(make_vacancy("2"))
+
+        # Очередной сброс мог начаться до добавления - ждём следующего
+        while read_ids(data_file) != ["1", "2"]:
+            assert flushed.wait(5)
+            flushed.clear()
+        store.close()
+
+    def test_missing_file(self, tmp_path, make_vacancy):
+        file_name = str(tmp_path / "new.json")
+        store = ResidentUserAsk(file_name, flush_interval=None)
+        assert store.get_vacancies(lambda v: True) == []
+        store.add_vacancy(make_vacancy("1"))
+        store.close()
+        assert read_ids(file_name) == ["1"]
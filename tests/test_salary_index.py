@@ -0,0 +1,117 @@
+import pytest
+from unittest.mock import patch
+from salary_index import SalaryIndex
+from user_request import UserAsk
+from journal_store import JournalUserAsk
+from resident_store import ResidentUserAsk
+from sqlite_store import SQLiteUserAsk
+from vacancy_filter import SalaryRange, Contains
+
+
+@pytest.fixture
+def sample_vacancies(make_vacancy):
+    return [make_vacancy("1", 100000), make_vacancy("2", 250000), make_vacancy("3", None),
+            make_vacancy("4", 100000), make_vacancy("5", 180000)]
+
+
+class TestSalaryIndex:
+    def test_top_and_ranges(self):
+        index = SalaryIndex()
+        index.rebuild([{"id": "a", "salary": 10}, {"id": "b", "salary": 30}, {"id": "c", "salary": 20}])
+        index.add({"id": "d", "salary": 20})
+
+        assert index.top(2) == ["b", "c"]
+        assert index.top(0) == []
+        assert index.between(15, 25) == ["c", "d"]
+        assert index.at_least(20) == ["b", "c", "d"]
+
+        index.remove({"id": "c"})
+        index.remove({"id": "missing"})
+        assert index.between(15, 25) == ["d"]
+        assert len(index) == 3
+
+    def test_readd_replaces_key(self):
+        index = SalaryIndex()
+        index.add({"id": "a", "salary": 10})
+        index.add({"id": "a", "salary": 50})
+        assert len(index) == 1
+        assert index.at_least(20) == ["a"]
+
+
+class TestUserAskSalaryQueries:
+    @pytest.mark.parametrize("index", [False, True])
+    def test_same_results_with_and_without_index(self, tmp_path, sample_vacancies, index):
+        reference = UserAsk(str(tmp_path / "reference.json"))
+        reference.add_vacancies(sample_vacancies)
+        user_ask = UserAsk(str(tmp_path / "vacancies.json"), index=index)
+        user_ask.add_vacancies(sample_vacancies)
+        user_ask.delete_vacancy("5")
+        reference.delete_vacancy("5")
+
+        assert user_ask.top_salary(3) == reference.top_salary(3)
+        assert [v["id"] for v in user_ask.top_salary(10)] == ["2", "1", "4", "3"]
+        assert [v["id"] for v in user_ask.salary_between(50000, 200000)] == ["1", "4"]
+        assert [v["id"] for v in user_ask.salary_at_least(100000)] == ["2", "1", "4"]
+
+    def test_top_salary_does_not_sort(self, tmp_path, sample_vacancies):
+        user_ask = UserAsk(str(tmp_path / "vacancies.json"), index=True)
+        user_ask.add_vacancies(sample_vacancies)
+        with patch.object(UserAsk, "get_vacancies") as get_vacancies:
+            assert user_ask.top_salary(1)[0]["id"] == "2"
+        get_vacancies.assert_not_called()
+
+    def test_resident(self, tmp_path, sample_vacancies, make_vacancy):
+        with ResidentUserAsk(str(tmp_path / "vacancies.json"), flush_interval=None, index=True) as store:
+            store.add_vacancies(sample_vacancies)
+            store.add_vacancy(make_vacancy("6", 300000))
+            store.delete_vacancy("2")
+            assert [v["id"] for v in store.top_salary(2)] == ["6", "5"]
+            assert [v["id"] for v in store.salary_at_least(180000)] == ["6", "5"]
+
+    def test_sqlite(self, tmp_path, sample_vacancies):
+        with SQLiteUserAsk(str(tmp_path / "vacancies.db")) as db:
+            db.add_vacancies(sample_vacancies)
+            assert {v["id"] for v in db.salary_between(100000, 180000)} == {"1", "4", "5"}
+            assert [v["id"] for v in db.salary_at_least(180000)] == ["2", "5"]
+
+
+@pytest.fixture(params=["json", "indexed", "journal", "resident", "sqlite"])
+def salary_store(request, tmp_path):
+    stores = {
+        "json": lambda: UserAsk(str(tmp_path / "vacancies.json")),
+        "indexed": lambda: UserAsk(str(tmp_path / "vacancies.json"), index=True),
+        "journal": lambda: JournalUserAsk(str(tmp_path / "vacancies.jsonl")),
+        "resident": lambda: ResidentUserAsk(str(tmp_path / "vacancies.json"), flush_interval=None, index=True),
+        "sqlite": lambda: SQLiteUserAsk(str(tmp_path / "vacancies.db")),
+    }
+    store = stores[request.param]()
+    yield store
+    if hasattr(store, "close"):
+        store.close()
+
+
+class TestMissingSalary:
+    def test_missing_salary_counts_as_zero(self, salary_store, sample_vacancies, make_vacancy):
+        salary_store.add_vacancies(sample_vacancies + [make_vacancy("6", 0), make_vacancy("7", None)])
+
+        assert [v["id"] for v in salary_store.salary_between(0, 100000)] == ["1", "4", "3", "6", "7"]
+        assert [v["id"] for v in salary_store.salary_between(-1, 0)] == ["3", "6", "7"]
+        assert [v["id"] for v in salary_store.salary_at_least(0)] == ["2", "5", "1", "4", "3", "6", "7"]
+        assert [v["id"] for v in salary_store.top_salary(7)][-3:] == ["3", "6", "7"]
+        assert [v["id"] for v in salary_store.top_salary(2, SalaryRange(hi=0))] == ["3", "6"]
+        assert [v["id"] for v in salary_store.top_salary(2, lambda v: not v["salary"])] == ["3", "6"]
+
+
+def test_sqlite_top_salary_stops_early(tmp_path, make_vacancy):
+    with SQLiteUserAsk(str(tmp_path / "vacancies.db")) as db:
+        db.add_vacancies(make_vacancy(str(i), i) for i in range(1000))
+        checked = []
+
+        def criteria(vacancy):
+            checked.append(vacancy["id"])
+            return vacancy["salary"] % 2 == 0
+
+        assert [v["id"] for v in db.top_salary(3, criteria)] == ["998", "996", "994"]
+        assert checked == ["999", "998", "997", "996", "995", "994"]
+        # Условие WHERE отсекает строки в базе, предикат проверяет только оставшиеся
+        assert [v["id"] for v in db.top_salary(2, SalaryRange(hi=500) & Contains("Dev"))] == ["500", "499"]
@@ -0,0 +1,91 @@
+import pytest
+from unittest.mock import patch
+from bloom_filter import BloomFilter
+from user_request import UserAsk
+from journal_store import JournalUserAsk
+from resident_store import ResidentUserAsk
+from sqlite_store import SQLiteUserAsk
+
+
+class TestBloomFilter:
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        bloom.update(str(i) for i in range(1000))
+
+        assert all(str(i) in bloom for i in range(1000))
+        false_positives = sum(str(i) in bloom for i in range(1000, 11000))
+        assert false_positives < 300
+
+    def test_persistence(self, tmp_path):
+        path = str(tmp_path / "seen.bloom")
+        bloom = BloomFilter(capacity=1000, path=path)
+        assert bloom.is_new
+        bloom.update(["1", "2"])
+        bloom.save()
+
+        loaded = BloomFilter(capacity=1000, path=path)
+        assert not loaded.is_new
+        assert "1" in loaded and "2" in loaded
+        assert len(loaded) == 2
+        # Фильтр с другими параметрами не загружается
+        assert BloomFilter(capacity=5000, path=path).is_new
+
+
+@pytest.mark.parametrize("kind", ["json", "journal", "resident", "sqlite"])
+def test_existing_ids(kind, tmp_path, make_vacancy):
+    stores = {
+        "json": lambda: UserAsk(str(tmp_path / "vacancies.json")),
+        "journal": lambda: JournalUserAsk(str(tmp_path / "vacancies.jsonl")),
+        "resident": lambda: ResidentUserAsk(str(tmp_path / "vacancies.json"), flush_interval=None),
+        "sqlite": lambda: SQLiteUserAsk(str(tmp_path / "vacancies.db")),
+    }
+    store = stores[kind]()
+    store.add_vacancies([make_vacancy("1"), make_vacancy("2")])
+
+    assert store.existing_ids(["1", "3", "2"]) == {"1", "2"}
+    if hasattr(store, "close"):
+        store.close()
+
+
+class TestSeenGate:
+    def test_stops_on_total_pages(self, hh_simulator, tmp_path, make_hh):
+        hh_simulator.corpus = hh_simulator.corpus[:150]
+        hh = make_hh(UserAsk(str(tmp_path / "vacancies.json")), url=hh_simulator.url, concurrency=1)
+
+        vacancies = hh.load_vacancies("Python", pages=5)
+
+        assert len(vacancies) == 150
+        assert hh_simulator.requests == 2
+
+    def test_known_page_stops_harvest(self, hh_simulator, tmp_path, make_hh):
+        storage = UserAsk(str(tmp_path / "vacancies.json"))
+        bloom = BloomFilter(capacity=10000, path=str(tmp_path / "seen.bloom"))
+        hh = make_hh(storage, url=hh_simulator.url, concurrency=1, seen_filter=bloom)
+        assert len(hh.load_vacancies("Python", pages=3)) == 300
+
+        hh_simulator.requests = 0
+        hh_simulator.latency = 0.02
+        again = make_hh(storage, url=hh_simulator.url, concurrency=1,
+                        seen_filter=BloomFilter(capacity=10000, path=str(tmp_path / "seen.bloom")))
+        with patch.object(UserAsk, "add_vacancies") as add_vacancies:
+            pipeline = again.iter_vacancies("Python", pages=5)
+            assert list(pipeline) == []
+
+        # Следующая страница могла быть запрошена, пока проверялась первая
+        assert hh_simulator.requests <= 2
+        assert pipeline.known == 100
+        add_vacancies.assert_not_called()
+
+    def test_new_items_pass_gate(self, hh_simulator, tmp_path, make_hh):
+        storage = UserAsk(str(tmp_path / "vacancies.json"))
+        # Часть вакансий первой страницы уже сохранена
+        storage.add_vacancies([{"id": v["id"], "name": v["name"], "url": v["alternate_url"],
+                                "salary": 0, "description": ""} for v in hh_simulator.corpus[:40]])
+        bloom = BloomFilter(capacity=10000)
+        hh = make_hh(storage, url=hh_simulator.url, seen_filter=bloom)
+
+        vacancies = hh.load_vacancies("Python", pages=2)
+
+        assert len(vacancies) == 160
+        assert len(bloom) == 200
+        assert len(storage.get_vacancies(lambda v: True)) == 200
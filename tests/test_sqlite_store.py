@@ -0,0 +1,114 @@
+import sqlite3
+import pytest
+from unittest.mock import patch
+from sqlite_store import SQLiteUserAsk
+from user_request import UserAsk
+from HH import HH
+from main import make_storage
+
+
+@pytest.fixture
+def store(tmp_path):
+    db = SQLiteUserAsk(str(tmp_path / "vacancies.db"))
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def sample_vacancies():
+    return [
+        {"id": "1", "name": "Senior Python Developer", "url": "https://test.com/1",
+         "salary": 200000, "description": "Python, Django"},
+        {"id": "2", "name": "Java Developer", "url": "https://test.com/2",
+         "salary": 180000, "description": "Java, Spring"},
+        {"id": "3", "name": "Менеджер по продажам", "url": "https://test.com/3",
+         "salary": 90000, "description": "Опыт работы с клиентами"},
+    ]
+
+
+class TestSQLiteUserAsk:
+    def test_add_get_delete(self, store, sample_vacancies):
+        store.add_vacancies(sample_vacancies)
+        store.add_vacancy(sample_vacancies[0])
+
+        assert [v["id"] for v in store.get_vacancies(lambda v: True)] == ["1", "2", "3"]
+        assert store.get_vacancies(lambda v: v["salary"] > 150000)[1]["requirement"] == "Java, Spring"
+        assert store.delete_vacancy("2") is True
+        assert store.delete_vacancy("2") is False
+        assert store.search_vac("Java") == []
+
+    def test_search_matches_substring_semantics(self, store, sample_vacancies):
+        store.add_vacancies(sample_vacancies)
+
+        assert store.has_fts
+        assert [v["id"] for v in store.search_vac("python")] == ["1"]
+        assert [v["id"] for v in store.search_vac("МЕНЕДЖ")] == ["3"]
+        assert [v["id"] for v in store.search_vac("клиент")] == ["3"]
+        assert [v["id"] for v in store.search_vac("Dev")] == ["1", "2"]
+        assert store.search_vac("Rust") == []
+
+    def test_search_same_as_user_ask(self, store, sample_vacancies, tmp_path):
+        reference = UserAsk(str(tmp_path / "reference.json"))
+        reference.add_vacancies(sample_vacancies)
+        store.add_vacancies(sample_vacancies)
+
+        for keyword in ["developer", "er", "Spring", "о", "работы с"]:
+            assert store.search_vac(keyword) == reference.search_vac(keyword)
+
+    def test_top_salary(self, store, sample_vacancies):
+        store.add_vacancies(sample_vacancies)
+        assert [v["salary"] for v in store.top_salary(2)] == [200000, 180000]
+        assert store.top_salary(0) == []
+
+    def test_uses_salary_index(self, store):
+        plan = store._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM vacancies ORDER BY salary DESC LIMIT 5"
+        ).fetchall()
+        assert any("idx_vacancies_salary" in row[-1] for row in plan)
+
+    def test_persistence(self, tmp_path, sample_vacancies):
+        file_name = str(tmp_path / "vacancies.db")
+        with SQLiteUserAsk(file_name) as db:
+            db.add_vacancies(sample_vacancies)
+        with SQLiteUserAsk(file_name) as db:
+            assert len(db.get_vacancies(lambda v: True)) == 3
+            assert db.search_vac("spring")[0]["id"] == "2"
+
+    def test_failed_fts_schema_is_rolled_back(self, tmp_path, sample_vacancies):
+        class NoStemsFts(sqlite3.Connection):
+            def execute(self, sql, *args):
+                if "vacancies_stems_fts USING" in sql:
+                    raise sqlite3.OperationalError("no such tokenizer")
+                return super().execute(sql, *args)
+
+        connect = sqlite3.connect
+        with patch("sqlite_store.sqlite3.connect", lambda *a, **kw: connect(*a, factory=NoStemsFts, **kw)):
+            db = SQLiteUserAsk(str(tmp_path / "vacancies.db"))
+        assert db.has_fts is False
+        names = {row[0] for row in db._conn.execute("SELECT name FROM sqlite_master")}
+        assert not any(name.startswith("vacancies_fts") or name.startswith("vacancies_a") for name in names)
+        db.add_vacancies(sample_vacancies)
+        assert [v["id"] for v in db.search_vac("spring")] == ["2"]
+        db.close()
+
+    def test_hh_drop_in(self, store):
+        hh = HH(store)
+        hh.add_vac({
+            "id": "10",
+            "name": "Data Engineer",
+            "alternate_url": "https://hh.ru/vacancy/10",
+            "salary": None,
+            "snippet": {"requirement": None},
+        })
+        hh.add_vac({"id": "11", "name": "Analyst", "alternate_url": "https://hh.ru/vacancy/11", "salary": None})
+        # Без требований в сниппете сохраняется описание по умолчанию, как до появления _normalize
+        assert hh.get_vac(lambda v: v["id"] == "10")[0]["requirement"] == "Описание не указано"
+        assert hh.get_vac(lambda v: v["id"] == "11")[0]["requirement"] == "Описание не указано"
+        assert hh.del_vac("10") is True
+
+    def test_make_storage(self, tmp_path):
+        db = make_storage("sqlite", str(tmp_path / "main.db"))
+        assert isinstance(db, SQLiteUserAsk)
+        db.close()
+        with pytest.raises(ValueError):
+            make_storage("csv")
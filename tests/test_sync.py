@@ -0,0 +1,114 @@
+import pytest
+import requests
+from unittest.mock import Mock, patch
+from sync_state import SyncCursor
+
+
+def api_item(vacancy_id, published_at):
+    return {
+        "id": vacancy_id,
+        "name": f"Python Developer {vacancy_id}",
+        "alternate_url": f"https://hh.ru/vacancy/{vacancy_id}",
+        "salary": None,
+        "snippet": {"requirement": "Python"},
+        "published_at": published_at,
+    }
+
+
+class FakeAPI:
+    """Выдача от новых к старым с поддержкой date_from и date_to"""
+
+    def __init__(self, items, per_page):
+        self.items = items
+        self.per_page = per_page
+        self.requests = []
+        self.fail = False
+
+    def get(self, url, headers=None, params=None, **kwargs):
+        self.requests.append(dict(params))
+        response = Mock()
+        if self.fail:
+            response.raise_for_status.side_effect = requests.HTTPError("500 Server Error")
+        items = sorted(self.items, key=lambda item: item["published_at"], reverse=True)
+        if "date_from" in params:
+            items = [item for item in items if item["published_at"] >= params["date_from"]]
+        if "date_to" in params:
+            items = [item for item in items if item["published_at"] <= params["date_to"]]
+        start = params["page"] * self.per_page
+        pages = (len(items) + self.per_page - 1) // self.per_page
+        response.json.return_value = {"items": items[start:start + self.per_page], "pages": pages}
+        return response
+
+
+@pytest.fixture
+def hh(tmp_path, make_hh):
+    return make_hh(Mock(), per_page=2, sync_dir=str(tmp_path / "sync"))
+
+
+class TestSync:
+    def test_first_sync_loads_everything(self, hh, tmp_path):
+        api = FakeAPI([api_item(str(i), f"2024-05-0{i}T10:00:00+0300") for i in range(1, 6)], per_page=2)
+
+        with patch.object(hh.session, "get", side_effect=api.get):
+            vacancies = hh.sync("Python")
+
+        assert [v["id"] for v in vacancies] == ["5", "4", "3", "2", "1"]
+        assert len(api.requests) == 3
+        assert "date_from" not in api.requests[0]
+        assert api.requests[0]["order_by"] == "publication_time"
+        cursor = SyncCursor(str(tmp_path / "sync"), "Python")
+        assert cursor.published_at == "2024-05-05T10:00:00+0300"
+
+    def test_next_sync_fetches_only_new(self, hh):
+        api = FakeAPI([api_item(str(i), f"2024-05-0{i}T10:00:00+0300") for i in range(1, 6)], per_page=2)
+
+        with patch.object(hh.session, "get", side_effect=api.get):
+            hh.sync("Python")
+            api.items.append(api_item("6", "2024-05-06T10:00:00+0300"))
+            api.requests.clear()
+            vacancies = hh.sync("Python")
+
+        assert [v["id"] for v in vacancies] == ["6"]
+        assert len(api.requests) == 1
+        assert api.requests[0]["date_from"] == "2024-05-05T10:00:00+0300"
+
+    def test_stops_on_known_ids(self, hh):
+        api = FakeAPI([api_item(str(i), f"2024-05-0{i}T10:00:00+0300") for i in range(1, 6)], per_page=2)
+
+        with patch.object(hh.session, "get", side_effect=api.get):
+            hh.sync("Python")
+            # Сервер игнорирует date_from - остановка по известным ID
+            api.items = [dict(item, published_at="2024-05-05T10:00:00+0300") for item in api.items]
+            api.requests.clear()
+            vacancies = hh.sync("Python")
+
+        assert vacancies == []
+        assert len(api.requests) == 1
+
+    def test_cursor_not_saved_on_error(self, hh, tmp_path):
+        api = FakeAPI([api_item("1", "2024-05-01T10:00:00+0300")], per_page=2)
+        api.fail = True
+
+        with patch.object(hh.session, "get", side_effect=api.get):
+            assert hh.sync("Python") == []
+
+        assert SyncCursor(str(tmp_path / "sync"), "Python").published_at is None
+
+    def test_truncated_window_keeps_gap(self, hh, tmp_path):
+        api = FakeAPI([api_item(str(i), f"2024-05-{i:02d}T10:00:00+0300") for i in range(1, 10)], per_page=2)
+
+        with patch.object(hh.session, "get", side_effect=api.get):
+            first = hh.sync("Python", pages=2)
+            cursor = SyncCursor(str(tmp_path / "sync"), "Python")
+            # Курсор сдвинут, но непрочитанные старые вакансии помнятся как промежуток
+            assert cursor.published_at == "2024-05-09T10:00:00+0300"
+            assert cursor.gap == [None, "2024-05-06T10:00:00+0300"]
+
+            second = hh.sync("Python", pages=2)
+            assert SyncCursor(str(tmp_path / "sync"), "Python").gap == [None, "2024-05-03T10:00:00+0300"]
+            third = hh.sync("Python", pages=2)
+
+        ids = [v["id"] for v in first + second + third]
+        assert sorted(ids, key=int) == [str(i) for i in range(1, 10)]
+        assert len(ids) == len(set(ids))
+        assert SyncCursor(str(tmp_path / "sync"), "Python").gap is None
@@ -0,0 +1,75 @@
+import pytest
+from trigram_index import TrigramIndex, similarity, fuzzy_score
+from user_request import UserAsk
+from resident_store import ResidentUserAsk
+from sqlite_store import SQLiteUserAsk
+
+VACANCIES = [
+    {"id": "1", "name": "Python Developer", "url": "https://test.com/1", "salary": 150000,
+     "description": "Django, PostgreSQL"},
+    {"id": "2", "name": "Разработчик 1С", "url": "https://test.com/2", "salary": 120000,
+     "description": "Опыт разработки от 3 лет"},
+    {"id": "3", "name": "Java Developer", "url": "https://test.com/3", "salary": 180000,
+     "description": "Spring, Hibernate"},
+    {"id": "4", "name": "Менеджер по продажам", "url": "https://test.com/4", "salary": 60000,
+     "description": "Python не нужен"},
+]
+
+
+def test_similarity():
+    assert similarity("python", "python") == 1.0
+    assert similarity("pyton", "python") > 0.4
+    assert similarity("pyton", "java") == 0.0
+    assert fuzzy_score("pyton", {"name": "Python Developer", "requirement": ""}) == similarity("pyton", "python")
+
+
+def test_index_candidates():
+    index = TrigramIndex()
+    index.rebuild(UserAsk._make_record(vacancy) for vacancy in VACANCIES)
+
+    assert index.substring_candidates("thon dev") == {"1"}
+    assert index.substring_candidates("velo") == {"1", "3"}
+    assert index.substring_candidates("py") is None
+    assert index.fuzzy_candidates("pyton", 0.3) == {"1", "4"}
+
+    index.remove(UserAsk._make_record(VACANCIES[0]))
+    assert index.substring_candidates("thon dev") == set()
+    assert index.fuzzy_candidates("pyton", 0.3) == {"4"}
+    assert "django" not in index.words
+
+
+@pytest.mark.parametrize("kind", ["plain", "trigrams", "resident", "sqlite"])
+def test_fuzzy_search(kind, tmp_path):
+    stores = {
+        "plain": lambda: UserAsk(str(tmp_path / "vacancies.json")),
+        "trigrams": lambda: UserAsk(str(tmp_path / "vacancies.json"), trigrams=True),
+        "resident": lambda: ResidentUserAsk(str(tmp_path / "vacancies.json"), flush_interval=None, trigrams=True),
+        "sqlite": lambda: SQLiteUserAsk(str(tmp_path / "vacancies.db")),
+    }
+    store = stores[kind]()
+    store.add_vacancies(VACANCIES)
+
+    assert [v["id"] for v in store.fuzzy_search("pyton")] == ["1", "4"]
+    assert [v["id"] for v in store.fuzzy_search("разработчк")] == ["2"]
+    assert [v["id"] for v in store.fuzzy_search("pyton developr", threshold=0.2)] == ["1", "3", "4"]
+    assert [v["id"] for v in store.fuzzy_search("pyton developr", threshold=0.5)] == ["1"]
+    assert store.fuzzy_search("pyton", limit=1)[0]["id"] == "1"
+    assert store.search_vac("азработ") == [v for v in store.get_vacancies(lambda v: v["id"] == "2")]
+    if hasattr(store, "close"):
+        store.close()
+
+
+def test_planner_uses_trigrams_for_mid_word(tmp_path):
+    store = UserAsk(str(tmp_path / "vacancies.json"), index=True, trigrams=True)
+    store.add_vacancies(VACANCIES)
+    store.delete_vacancy("3")
+
+    plan = store.explain("search_vac", "eveloper")
+    assert plan.access == ["trigram 'eveloper'"]
+    assert plan.actual_rows == 1
+
+    # Индекс перестраивается, если файл изменён другим процессом
+    other = UserAsk(str(tmp_path / "vacancies.json"))
+    other.add_vacancy({"id": "5", "name": "Go Developer", "url": "https://test.com/5",
+                       "salary": 0, "description": ""})
+    assert [v["id"] for v in store.search_vac("eveloper")] == ["1", "5"]
@@ -111,7 +111,7 @@ class TestUserAsk:
         assert user_ask.delete_vacancy("456") is False
 
 class TestHH:
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_vacancies_by_keyword(self, mock_get, mock_hh_response, test_file):
         mock_response = Mock()
         mock_response.json.return_value = mock_hh_response
@@ -125,7 +125,7 @@ class TestHH:
         assert len(vacancies) > 0
         assert "Python" in vacancies[0]["name"]
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_api_error_handling(self, mock_get, test_file):
         mock_response = Mock()
         mock_response.status_code = 404
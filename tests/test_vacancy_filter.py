@@ -0,0 +1,90 @@
+import pytest
+from vacancy_filter import field, Contains, SalaryRange, IdIn, And, Or, Not
+from keyword_index import KeywordIndex
+from salary_index import SalaryIndex
+from user_request import UserAsk
+from journal_store import JournalUserAsk
+from resident_store import ResidentUserAsk
+from sqlite_store import SQLiteUserAsk
+
+VACANCIES = [
+    {"id": "1", "name": "Python Developer", "url": "https://test.com/1", "salary": 150000,
+     "description": "Django, PostgreSQL"},
+    {"id": "2", "name": "Java Developer", "url": "https://test.com/2", "salary": 180000,
+     "description": "Spring"},
+    {"id": "3", "name": "Аналитик данных", "url": "https://test.com/3", "salary": None,
+     "description": "SQL и Python"},
+    {"id": "4", "name": "Junior Python", "url": "https://test.com/4", "salary": 60000,
+     "description": "Основы"},
+]
+
+FILTERS = [
+    Contains("python"),
+    field("salary") >= 100000,
+    field("salary") < 100000,
+    field("salary") != 150000,
+    SalaryRange(0, 100000),
+    IdIn(["2", "3", "99"]),
+    field("id") == "4",
+    Contains("python") & (field("salary") > 100000),
+    Contains("java") | SalaryRange(50000, 70000),
+    ~Contains("developer"),
+    And(Contains("py"), Not(field("name").contains("junior"))),
+    Or(),
+]
+
+
+def records():
+    return [UserAsk._make_record(vacancy) for vacancy in VACANCIES]
+
+
+def test_compiled_predicate():
+    predicate = (Contains("PYTHON") & SalaryRange(100000, 200000)).compile()
+    assert [v["id"] for v in records() if predicate(v)] == ["1"]
+    assert [v["id"] for v in records() if (field("salary") <= 100000)(v)] == ["4"]
+    assert field("id").is_in(["1", "2"]).candidates(None, None) == {"1", "2"}
+    assert [v["id"] for v in records() if field("name").is_in(["Java Developer"])(v)] == ["2"]
+
+
+def test_candidates_from_indexes(tmp_path):
+    keyword_index = KeywordIndex(str(tmp_path / "idx"))
+    salary_index = SalaryIndex()
+    keyword_index.rebuild(records())
+    salary_index.rebuild(records())
+
+    assert (Contains("python") & SalaryRange(100000, 200000)).candidates(keyword_index, salary_index) == {"1"}
+    assert (field("salary") >= 100000).candidates(keyword_index, salary_index) == {"1", "2"}
+    assert (Contains("python") | Contains("spring")).candidates(keyword_index, salary_index) == {"1", "2", "3", "4"}
+    # Отрицание и поля без индекса не ограничивают кандидатов
+    assert (~Contains("python")).candidates(keyword_index, salary_index) is None
+    assert (Contains("python") | (field("url") == "x")).candidates(keyword_index, salary_index) is None
+
+
+@pytest.mark.parametrize("kind", ["json", "indexed", "journal", "resident", "sqlite"])
+def test_stores_match_plain_scan(kind, tmp_path):
+    stores = {
+        "json": lambda: UserAsk(str(tmp_path / "vacancies.json")),
+        "indexed": lambda: UserAsk(str(tmp_path / "vacancies.json"), index=True),
+        "journal": lambda: JournalUserAsk(str(tmp_path / "vacancies.jsonl")),
+        "resident": lambda: ResidentUserAsk(str(tmp_path / "vacancies.json"), flush_interval=None, index=True),
+        "sqlite": lambda: SQLiteUserAsk(str(tmp_path / "vacancies.db")),
+    }
+    store = stores[kind]()
+    store.add_vacancies(VACANCIES)
+
+    for criteria in FILTERS:
+        expected = [v["id"] for v in store.get_vacancies(lambda v: criteria.compile()(v))]
+        assert [v["id"] for v in store.get_vacancies(criteria)] == expected, criteria
+    if hasattr(store, "close"):
+        store.close()
+
+
+def test_sqlite_pushdown(tmp_path):
+    criteria = Contains("python") & SalaryRange(100000, 200000) & ~(field("id") == "2")
+    sql, params = criteria.to_sql(has_fts=True)
+    assert "vacancies_fts MATCH" in sql and "salary >= ?" in sql
+    assert params == ['"python"', 100000, 200000]
+
+    with SQLiteUserAsk(str(tmp_path / "vacancies.db")) as store:
+        store.add_vacancies(VACANCIES)
+        assert [v["id"] for v in store.get_vacancies(criteria)] == ["1"]
@@ -0,0 +1,254 @@
+from typing import List, Dict, Any, Iterable, Optional, Set, Tuple
+
+from keyword_index import tokenize
+
+# Поля вакансии, по которым строится индекс
+TEXT_FIELDS = ("name", "requirement")
+
+
+def trigrams(text: str) -> Set[str]:
+    """
+    Возвращает множество триграмм строки (для поиска подстроки).
+
+    Args:
+        text (str): Строка в нижнем регистре
+
+    Returns:
+        Set[str]: Триграммы
+    """
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def word_trigrams(word: str) -> Set[str]:
+    """
+    Возвращает триграммы слова с отступами по краям, как в pg_trgm:
+    начало слова весит больше, и короткие слова тоже получают триграммы.
+
+    Args:
+        word (str): Слово в нижнем регистре
+
+    Returns:
+        Set[str]: Триграммы
+    """
+    return trigrams(f"  {word} ")
+
+
+def similarity(first: str, second: str) -> float:
+    """
+    Похожесть слов: доля общих триграмм (коэффициент Жаккара).
+
+    Args:
+        first (str): Первое слово в нижнем регистре
+        second (str): Второе слово в нижнем регистре
+
+    Returns:
+        float: Похожесть от 0 до 1
+    """
+    a, b = word_trigrams(first), word_trigrams(second)
+    if not a or not b:
+        return 0.0
+    common = len(a & b)
+    return common / (len(a) + len(b) - common)
+
+
+def fuzzy_score(keyword: str, vacancy: Dict[str, Any]) -> float:
+    """
+    Оценивает, насколько вакансия похожа на запрос: для каждого слова запроса
+    берётся самое похожее слово названия или требований, оценки усредняются.
+
+    Args:
+        keyword (str): Запрос
+        vacancy (Dict[str, Any]): Запись вакансии
+
+    Returns:
+        float: Оценка от 0 до 1
+    """
+    query = tokenize(keyword)
+    words = set()
+    for name in TEXT_FIELDS:
+        words.update(tokenize(vacancy.get(name)))
+    if not query or not words:
+        return 0.0
+    return sum(max(similarity(token, word) for word in words) for token in query) / len(query)
+
+
+class TrigramIndex:
+    """
+    Триграммный индекс названия и требований вакансий.
+    Триграммы текста -> ID дают кандидатов для поиска любой подстроки
+    от трёх символов (в том числе середины слова) пересечением списков;
+    триграммы слов -> слова -> ID дают кандидатов для нечёткого поиска
+    с опечатками. Кандидаты всегда проверяются точно: подстрока - сравнением,
+    нечёткое совпадение - пересчётом оценки по тексту вакансии.
+    Индекс хранится в памяти и строится заново при загрузке данных.
+    """
+
+    def __init__(self):
+        """
+        Инициализация пустого индекса.
+        """
+        self.postings: Dict[str, Set[str]] = {}
+        self.words: Dict[str, Set[str]] = {}
+        self.word_postings: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.postings)
+
+    def add(self, vacancy: Dict[str, Any]) -> None:
+        """
+        Добавляет вакансию в индекс.
+
+        Args:
+            vacancy (Dict[str, Any]): Запись вакансии
+        """
+        vacancy_id = vacancy["id"]
+        text_trigrams, words = self._vacancy_terms(vacancy)
+        for trigram in text_trigrams:
+            self.postings.setdefault(trigram, set()).add(vacancy_id)
+        for word in words:
+            ids = self.words.get(word)
+            if ids is None:
+                ids = self.words[word] = set()
+                for trigram in word_trigrams(word):
+                    self.word_postings.setdefault(trigram, set()).add(word)
+            ids.add(vacancy_id)
+
+    def remove(self, vacancy: Dict[str, Any]) -> None:
+        """
+        Удаляет вакансию из индекса.
+
+        Args:
+            vacancy (Dict[str, Any]): Запись вакансии
+        """
+        vacancy_id = vacancy["id"]
+        text_trigrams, words = self._vacancy_terms(vacancy)
+        for trigram in text_trigrams:
+            ids = self.postings.get(trigram)
+            if ids is None:
+                continue
+            ids.discard(vacancy_id)
+            if not ids:
+                del self.postings[trigram]
+        for word in words:
+            ids = self.words.get(word)
+            if ids is None:
+                continue
+            ids.discard(vacancy_id)
+            if ids:
+                continue
+            del self.words[word]
+            for trigram in word_trigrams(word):
+                bucket = self.word_postings.get(trigram)
+                if bucket is not None:
+                    bucket.discard(word)
+                    if not bucket:
+                        del self.word_postings[trigram]
+
+    def rebuild(self, vacancies: Iterable[Dict[str, Any]]) -> None:
+        """
+        Строит индекс заново по всем вакансиям.
+
+        Args:
+            vacancies (Iterable[Dict[str, Any]]): Записи вакансий
+        """
+        self.postings, self.words, self.word_postings = {}, {}, {}
+        for vacancy in vacancies:
+            self.add(vacancy)
+
+    def substring_lists(self, keyword: str) -> Optional[List[Set[str]]]:
+        """
+        Возвращает списки ID для триграмм подстроки, от самого короткого.
+
+        Args:
+            keyword (str): Искомая подстрока
+
+        Returns:
+            Optional[List[Set[str]]]: Списки ID (пустое множество в начале - совпадений нет)
+                или None, если подстрока короче трёх символов
+        """
+        needle_trigrams = trigrams(keyword.lower())
+        if not needle_trigrams:
+            return None
+        return sorted((self.postings.get(trigram, set()) for trigram in needle_trigrams), key=len)
+
+    def substring_candidates(self, keyword: str) -> Optional[Set[str]]:
+        """
+        Возвращает ID вакансий, которые могут содержать подстроку.
+
+        Args:
+            keyword (str): Искомая подстрока
+
+        Returns:
+            Optional[Set[str]]: Пересечение списков ID или None, если подстрока короче трёх символов
+        """
+        lists = self.substring_lists(keyword)
+        if lists is None:
+            return None
+        result = set(lists[0])
+        for ids in lists[1:]:
+            if not result:
+                break
+            result &= ids
+        return result
+
+    def similar_words(self, word: str, threshold: float) -> List[Tuple[str, float]]:
+        """
+        Находит слова словаря, похожие на слово запроса не меньше порога.
+        Число общих триграмм считается по спискам триграмм, поэтому
+        сравниваются только слова, у которых есть общие триграммы.
+
+        Args:
+            word (str): Слово запроса в нижнем регистре
+            threshold (float): Минимальная похожесть
+
+        Returns:
+            List[Tuple[str, float]]: Слова и их похожесть
+        """
+        query = word_trigrams(word)
+        common: Dict[str, int] = {}
+        for trigram in query:
+            for candidate in self.word_postings.get(trigram, ()):
+                common[candidate] = common.get(candidate, 0) + 1
+        result = []
+        for candidate, shared in common.items():
+            score = shared / (len(query) + len(word_trigrams(candidate)) - shared)
+            if score >= threshold:
+                result.append((candidate, score))
+        return result
+
+    def fuzzy_candidates(self, keyword: str, threshold: float) -> Set[str]:
+        """
+        Возвращает ID вакансий, которые могут набрать оценку не ниже порога.
+        Средняя оценка не выше лучшей по словам запроса, поэтому достаточно
+        взять вакансии, где хотя бы одно слово запроса похоже не меньше порога.
+
+        Args:
+            keyword (str): Запрос
+            threshold (float): Минимальная оценка
+
+        Returns:
+            Set[str]: ID кандидатов
+        """
+        ids: Set[str] = set()
+        for token in set(tokenize(keyword)):
+            for word, _ in self.similar_words(token, threshold):
+                ids |= self.words[word]
+        return ids
+
+    @staticmethod
+    def _vacancy_terms(vacancy: Dict[str, Any]) -> Tuple[Set[str], Set[str]]:
+        """
+        Возвращает триграммы текста и слова названия и требований вакансии.
+
+        Args:
+            vacancy (Dict[str, Any]): Запись вакансии
+
+        Returns:
+            Tuple[Set[str], Set[str]]: Триграммы и слова
+        """
+        text_trigrams, words = set(), set()
+        for name in TEXT_FIELDS:
+            text = (vacancy.get(name) or "").lower()
+            text_trigrams |= trigrams(text)
+            words.update(tokenize(text))
+        return text_trigrams, words
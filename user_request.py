@@ -1,7 +1,17 @@
-from typing import List, Dict, Any, Callable
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, ContextManager, Tuple, Set
+import atexit
+import contextlib
 import json
+import threading
 
 from HH import HH
+from keyword_index import KeywordIndex, file_signature
+from salary_index import SalaryIndex
+from trigram_index import TrigramIndex, fuzzy_score
+from morphology import StemIndex
+from vacancy_filter import Filter, Contains, WordForms
+from query_planner import QueryPlanner, QueryPlan, SCAN_COST, CALLABLE_SELECTIVITY
+from pagination import Page, paginate, take_sequence, SEQ_FIELD
 
 
 class UserAsk:
@@ -10,14 +20,37 @@ class UserAsk:
     Обеспечивает функционал добавления, поиска и удаления вакансий.
     """
 
-    def __init__(self, file_name: str):
+    def __init__(self, file_name: str, index: bool = False, trigrams: bool = False, morphology: bool = False):
         """
         Инициализация класса UserAsk.
 
         Args:
             file_name (str): Имя файла для хранения вакансий
+            index (bool): Вести индексы: слов для search_vac (хранится в файле <file_name>.idx)
+                и зарплат для top_salary, salary_between и salary_at_least
+            trigrams (bool): Вести триграммный индекс для поиска подстрок и fuzzy_search
+            morphology (bool): Искать в search_vac слова в любой форме; основы слов
+                вычисляются при записи и хранятся в индексе словоформ <file_name>.stems
         """
         self.file_name = file_name
+        self.morphology = morphology
+        self.keyword_index: Optional[KeywordIndex] = KeywordIndex(file_name + ".idx") if index else None
+        self.salary_index: Optional[SalaryIndex] = SalaryIndex() if index else None
+        self.trigram_index: Optional[TrigramIndex] = TrigramIndex() if trigrams else None
+        self.stem_index: Optional[StemIndex] = StemIndex(file_name + ".stems") if morphology else None
+        self.planner = QueryPlanner(self.keyword_index, self.salary_index, self.trigram_index, self.stem_index)
+        # Основы слов вакансий для предикатов WordForms (вычислены при записи)
+        self._stems_of = self.stem_index.lookup if self.stem_index is not None else None
+        # Последний выполненный план в каждом потоке (для explain)
+        self._plans = threading.local()
+        # Подпись файла данных, которой соответствуют индексы в памяти
+        self._index_signature: Optional[List[int]] = None
+        # Индексы на диске отстают от памяти; глубина вложенных batch()
+        self._indexes_dirty = False
+        self._batch_depth = 0
+        # Номера добавления вакансий (ключ выдачи insertion) и номер для следующей
+        self._sequence: Dict[str, int] = {}
+        self._next_seq = 0
 
     def add_vacancy(self, vacancy: Dict[str, Any]) -> None:
         """
@@ -26,46 +59,111 @@ class UserAsk:
         Args:
             vacancy (Dict[str, Any]): Словарь с данными вакансии
         """
-        try:
-            with open(self.file_name, "r") as file:
-                data = json.load(file)
-        except FileNotFoundError:
-            data = []
-        except json.JSONDecodeError:
-            data = []
-
-        vacancy_dict = {
-            "id": vacancy["id"],
-            "name": vacancy["name"],
-            "url": vacancy["url"],
-            "salary": vacancy["salary"],
-            "requirement": vacancy["description"],
-        }
+        data = self._current_data()
+        vacancy_dict = self._make_record(vacancy)
 
         # Проверяем на дубликаты
         if not any(v["id"] == vacancy_dict["id"] for v in data):
+            self._number(vacancy_dict)
             data.append(vacancy_dict)
+            self._save_data(data)
+            self._index_changed(added=[vacancy_dict])
 
-            with open(self.file_name, "w") as file:
-                json.dump(data, file, indent=4, ensure_ascii=False)
+    def add_vacancies(self, vacancies: Iterable[Dict[str, Any]]) -> None:
+        """
+        Добавляет пачку вакансий за одну запись файла.
+        Дубликаты отсекаются по множеству ID, в том числе внутри самой пачки.
 
-    def get_vacancies(self, criteria: Callable[[Dict[str, Any]], bool]) -> List[Dict[str, Any]]:
+        Args:
+            vacancies (Iterable[Dict[str, Any]]): Вакансии для добавления
+        """
+        data = self._current_data()
+        seen = {v["id"] for v in data}
+        added = []
+
+        for vacancy in vacancies:
+            vacancy_dict = self._make_record(vacancy)
+            if vacancy_dict["id"] not in seen:
+                seen.add(vacancy_dict["id"])
+                self._number(vacancy_dict)
+                data.append(vacancy_dict)
+                added.append(vacancy_dict)
+
+        if added:
+            self._save_data(data)
+            self._index_changed(added=added, batch=True)
+
+    def update_vacancies(self, updates: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Дополняет существующие вакансии новыми полями за одну запись файла.
+
+        Args:
+            updates (Dict[str, Dict[str, Any]]): ID вакансии -> поля для добавления или замены
+
+        Returns:
+            int: Количество обновлённых вакансий
+        """
+        data = self._current_data()
+        removed, added = [], []
+        for position, vacancy in enumerate(data):
+            fields = updates.get(vacancy["id"])
+            if not fields:
+                continue
+            updated = self._merge_fields(vacancy, fields)
+            data[position] = updated
+            removed.append(vacancy)
+            added.append(updated)
+
+        if added:
+            self._save_data(data)
+            self._index_changed(added=added, removed=removed, batch=True)
+        return len(added)
+
+    def get_vacancies(self, criteria: Callable[[Dict[str, Any]], bool], limit: Optional[int] = None,
+                      cursor: Optional[str] = None, order: str = "insertion") -> List[Dict[str, Any]]:
         """
         Получает вакансии, соответствующие заданным критериям.
+        С limit возвращается одна страница (Page) с курсором следующей страницы.
 
         Args:
             criteria (Callable[[Dict[str, Any]], bool]): Функция-критерий для фильтрации вакансий
+                или Filter (план запроса выбирает QueryPlanner: индексы или полный просмотр)
+            limit (Optional[int]): Размер страницы (None - все вакансии списком)
+            cursor (Optional[str]): Курсор из Page.next_cursor предыдущей страницы
+            order (str): Порядок страниц: insertion (добавления) или salary (по убыванию зарплаты)
 
         Returns:
-            List[Dict[str, Any]]: Список отфильтрованных вакансий
+            List[Dict[str, Any]]: Список отфильтрованных вакансий в порядке хранения или Page
         """
-        try:
-            with open(self.file_name, "r") as file:
-                data = json.load(file)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
+        if limit is not None:
+            with self._read_lock():
+                data = self._current_data()
+                sequence = self._sequence
+                predicate = self._page_predicate(criteria, len(data))
+            return paginate(data, sequence, predicate, limit, cursor, order)
+
+        if not isinstance(criteria, Filter):
+            return self._scan(self._load_data(), criteria)
+
+        with self._read_lock():
+            data = self._current_data()
+            plan = self.planner.plan_filter(criteria, len(data))
+            ids = plan.candidates()
+        return self._execute_filter(plan, data, criteria, ids)
+
+    def existing_ids(self, ids: Iterable[str]) -> Set[str]:
+        """
+        Проверяет, какие из ID уже есть в хранилище.
 
-        return [vacancy for vacancy in data if criteria(vacancy)]
+        Args:
+            ids (Iterable[str]): ID вакансий
+
+        Returns:
+            Set[str]: ID, которые есть в хранилище
+        """
+        with self._read_lock():
+            records = self._records_by_id()
+            return {vacancy_id for vacancy_id in ids if vacancy_id in records}
 
     def delete_vacancy(self, vacancy_id: str) -> bool:
         """
@@ -77,49 +175,160 @@ class UserAsk:
         Returns:
             bool: True если вакансия была удалена, False если не найдена
         """
-        try:
-            with open(self.file_name, "r") as file:
-                data = json.load(file)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return False
-
-        initial_length = len(data)
+        data = self._current_data()
         updated_data = [vacancy for vacancy in data if vacancy.get("id") != vacancy_id]
 
-        if len(updated_data) < initial_length:
-            with open(self.file_name, "w") as file:
-                json.dump(updated_data, file, indent=4, ensure_ascii=False)
+        if len(updated_data) < len(data):
+            self._save_data(updated_data)
+            self._index_changed(removed=[vacancy for vacancy in data if vacancy.get("id") == vacancy_id])
             return True
         return False
 
-    def search_vac(self, keyword: str) -> List[Dict[str, Any]]:
+    def search_vac(self, keyword: str, limit: Optional[int] = None, cursor: Optional[str] = None,
+                   order: str = "insertion") -> List[Dict[str, Any]]:
         """
         Поиск вакансий по ключевому слову в названии или описании.
+        При включённом индексе планировщик решает, проверять ли только
+        вакансии-кандидаты из индекса слов или все вакансии.
+        С morphology=True ищутся все слова запроса в любой форме (WordForms).
 
         Args:
             keyword (str): Ключевое слово для поиска
+            limit (Optional[int]): Размер страницы (None - все найденные вакансии)
+            cursor (Optional[str]): Курсор предыдущей страницы
+            order (str): Порядок страниц: insertion или salary
 
         Returns:
-            List[Dict[str, Any]]: Список найденных вакансий
+            List[Dict[str, Any]]: Список найденных вакансий или Page
         """
-        return self.get_vacancies(
-            lambda vacancy: keyword.lower() in vacancy["name"].lower() or
-                            keyword.lower() in vacancy.get("requirement", "").lower()
-        )
+        criteria = WordForms(keyword) if self.morphology else Contains(keyword)
+        return self.get_vacancies(criteria, limit=limit, cursor=cursor, order=order)
 
-    def top_salary(self, n: int) -> List[Dict[str, Any]]:
+    def fuzzy_search(self, keyword: str, threshold: float = 0.3, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Нечёткий поиск с опечатками и неполными словами ("pyton", "разработчк").
+        Оценка вакансии - средняя по словам запроса похожесть (доля общих триграмм)
+        на самое похожее слово названия или требований. С триграммным индексом
+        оценка пересчитывается только для вакансий-кандидатов.
+
+        Args:
+            keyword (str): Запрос
+            threshold (float): Минимальная оценка от 0 до 1
+            limit (Optional[int]): Максимальное число вакансий (None - все)
+
+        Returns:
+            List[Dict[str, Any]]: Вакансии по убыванию оценки
+        """
+        candidates = None
+        if self.trigram_index is not None and threshold > 0:
+            with self._read_lock():
+                by_id = self._records_by_id()
+                ids = self.trigram_index.fuzzy_candidates(keyword, threshold)
+                candidates = [by_id[vacancy_id] for vacancy_id in ids if vacancy_id in by_id]
+        if candidates is None:
+            candidates = self.get_vacancies(lambda vacancy: True)
+
+        scored = []
+        for vacancy in candidates:
+            score = fuzzy_score(keyword, vacancy)
+            if score >= threshold:
+                scored.append((-score, str(vacancy["id"]), vacancy))
+        scored.sort(key=lambda item: item[:2])
+        return [vacancy for _, _, vacancy in scored[:limit]]
+
+    def top_salary(self, n: int, criteria: Optional[Callable[[Dict[str, Any]], bool]] = None) -> List[Dict[str, Any]]:
         """
         Возвращает топ N вакансий по зарплате.
+        С индексом зарплат планировщик выбирает между проходом по индексу
+        с остановкой после N подходящих вакансий и отбором с сортировкой.
 
         Args:
             n (int): Количество вакансий для возврата
+            criteria (Optional[Callable[[Dict[str, Any]], bool]]): Критерий отбора (функция или Filter)
 
         Returns:
             List[Dict[str, Any]]: Список вакансий, отсортированных по зарплате
         """
-        data = self.get_vacancies(lambda x: True)
-        data.sort(key=lambda x: x["salary"] if x["salary"] is not None else 0, reverse=True)
-        return data[:n]
+        with self._read_lock():
+            by_id = self._records_by_id()
+            plan = self.planner.plan_top(n, criteria, len(by_id))
+            if plan.strategy == "salary index":
+                result, examined = self._walk_salary_index(by_id, n, criteria)
+            else:
+                ids = plan.candidates()
+                vacancies = list(by_id.values())
+
+        if plan.strategy != "salary index":
+            if criteria is None:
+                matches, examined = vacancies, len(vacancies)
+            elif isinstance(criteria, Filter):
+                matches = self._apply_filter(vacancies, criteria, ids, plan.exact)
+                examined = len(vacancies) if ids is None else len(ids)
+            else:
+                matches, examined = [vacancy for vacancy in vacancies if criteria(vacancy)], len(vacancies)
+            matches.sort(key=SalaryIndex.salary_of, reverse=True)
+            result = matches[:n]
+        plan.finish(len(result), examined)
+        self._plans.last = plan
+        return result
+
+    def salary_between(self, lo: float, hi: float) -> List[Dict[str, Any]]:
+        """
+        Возвращает вакансии с зарплатой от lo до hi включительно.
+
+        Args:
+            lo (float): Нижняя граница зарплаты
+            hi (float): Верхняя граница зарплаты
+
+        Returns:
+            List[Dict[str, Any]]: Список вакансий по убыванию зарплаты
+        """
+        if self.salary_index is not None:
+            return self._from_salary_index(lambda index: index.between(lo, hi))
+
+        data = self.get_vacancies(lambda x: lo <= SalaryIndex.salary_of(x) <= hi)
+        data.sort(key=SalaryIndex.salary_of, reverse=True)
+        return data
+
+    def salary_at_least(self, salary: float) -> List[Dict[str, Any]]:
+        """
+        Возвращает вакансии с зарплатой не ниже заданной.
+
+        Args:
+            salary (float): Минимальная зарплата
+
+        Returns:
+            List[Dict[str, Any]]: Список вакансий по убыванию зарплаты
+        """
+        if self.salary_index is not None:
+            return self._from_salary_index(lambda index: index.at_least(salary))
+
+        data = self.get_vacancies(lambda x: SalaryIndex.salary_of(x) >= salary)
+        data.sort(key=SalaryIndex.salary_of, reverse=True)
+        return data
+
+    def explain(self, operation: str, *args: Any, **kwargs: Any) -> QueryPlan:
+        """
+        Выполняет запрос и возвращает его план: стратегию, использованные
+        индексы, оценку и фактическое число строк.
+
+        Args:
+            operation (str): Имя метода запроса (get_vacancies, search_vac, top_salary, ...)
+            *args: Аргументы запроса
+            **kwargs: Именованные аргументы запроса
+
+        Returns:
+            QueryPlan: План выполненного запроса
+        """
+        self._plans.last = None
+        result = getattr(self, operation)(*args, **kwargs)
+        plan = getattr(self._plans, "last", None)
+        if plan is None:
+            # Запрос выполнен без планировщика (например, средствами SQLite)
+            plan = QueryPlan(operation, "delegated", float("nan"), float("nan"))
+            plan.finish(len(result), len(result))
+        plan.operation = operation
+        return plan
 
     def fetch_vacancies_from_hh(self, keyword: str, pages: int = 1) -> List[Dict[str, Any]]:
         """
@@ -134,3 +343,374 @@ class UserAsk:
         """
         hh = HH(self)
         return hh.load_vacancies(keyword, pages)
+
+    def fetch_many(self, keywords: Iterable[str], pages: int = 1,
+                   concurrency: int = 4) -> Tuple[Dict[str, List[Dict[str, Any]]], List[Dict[str, Any]]]:
+        """
+        Получает вакансии с HH.ru по нескольким ключевым словам и сохраняет их
+        одной записью. Вакансия, найденная по нескольким словам, загружается
+        в хранилище один раз.
+
+        Args:
+            keywords (Iterable[str]): Ключевые слова для поиска
+            pages (int): Количество страниц для каждого слова
+            concurrency (int): Размер общего пула потоков загрузки
+
+        Returns:
+            Tuple[Dict[str, List[Dict[str, Any]]], List[Dict[str, Any]]]:
+                Вакансии по каждому ключевому слову и их объединение без повторов
+        """
+        hh = HH(self, concurrency=concurrency)
+        return hh.load_many(keywords, pages)
+
+    @staticmethod
+    def _make_record(vacancy: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Приводит данные вакансии к формату хранения.
+
+        Args:
+            vacancy (Dict[str, Any]): Словарь с данными вакансии
+
+        Returns:
+            Dict[str, Any]: Запись вакансии для сохранения
+        """
+        return {
+            "id": vacancy["id"],
+            "name": vacancy["name"],
+            "url": vacancy["url"],
+            "salary": vacancy["salary"],
+            "requirement": vacancy["description"],
+        }
+
+    @staticmethod
+    def _merge_fields(vacancy: Dict[str, Any], fields: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Возвращает копию вакансии с добавленными полями (ID не меняется).
+
+        Args:
+            vacancy (Dict[str, Any]): Запись вакансии
+            fields (Dict[str, Any]): Новые поля
+
+        Returns:
+            Dict[str, Any]: Обновлённая запись
+        """
+        updated = dict(vacancy)
+        updated.update({name: value for name, value in fields.items() if name != "id"})
+        return updated
+
+    def _execute_filter(self, plan: QueryPlan, vacancies: List[Dict[str, Any]], criteria: Filter,
+                        ids: Optional[Set[str]]) -> List[Dict[str, Any]]:
+        """
+        Выполняет план отбора и запоминает его вместе с фактическим числом строк.
+
+        Args:
+            plan (QueryPlan): План запроса
+            vacancies (List[Dict[str, Any]]): Вакансии в порядке хранения
+            criteria (Filter): Критерий
+            ids (Optional[Set[str]]): Кандидаты плана или None
+
+        Returns:
+            List[Dict[str, Any]]: Подходящие вакансии
+        """
+        result = self._apply_filter(vacancies, criteria, ids, plan.exact)
+        plan.finish(len(result), len(vacancies) if ids is None else len(ids))
+        self.planner.observe(criteria, len(result), len(vacancies))
+        self._plans.last = plan
+        return result
+
+    def _page_predicate(self, criteria: Callable[[Dict[str, Any]], bool],
+                        total: int) -> Callable[[Dict[str, Any]], bool]:
+        """
+        Возвращает предикат для постраничной выдачи: для Filter кандидаты
+        выбираются по плану запроса, и предикат проверяет сначала их.
+
+        Args:
+            criteria (Callable[[Dict[str, Any]], bool]): Функция-критерий или Filter
+            total (int): Число вакансий в хранилище
+
+        Returns:
+            Callable[[Dict[str, Any]], bool]: Предикат
+        """
+        if not isinstance(criteria, Filter):
+            return criteria
+        plan = self.planner.plan_filter(criteria, total)
+        ids = plan.candidates()
+        predicate = criteria.compile(self._stems_of)
+        if ids is None:
+            return predicate
+        if plan.exact:
+            return lambda vacancy: vacancy["id"] in ids
+        return lambda vacancy: vacancy["id"] in ids and predicate(vacancy)
+
+    def _scan(self, vacancies: Iterable[Dict[str, Any]],
+              criteria: Callable[[Dict[str, Any]], bool]) -> List[Dict[str, Any]]:
+        """
+        Отбирает вакансии функцией-критерием полным просмотром.
+
+        Args:
+            vacancies (Iterable[Dict[str, Any]]): Вакансии
+            criteria (Callable[[Dict[str, Any]], bool]): Функция-критерий
+
+        Returns:
+            List[Dict[str, Any]]: Подходящие вакансии
+        """
+        vacancies = list(vacancies)
+        result = [vacancy for vacancy in vacancies if criteria(vacancy)]
+        plan = QueryPlan("get_vacancies", "full scan", len(vacancies) * CALLABLE_SELECTIVITY,
+                         len(vacancies) * SCAN_COST)
+        plan.finish(len(result), len(vacancies))
+        self._plans.last = plan
+        return result
+
+    def _walk_salary_index(self, by_id: Dict[str, Dict[str, Any]], n: int,
+                           criteria: Optional[Callable[[Dict[str, Any]], bool]]) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Идёт по индексу зарплат по убыванию и останавливается после N подходящих вакансий.
+
+        Args:
+            by_id (Dict[str, Dict[str, Any]]): ID -> запись вакансии
+            n (int): Количество вакансий
+            criteria (Optional[Callable[[Dict[str, Any]], bool]]): Критерий отбора
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: Вакансии и число просмотренных записей индекса
+        """
+        result, examined = [], 0
+        if n <= 0:
+            return result, examined
+        predicate = criteria.compile(self._stems_of) if isinstance(criteria, Filter) else criteria
+        for vacancy_id in self.salary_index.iter_desc():
+            vacancy = by_id[vacancy_id]
+            examined += 1
+            if predicate is None or predicate(vacancy):
+                result.append(vacancy)
+                if len(result) >= n:
+                    break
+        return result, examined
+
+    def _apply_filter(self, vacancies: Iterable[Dict[str, Any]], criteria: Filter,
+                      ids: Optional[Set[str]], exact: bool = False) -> List[Dict[str, Any]]:
+        """
+        Отбирает вакансии по критерию: сначала по множеству кандидатов из индексов
+        (дешёвая проверка ID), затем точным предикатом с основами слов из индекса словоформ.
+
+        Args:
+            vacancies (Iterable[Dict[str, Any]]): Вакансии в порядке хранения
+            criteria (Filter): Критерий
+            ids (Optional[Set[str]]): ID кандидатов или None (проверяются все вакансии)
+            exact (bool): Кандидаты точно подходят, предикат не нужен
+
+        Returns:
+            List[Dict[str, Any]]: Подходящие вакансии
+        """
+        predicate = criteria.compile(self._stems_of)
+        if ids is None:
+            return [vacancy for vacancy in vacancies if predicate(vacancy)]
+        if not ids:
+            return []
+        if exact:
+            return [vacancy for vacancy in vacancies if vacancy["id"] in ids]
+        return [vacancy for vacancy in vacancies if vacancy["id"] in ids and predicate(vacancy)]
+
+    def _from_salary_index(self, select: Callable[[SalaryIndex], List[str]]) -> List[Dict[str, Any]]:
+        """
+        Выбирает вакансии по индексу зарплат.
+
+        Args:
+            select (Callable[[SalaryIndex], List[str]]): Функция, возвращающая ID из индекса
+
+        Returns:
+            List[Dict[str, Any]]: Вакансии в порядке, заданном индексом
+        """
+        with self._read_lock():
+            by_id = self._records_by_id()
+            return [by_id[vacancy_id] for vacancy_id in select(self.salary_index)]
+
+    def _records_by_id(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Возвращает актуальные вакансии в виде словаря по ID.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: ID -> запись вакансии
+        """
+        return {vacancy["id"]: vacancy for vacancy in self._current_data()}
+
+    def _read_lock(self) -> ContextManager:
+        """
+        Возвращает блокировку для согласованного чтения данных и индексов.
+        Файловому хранилищу она не нужна, хранилища в памяти её переопределяют.
+
+        Returns:
+            ContextManager: Контекстный менеджер блокировки
+        """
+        return contextlib.nullcontext()
+
+    def _current_data(self) -> List[Dict[str, Any]]:
+        """
+        Читает все вакансии и приводит индексы в соответствие с файлом.
+
+        Returns:
+            List[Dict[str, Any]]: Список вакансий
+        """
+        data = self._load_data()
+        self._sync_indexes(data)
+        return data
+
+    def _sync_indexes(self, data: List[Dict[str, Any]]) -> None:
+        """
+        Загружает или перестраивает индексы, если файл данных изменился
+        с момента их последнего обновления (например, другим процессом).
+
+        Args:
+            data (List[Dict[str, Any]]): Текущий список вакансий
+        """
+        if all(index is None for index in (self.keyword_index, self.salary_index,
+                                           self.trigram_index, self.stem_index)):
+            return
+        signature = file_signature(self.file_name)
+        if signature == self._index_signature:
+            return
+        if self.keyword_index is not None and not self.keyword_index.load(signature):
+            self.keyword_index.rebuild(data)
+            self.keyword_index.save(signature)
+        if self.stem_index is not None and not self.stem_index.load(signature):
+            self.stem_index.rebuild(data)
+            self.stem_index.save(signature)
+        if self.salary_index is not None:
+            self.salary_index.rebuild(data)
+        if self.trigram_index is not None:
+            self.trigram_index.rebuild(data)
+        self._index_signature = signature
+        self._indexes_dirty = False
+        atexit.unregister(self.flush)
+
+    def _index_changed(self, added: Iterable[Dict[str, Any]] = (),
+                       removed: Iterable[Dict[str, Any]] = (), batch: bool = False) -> None:
+        """
+        Обновляет индексы после изменения данных.
+        Файлы индексов переписываются целиком, поэтому на диск они сохраняются
+        один раз на пачку: после пакетной операции (batch=True) или в конце batch().
+        После одиночного изменения индексы в памяти актуальны, а файлы индексов
+        сохраняются в flush()/close() или при завершении программы; до этого
+        другой экземпляр заметит старую подпись в _sync_indexes и перестроит индексы.
+
+        Args:
+            added (Iterable[Dict[str, Any]]): Добавленные вакансии
+            removed (Iterable[Dict[str, Any]]): Удалённые вакансии
+            batch (bool): Изменение - целая пачка, индексы можно сохранить сразу
+        """
+        indexes = [index for index in (self.keyword_index, self.salary_index, self.trigram_index,
+                                       self.stem_index) if index is not None]
+        if not indexes:
+            return
+        for index in indexes:
+            for vacancy in removed:
+                index.remove(vacancy)
+            for vacancy in added:
+                index.add(vacancy)
+        if batch and not self._batch_depth:
+            self._indexes_dirty = True
+            self._persist_indexes()
+            return
+        if not self._indexes_dirty:
+            atexit.register(self.flush)
+        self._indexes_dirty = True
+        self._index_signature = file_signature(self.file_name)
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Группирует изменения (add_vacancy, delete_vacancy и другие): индексы
+        сохраняются на диск один раз в конце блока.
+
+        Returns:
+            Iterator[None]: Контекстный менеджер
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._indexes_dirty:
+                self._persist_indexes()
+
+    def _persist_indexes(self) -> None:
+        """
+        Сохраняет индексы на диск с подписью только что записанного файла данных.
+        """
+        self._index_signature = file_signature(self.file_name)
+        if self.keyword_index is not None:
+            self.keyword_index.save(self._index_signature)
+        if self.stem_index is not None:
+            self.stem_index.save(self._index_signature)
+        self._indexes_dirty = False
+        atexit.unregister(self.flush)
+
+    def flush(self) -> None:
+        """
+        Сохраняет на диск индексы, отложенные одиночными изменениями
+        (add_vacancy, delete_vacancy). Внутри batch() сохранение выполнится
+        в конце блока.
+        """
+        if self._indexes_dirty and not self._batch_depth:
+            self._persist_indexes()
+
+    def close(self) -> None:
+        """
+        Сохраняет отложенные изменения. Повторный вызов ничего не делает.
+        """
+        self.flush()
+
+    def __enter__(self) -> 'UserAsk':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _load_data(self) -> List[Dict[str, Any]]:
+        """
+        Читает все вакансии из файла. Номера добавления из файла
+        переносятся в _sequence и в записях не возвращаются.
+
+        Returns:
+            List[Dict[str, Any]]: Список вакансий (пустой, если файла нет или он повреждён)
+        """
+        try:
+            with open(self.file_name, "r") as file:
+                data = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            data = []
+        self._sequence, self._next_seq = take_sequence(data)
+        return data
+
+    def _save_data(self, data: List[Dict[str, Any]]) -> None:
+        """
+        Перезаписывает файл списком вакансий.
+
+        Args:
+            data (List[Dict[str, Any]]): Список вакансий
+        """
+        with open(self.file_name, "w") as file:
+            json.dump(self._with_sequence(data), file, indent=4, ensure_ascii=False)
+
+    def _number(self, vacancy: Dict[str, Any]) -> None:
+        """
+        Выдаёт новой вакансии следующий номер добавления.
+
+        Args:
+            vacancy (Dict[str, Any]): Запись новой вакансии
+        """
+        self._sequence[vacancy["id"]] = self._next_seq
+        self._next_seq += 1
+
+    def _with_sequence(self, data: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Возвращает копии записей с номерами добавления для записи в файл.
+
+        Args:
+            data (Iterable[Dict[str, Any]]): Записи вакансий
+
+        Returns:
+            List[Dict[str, Any]]: Записи с полем seq
+        """
+        return [dict(vacancy, **{SEQ_FIELD: self._sequence[vacancy["id"]]}) for vacancy in data]
@@ -0,0 +1,471 @@
+from typing import List, Dict, Any, Callable, FrozenSet, Iterable, Optional, Set, Tuple
+import operator
+
+from keyword_index import KeywordIndex
+from salary_index import SalaryIndex
+from morphology import normalize, vacancy_stems
+
+Predicate = Callable[[Dict[str, Any]], bool]
+# Вакансия -> основы её слов, вычисленные при записи (None - хранилище их не знает)
+StemLookup = Callable[[Dict[str, Any]], Optional[FrozenSet[str]]]
+
+# Поля, по которым ищет Contains по умолчанию (как search_vac)
+TEXT_FIELDS = ("name", "requirement")
+
+OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+SQL_OPERATORS = {"==": "=", "!=": "!=", "<": "<", "<=": "<=", ">": ">", ">=": ">="}
+
+
+class Filter:
+    """
+    Декларативный критерий отбора вакансий.
+    Объект вызывается как обычная функция-критерий (сравнение выполняет
+    скомпилированный один раз предикат), поэтому его можно передать
+    в любой get_vacancies. Хранилища дополнительно разбирают дерево критерия
+    и берут кандидатов из индексов (ID, зарплат, слов) или из SQL-запроса;
+    кандидаты всегда проверяются точным предикатом.
+    Критерии комбинируются операторами & (И), | (ИЛИ) и ~ (НЕ).
+    """
+
+    # Последний скомпилированный предикат и источник основ, для которого он построен
+    _compiled: Optional[Tuple[Optional[StemLookup], Predicate]] = None
+    # Кандидаты из индекса и строки SQL-условия совпадают с результатом точно,
+    # и хранилище может не проверять их предикатом
+    exact = False
+
+    def __call__(self, vacancy: Dict[str, Any]) -> bool:
+        return self.compile()(vacancy)
+
+    def __and__(self, other: 'Filter') -> 'Filter':
+        return And(self, other)
+
+    def __or__(self, other: 'Filter') -> 'Filter':
+        return Or(self, other)
+
+    def __invert__(self) -> 'Filter':
+        return Not(self)
+
+    def compile(self, stems_of: Optional[StemLookup] = None) -> Predicate:
+        """
+        Возвращает предикат для полного просмотра (строится один раз
+        для каждого источника основ).
+
+        Args:
+            stems_of (Optional[StemLookup]): Основы слов вакансии, сохранённые
+                хранилищем при записи; без них WordForms разбирает текст вакансии сам
+
+        Returns:
+            Predicate: Функция вакансия -> bool
+        """
+        compiled = self._compiled
+        if compiled is None or compiled[0] is not stems_of:
+            compiled = self._compiled = (stems_of, self._build(stems_of))
+        return compiled[1]
+
+    def candidates(self, keyword_index: Optional[KeywordIndex],
+                   salary_index: Optional[SalaryIndex]) -> Optional[Set[str]]:
+        """
+        Возвращает ID вакансий-кандидатов по индексам.
+        Результат может содержать лишние ID (их отсеет предикат), но не может
+        пропустить подходящую вакансию.
+
+        Args:
+            keyword_index (Optional[KeywordIndex]): Индекс слов хранилища
+            salary_index (Optional[SalaryIndex]): Индекс зарплат хранилища
+
+        Returns:
+            Optional[Set[str]]: Множество ID или None, если индексы не помогают
+        """
+        return None
+
+    def to_sql(self, has_fts: bool = False) -> Optional[Tuple[str, List[Any]]]:
+        """
+        Переводит критерий в условие WHERE для таблицы vacancies.
+        Условие может пропускать лишние строки (их отсеет предикат), но не может
+        отбросить подходящую вакансию.
+
+        Args:
+            has_fts (bool): Доступны ли таблицы FTS5 (vacancies_fts и vacancies_stems_fts)
+
+        Returns:
+            Optional[Tuple[str, List[Any]]]: Условие и параметры или None
+        """
+        return None
+
+    def _build(self, stems_of: Optional[StemLookup]) -> Predicate:
+        raise NotImplementedError
+
+
+class Field:
+    """
+    Поле вакансии для построения сравнений: field("salary") >= 100000.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __eq__(self, value: Any) -> 'Compare':  # type: ignore[override]
+        return Compare(self.name, "==", value)
+
+    def __ne__(self, value: Any) -> 'Compare':  # type: ignore[override]
+        return Compare(self.name, "!=", value)
+
+    def __lt__(self, value: Any) -> 'Compare':
+        return Compare(self.name, "<", value)
+
+    def __le__(self, value: Any) -> 'Compare':
+        return Compare(self.name, "<=", value)
+
+    def __gt__(self, value: Any) -> 'Compare':
+        return Compare(self.name, ">", value)
+
+    def __ge__(self, value: Any) -> 'Compare':
+        return Compare(self.name, ">=", value)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def is_in(self, values: Iterable[Any]) -> 'Filter':
+        """
+        Значение поля входит в набор (для id отвечает индекс ID).
+
+        Args:
+            values (Iterable[Any]): Допустимые значения
+
+        Returns:
+            Filter: Критерий
+        """
+        if self.name == "id":
+            return IdIn(values)
+        return Or(*(Compare(self.name, "==", value) for value in values))
+
+    def contains(self, keyword: str) -> 'Contains':
+        """
+        Поле содержит строку (без учёта регистра).
+
+        Args:
+            keyword (str): Искомая строка
+
+        Returns:
+            Contains: Критерий
+        """
+        return Contains(keyword, fields=(self.name,))
+
+
+def field(name: str) -> Field:
+    """
+    Возвращает поле вакансии для построения сравнений.
+
+    Args:
+        name (str): Имя поля
+
+    Returns:
+        Field: Поле
+    """
+    return Field(name)
+
+
+class Compare(Filter):
+    """
+    Сравнение поля с константой. Вакансия без значения поля (None)
+    проходит только проверку на неравенство.
+    """
+
+    def __init__(self, name: str, op: str, value: Any):
+        if op not in OPERATORS:
+            raise ValueError(f"Неизвестный оператор сравнения: {op}")
+        self.name = name
+        self.op = op
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"Compare({self.name!r}, {self.op!r}, {self.value!r})"
+
+    def candidates(self, keyword_index, salary_index):
+        if self.name == "id" and self.op == "==":
+            return {self.value}
+        if self.name != "salary" or salary_index is None or not isinstance(self.value, (int, float)):
+            return None
+        # Индекс считает неуказанную зарплату нулевой, границы берутся с запасом
+        if self.op in (">", ">="):
+            return set(salary_index.at_least(self.value))
+        if self.op in ("<", "<="):
+            return set(salary_index.between(float("-inf"), self.value))
+        if self.op == "==":
+            return set(salary_index.between(self.value, self.value))
+        return None
+
+    def to_sql(self, has_fts=False):
+        if self.name not in ("id", "name", "url", "salary", "requirement") or self.value is None:
+            return None
+        if self.op == "!=":
+            return f"({self.name} != ? OR {self.name} IS NULL)", [self.value]
+        return f"{self.name} {SQL_OPERATORS[self.op]} ?", [self.value]
+
+    def _build(self, stems_of) -> Predicate:
+        name, value, compare = self.name, self.value, OPERATORS[self.op]
+        if self.op in ("==", "!="):
+            return lambda vacancy: compare(vacancy.get(name), value)
+
+        def predicate(vacancy: Dict[str, Any]) -> bool:
+            current = vacancy.get(name)
+            if current is None:
+                return False
+            try:
+                return compare(current, value)
+            except TypeError:
+                return False
+        return predicate
+
+
+class Contains(Filter):
+    """
+    Строка входит в одно из текстовых полей вакансии (без учёта регистра),
+    по умолчанию - в название или требования, как в search_vac.
+    """
+
+    def __init__(self, keyword: str, fields: Iterable[str] = TEXT_FIELDS):
+        self.keyword = keyword
+        self.fields = tuple(fields)
+
+    def __repr__(self) -> str:
+        return f"Contains({self.keyword!r}, fields={self.fields!r})"
+
+    def candidates(self, keyword_index, salary_index):
+        if keyword_index is None or not set(self.fields) <= set(TEXT_FIELDS):
+            return None
+        return keyword_index.candidates(self.keyword)
+
+    def to_sql(self, has_fts=False):
+        # Триграммный индекс FTS5 ищет подстроки от трёх символов
+        if not has_fts or len(self.keyword) < 3 or not set(self.fields) <= set(TEXT_FIELDS):
+            return None
+        return ("rowid IN (SELECT rowid FROM vacancies_fts WHERE vacancies_fts MATCH ?)",
+                ['"' + self.keyword.replace('"', '""') + '"'])
+
+    def _build(self, stems_of) -> Predicate:
+        needle = self.keyword.lower()
+        if self.fields == TEXT_FIELDS:
+            return lambda vacancy: (needle in (vacancy.get("name") or "").lower()
+                                    or needle in (vacancy.get("requirement") or "").lower())
+        fields = self.fields
+        return lambda vacancy: any(needle in str(vacancy.get(name) or "").lower() for name in fields)
+
+
+class WordForms(Filter):
+    """
+    Все слова запроса встречаются в названии или требованиях в любой форме:
+    слова сравниваются по основам (без учёта регистра, "ё" как "е"),
+    поэтому "менеджера" находит "Менеджер" и "менеджеров". Хранилища берут
+    вакансии из индекса словоформ или из таблицы FTS5 по столбцу основ,
+    а предикат (под Or, Not и при проверке кандидатов) читает основы,
+    сохранённые при записи. Основы вакансии вычисляются при просмотре,
+    только если хранилище их не хранит.
+    """
+
+    exact = True
+
+    def __init__(self, keyword: str):
+        self.keyword = keyword
+        self.stems = frozenset(normalize(keyword))
+
+    def __repr__(self) -> str:
+        return f"WordForms({self.keyword!r})"
+
+    def to_sql(self, has_fts=False):
+        if not self.stems:
+            return None
+        stems = sorted(self.stems)
+        if has_fts:
+            return ("rowid IN (SELECT rowid FROM vacancies_stems_fts WHERE vacancies_stems_fts MATCH ?)",
+                    [" ".join('"' + token.replace('"', '""') + '"' for token in stems)])
+        # Без FTS5 - просмотр столбца stems без индекса (LIKE с ведущим % индекс не использует),
+        # зато без повторного разбора текстов вакансий
+        return (" AND ".join("(' ' || stems || ' ') LIKE ? ESCAPE '\\'" for _ in stems),
+                ["% " + token.replace("_", "\\_") + " %" for token in stems])
+
+    def _build(self, stems_of) -> Predicate:
+        stems = self.stems
+        if stems_of is None:
+            return lambda vacancy: stems <= vacancy_stems(vacancy)
+
+        def predicate(vacancy: Dict[str, Any]) -> bool:
+            stored = stems_of(vacancy)
+            return stems <= (stored if stored is not None else vacancy_stems(vacancy))
+        return predicate
+
+
+class SalaryRange(Filter):
+    """
+    Зарплата в диапазоне [lo, hi]; неуказанная зарплата считается нулевой,
+    как в salary_between.
+    """
+
+    def __init__(self, lo: float = float("-inf"), hi: float = float("inf")):
+        self.lo = lo
+        self.hi = hi
+
+    def __repr__(self) -> str:
+        return f"SalaryRange({self.lo!r}, {self.hi!r})"
+
+    def candidates(self, keyword_index, salary_index):
+        if salary_index is None:
+            return None
+        return set(salary_index.between(self.lo, self.hi))
+
+    def to_sql(self, has_fts=False):
+        clause, params = [], []
+        if self.lo != float("-inf"):
+            clause.append("salary >= ?")
+            params.append(self.lo)
+        if self.hi != float("inf"):
+            clause.append("salary <= ?")
+            params.append(self.hi)
+        if not clause:
+            return None
+        sql = " AND ".join(clause)
+        if self.lo <= 0 <= self.hi:
+            sql = f"({sql} OR salary IS NULL)"
+        return sql, params
+
+    def _build(self, stems_of) -> Predicate:
+        lo, hi, salary_of = self.lo, self.hi, SalaryIndex.salary_of
+        return lambda vacancy: lo <= salary_of(vacancy) <= hi
+
+
+class IdIn(Filter):
+    """
+    ID вакансии входит в набор (отвечает индекс ID хранилища).
+    """
+
+    def __init__(self, ids: Iterable[str]):
+        self.ids = frozenset(ids)
+
+    def __repr__(self) -> str:
+        return f"IdIn({sorted(self.ids)!r})"
+
+    def candidates(self, keyword_index, salary_index):
+        return set(self.ids)
+
+    def to_sql(self, has_fts=False):
+        if not self.ids:
+            return "0", []
+        # Число параметров запроса в SQLite ограничено
+        if len(self.ids) > 500:
+            return None
+        return f"id IN ({', '.join('?' * len(self.ids))})", sorted(self.ids)
+
+    def _build(self, stems_of) -> Predicate:
+        ids = self.ids
+        return lambda vacancy: vacancy.get("id") in ids
+
+
+class And(Filter):
+    """
+    Все критерии выполняются.
+    """
+
+    def __init__(self, *parts: Filter):
+        self.parts = parts
+
+    def __repr__(self) -> str:
+        return f"And{self.parts!r}"
+
+    def candidates(self, keyword_index, salary_index):
+        result = None
+        for part in self.parts:
+            ids = part.candidates(keyword_index, salary_index)
+            if ids is None:
+                continue
+            result = ids if result is None else result & ids
+            if not result:
+                break
+        return result
+
+    def to_sql(self, has_fts=False):
+        clauses = [part.to_sql(has_fts) for part in self.parts]
+        clauses = [clause for clause in clauses if clause is not None]
+        if not clauses:
+            return None
+        return (" AND ".join(f"({sql})" for sql, _ in clauses),
+                [param for _, params in clauses for param in params])
+
+    def _build(self, stems_of) -> Predicate:
+        predicates = [part.compile(stems_of) for part in self.parts]
+        if not predicates:
+            return lambda vacancy: True
+        predicate = predicates[0]
+        for other in predicates[1:]:
+            predicate = _both(predicate, other)
+        return predicate
+
+
+class Or(Filter):
+    """
+    Выполняется хотя бы один критерий.
+    """
+
+    def __init__(self, *parts: Filter):
+        self.parts = parts
+
+    def __repr__(self) -> str:
+        return f"Or{self.parts!r}"
+
+    def candidates(self, keyword_index, salary_index):
+        result: Set[str] = set()
+        for part in self.parts:
+            ids = part.candidates(keyword_index, salary_index)
+            if ids is None:
+                return None
+            result |= ids
+        return result
+
+    def to_sql(self, has_fts=False):
+        clauses = [part.to_sql(has_fts) for part in self.parts]
+        if not clauses:
+            return "0", []
+        if any(clause is None for clause in clauses):
+            return None
+        return (" OR ".join(f"({sql})" for sql, _ in clauses),
+                [param for _, params in clauses for param in params])
+
+    def _build(self, stems_of) -> Predicate:
+        predicates = [part.compile(stems_of) for part in self.parts]
+        if not predicates:
+            return lambda vacancy: False
+        predicate = predicates[0]
+        for other in predicates[1:]:
+            predicate = _either(predicate, other)
+        return predicate
+
+
+class Not(Filter):
+    """
+    Критерий не выполняется. Индексы дают надмножество, поэтому
+    отрицание всегда проверяется полным просмотром.
+    """
+
+    def __init__(self, part: Filter):
+        self.part = part
+
+    def __repr__(self) -> str:
+        return f"Not({self.part!r})"
+
+    def _build(self, stems_of) -> Predicate:
+        predicate = self.part.compile(stems_of)
+        return lambda vacancy: not predicate(vacancy)
+
+
+def _both(first: Predicate, second: Predicate) -> Predicate:
+    return lambda vacancy: first(vacancy) and second(vacancy)
+
+
+def _either(first: Predicate, second: Predicate) -> Predicate:
+    return lambda vacancy: first(vacancy) or second(vacancy)